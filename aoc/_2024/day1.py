@@ -1,16 +1,27 @@
-from aoc.helpers import get_input_text
+from typing import NamedTuple
 
+from aoc.helpers import get_input_bytes
 
-def part1() -> None:
-    text = get_input_text(1)
-    # convert text to the right data structure
+
+class LocationLists(NamedTuple):
+    left_list: list[int]
+    right_list: list[int]
+
+
+def load(test_input: bool = False) -> LocationLists:
+    # convert each line to the right data structure, without decoding the file
     left_list: list[int] = []
     right_list: list[int] = []
 
-    for line in text.splitlines():
-        left_number_str, right_number_str = line.split()
+    for line in get_input_bytes(1, test_input=test_input):
+        left_number_str, right_number_str = line.tobytes().split()
         left_list.append(int(left_number_str))
         right_list.append(int(right_number_str))
+    return LocationLists(left_list, right_list)
+
+
+def part1(lists: LocationLists) -> int:
+    left_list, right_list = lists
 
     # now let's sort the lists
     left_list.sort()
@@ -25,19 +36,11 @@ def part1() -> None:
         distance = abs(left_number - right_number)
         total_distance += distance
 
-    print("Total distance is", total_distance)
+    return total_distance
 
 
-def part2() -> None:
-    text = get_input_text(1, test_input=True)
-    # convert text to the right data structure
-    left_list: list[int] = []
-    right_list: list[int] = []
-
-    for line in text.splitlines():
-        left_number_str, right_number_str = line.split()
-        left_list.append(int(left_number_str))
-        right_list.append(int(right_number_str))
+def part2(lists: LocationLists) -> int:
+    left_list, right_list = lists
 
     # we should now the answer to the question:
     # "how many times does x number appear in right_list"?
@@ -56,9 +59,9 @@ def part2() -> None:
         frequency: int = number_frequency_dict.get(n, 0)
         similarity_score += n * frequency
 
-    print("Similarity score is", similarity_score)
+    return similarity_score
 
 
 if __name__ == "__main__":
-    part1()
-    part2()
+    print("Total distance is", part1(load()))
+    print("Similarity score is", part2(load()))
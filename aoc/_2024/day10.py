@@ -2,18 +2,19 @@
 
 from itertools import starmap
 
-from rich import print
-
 from aoc.helpers import get_input_as_grid
 
 DAY_NUM = 10
 
 
-def part1(test_input: bool = False) -> None:
-    grid: list[list[int]] = [
+def load(test_input: bool = False) -> list[list[int]]:
+    return [
         [int(c) for c in line]
         for line in get_input_as_grid(DAY_NUM, test_input=test_input)
     ]
+
+
+def part1(grid: list[list[int]]) -> int:
     trailhead_scores: dict[tuple[int, int], int] = {}
     peak_coords: list[tuple[int, int]] = []
     for i in range(len(grid)):
@@ -56,16 +57,10 @@ def part1(test_input: bool = False) -> None:
         for trailhead in trailheads:
             trailhead_scores[trailhead] += 1
 
-    result = sum(trailhead_scores.values())
-    print(f"Sum of trailhead scores: {result}")
-
+    return sum(trailhead_scores.values())
 
-def part2(test_input: bool = False) -> None:
-    grid: list[list[int]] = [
-        [int(c) for c in line]
-        for line in get_input_as_grid(DAY_NUM, test_input=test_input)
-    ]
 
+def part2(grid: list[list[int]]) -> int:
     def compute_coord_rating(i: int, j: int) -> int:
         val = grid[i][j]
         if val == 9:
@@ -99,8 +94,8 @@ def part2(test_input: bool = False) -> None:
             for j in range(len(grid[i]))
         ]
     )
-    print(f"Sum of ratings {ratings_sum}")
+    return ratings_sum
 
 
 if __name__ == "__main__":
-    part2(test_input=False)
+    print(f"Sum of ratings {part2(load())}")
@@ -2,9 +2,8 @@
 
 from __future__ import annotations
 
-from rich import print
-
 from aoc.helpers import get_input_text
+from aoc.helpers.console import print
 
 DAY_NUM = 11
 
@@ -38,21 +37,24 @@ class Stone:
         ]
 
 
-def part1(test_input: bool = False) -> None:
-    text = get_input_text(DAY_NUM, test_input=test_input).strip()
-    stones = [Stone(int(num_str)) for num_str in text.split()]
+def load(test_input: bool = False) -> list[int]:
+    return list(map(int, get_input_text(DAY_NUM, test_input=test_input).split()))
+
+
+def part1(stone_nums: list[int], debug: bool = False) -> int:
+    stones = [Stone(n) for n in stone_nums]
     for _ in range(25):
-        if _ <= 6 and test_input:
+        if _ <= 6 and debug:
             print(_, stones)
         new_stones: list[Stone] = []
         for stone in stones:
             result_stones = stone.blink()
             new_stones.extend(result_stones)
         stones = new_stones
-        print(f"There are {len(stones)} stones after {_ + 1} iterations.")
+    return len(stones)
 
 
-def part2(test_input: bool = False) -> None:
+def part2(stone_nums: list[int]) -> int:
     cache: dict[tuple[int, int], int] = {}
     MAX_ITERATION = 75
 
@@ -79,15 +81,13 @@ def part2(test_input: bool = False) -> None:
             cache[(n, iterations_left)] = result
         return cache[(n, iterations_left)]
 
-    text = get_input_text(DAY_NUM, test_input=test_input).strip()
-    stone_nums = list(map(int, text.split()))
     total: int = 0
     for stone_num in stone_nums:
         result = get_stone_count_for_n(n=stone_num)
         total += result
-    print(f"There are {total} stones after {MAX_ITERATION} iterations")
+    return total
 
 
 if __name__ == "__main__":
-    # part1(test_input=True)
-    part2(test_input=False)
+    # part1(load(test_input=True), debug=True)
+    print(f"There are {part2(load())} stones after 75 iterations")
@@ -2,47 +2,54 @@
 
 from __future__ import annotations
 
-from rich import print
+from aoc.helpers import Cell, Grid, cached_parse
 
-from aoc.helpers import Cell, Grid
 
+@cached_parse(12, version=3)
+def load(test_input: bool = False) -> Grid[str]:
+    return Grid.for_day(12, test_input=test_input, storage="bytes")
 
-def get_perimeter_at_cell_i_j[T](grid: Grid[T], i: int, j: int) -> int:
-    neighbor_values = [cell.value for cell in grid.get_nondiagonal_neighbors((i, j))]
-    return 4 - neighbor_values.count(grid[i][j])
 
+def get_perimeters[T](grid: Grid[T]) -> list[list[int]]:
+    """Per cell, how many of its sides face another region or the edge."""
+    return (4 - grid.same_neighbor_counts()).tolist()
 
-def part1(grid: Grid[str]) -> None:
+
+def part1(grid: Grid[str]) -> int:
     seen: list[list[bool]] = [[False] * len(grid) for _ in range(len(grid))]
+    perimeters = get_perimeters(grid)
 
     def find_region_perimeter_and_area(
         cell: Cell[str], region_name: str
     ) -> tuple[int, int]:
-        if grid[cell.i][cell.j] != region_name:
+        if grid[cell.i, cell.j] != region_name:
             return 0, 0
-        perimeter = get_perimeter_at_cell_i_j(grid, cell.i, cell.j)
+        perimeter = perimeters[cell.i][cell.j]
         area = 1
         seen[cell.i][cell.j] = True
         for diag in grid.get_nondiagonal_neighbors((cell.i, cell.j)):
             if diag.value == region_name and not seen[diag.i][diag.j]:
                 cell_area, cell_perimeter = find_region_perimeter_and_area(
-                    cell, region_name
+                    diag, region_name
                 )
                 area += cell_area
                 perimeter += cell_perimeter
         return area, perimeter
 
     total_price: int = 0
-    for cell in grid.traverse():
-        if not seen[cell.i][cell.j]:
-            area, perimeter = find_region_perimeter_and_area(cell, cell.value)
-            price = area * perimeter
-            print(f"{cell.value!r}: {area} * {perimeter} = {price}")
-            total_price += price
-    print(f"Total price of fence for garden: {total_price}")
+    for region_name, cell_ids in grid.group_positions_by_value().items():
+        for cell_id in cell_ids:
+            i, j = grid.coords_of(cell_id)
+            if not seen[i][j]:
+                area, perimeter = find_region_perimeter_and_area(
+                    Cell(i, j, region_name), region_name
+                )
+                price = area * perimeter
+                total_price += price
+    return total_price
 
 
-def part2(grid: Grid[str]) -> None:
+def part2(grid: Grid[str]) -> int:
     """
     ok... so...
     we need to keep track of the number of "sides" per "region" in the grid
@@ -56,7 +63,10 @@ def part2(grid: Grid[str]) -> None:
 
     gonna copy _some_ of part1 🫢
     """
-    num_sides_cache = Grid[int | None].full_of(fill=None, size=len(grid))
+    perimeters = get_perimeters(grid)
+    num_sides_cache = Grid[int | None].full_of(
+        fill=None, size=grid.size, storage="flat"
+    )
 
     def cell_at_i_j_is_bridge(grid: Grid[str], i: int, j: int) -> bool:
         # cell at position grid[i][j] is a bridge (| |) if:
@@ -66,7 +76,7 @@ def part2(grid: Grid[str]) -> None:
         #   * the top and bottom neighbors are sides.
 
         def is_side(item: Cell[str] | None) -> bool:
-            return item is None or item.value != grid[i][j]
+            return item is None or item.value != grid[i, j]
 
         left = grid.at((i - 1, j))
         right = grid.at((i + 1, j))
@@ -78,7 +88,7 @@ def part2(grid: Grid[str]) -> None:
         )
 
     def get_outer_corner_count_at_cell_i_j(grid: Grid[str], i: int, j: int) -> int:
-        perimeter = get_perimeter_at_cell_i_j(grid, i, j)
+        perimeter = perimeters[i][j]
         if perimeter == 4:
             return 4
         if perimeter == 3:
@@ -103,14 +113,14 @@ def part2(grid: Grid[str]) -> None:
         # that is also next to those two neighbors is of a different region.
         inner_corner_count = 0
         for diagonal in grid.get_diagonals((i, j)):
-            if diagonal.value != grid[i][j]:
+            if diagonal.value != grid[i, j]:
                 neighbor_edge_1 = grid.at((diagonal.i, j))
                 neighbor_edge_2 = grid.at((i, diagonal.j))
                 if (
                     neighbor_edge_1 is not None
                     and neighbor_edge_2 is not None
-                    and neighbor_edge_1.value == grid[i][j]
-                    and neighbor_edge_2.value == grid[i][j]
+                    and neighbor_edge_1.value == grid[i, j]
+                    and neighbor_edge_2.value == grid[i, j]
                 ):
                     inner_corner_count += 1
         return inner_corner_count
@@ -118,18 +128,18 @@ def part2(grid: Grid[str]) -> None:
     def find_region_number_of_sides_and_area(
         i: int, j: int, region_name: str
     ) -> tuple[int, int]:
-        if grid[i][j] != region_name:
+        if grid[i, j] != region_name:
             return 0, 0
         outer_corner_count = get_outer_corner_count_at_cell_i_j(grid, i, j)
         inner_corner_count = get_inner_corner_count_at_cell_i_j(grid, i, j)
         number_of_sides = outer_corner_count + inner_corner_count
-        num_sides_cache[i][j] = number_of_sides
+        num_sides_cache[i, j] = number_of_sides
         # print_grid_with_accent_at_i_j(num_sides_cache, i, j)
         # print_grid_with_accent_at_i_j(grid, i, j)
         # breakpoint()
         area = 1
         for cell in grid.get_nondiagonal_neighbors((i, j)):
-            if cell.value == region_name and num_sides_cache[cell.i][cell.j] is None:
+            if cell.value == region_name and num_sides_cache[cell.i, cell.j] is None:
                 cell_area, cell_num_sides = find_region_number_of_sides_and_area(
                     cell.i, cell.j, region_name
                 )
@@ -138,20 +148,22 @@ def part2(grid: Grid[str]) -> None:
         return area, number_of_sides
 
     total_price: int = 0
-    for i, j, region in grid.traverse():
-        if num_sides_cache[i][j] is None:
-            area, num_sides = find_region_number_of_sides_and_area(i, j, region)
-            price = area * num_sides
-            # print(f"{region!r}: {area=} * {num_sides=} = {price}")
-            # print_grid_with_accent_for_item(grid, region)
-            # print(num_sides_cache)
-            # breakpoint()
-            total_price += price
-    print(f"Total price of fence for garden: {total_price}")
+    for region, cell_ids in grid.group_positions_by_value().items():
+        for cell_id in cell_ids:
+            if num_sides_cache.value_at_id(cell_id) is None:
+                i, j = grid.coords_of(cell_id)
+                area, num_sides = find_region_number_of_sides_and_area(i, j, region)
+                price = area * num_sides
+                # print(f"{region!r}: {area=} * {num_sides=} = {price}")
+                # print_grid_with_accent_for_item(grid, region)
+                # print(num_sides_cache)
+                # breakpoint()
+                total_price += price
+    return total_price
 
 
 if __name__ == "__main__":
-    grid = Grid.for_day(12)
-    test_grid = Grid.for_day(12, test_input=True)
-    part1(grid)
-    part2(grid)
+    grid = load()
+    test_grid = load(test_input=True)
+    print(f"Total price of fence for garden: {part1(grid)}")
+    print(f"Total price of fence for garden: {part2(grid)}")
@@ -3,7 +3,7 @@
 import re
 from typing import NamedTuple, Self
 
-from aoc.helpers import get_input_text
+from aoc.helpers import cached_parse, iter_input_blocks
 
 
 class Machine(NamedTuple):
@@ -38,6 +38,11 @@ Prize: X=(?P<prize_x>\d+), Y=(?P<prize_y>\d+)
         return cls(**match_dict)
 
 
+@cached_parse(13)
+def load(test_input: bool = False) -> list[Machine]:
+    return list(map(Machine.from_text, iter_input_blocks(13, test_input=test_input)))
+
+
 def solve_machine(machine: Machine) -> int | None:
     """Solve for the number of A presses and B presses needed to win the
     prize on this claw machine.
@@ -81,6 +86,6 @@ def part2(machines: list[Machine]) -> int:
 
 
 if __name__ == "__main__":
-    machines = list(map(Machine.from_text, get_input_text(13).split("\n\n")))
+    machines = load()
     print("Part 1", part1(machines))
     print("Part 2", part2(machines))
@@ -5,9 +5,7 @@ from functools import reduce
 from operator import mul
 from typing import NamedTuple, Self
 
-from rich import print
-
-from aoc.helpers import get_input_text
+from aoc.helpers import Answer, SparseGrid, cached_parse, iter_input_lines
 
 
 class RobotData(NamedTuple):
@@ -30,8 +28,11 @@ class RobotData(NamedTuple):
 
     @classmethod
     def load_all_robots_from_puzzle_input(cls, test_input: bool = False) -> list[Self]:
-        lines = get_input_text(14, test_input=test_input).splitlines()
-        return list(map(cls.from_text, lines))
+        return [
+            cls.from_text(line)
+            for line in iter_input_lines(14, test_input=test_input)
+            if not line.startswith("size=")
+        ]
 
 
 class Day14Data(NamedTuple):
@@ -40,20 +41,39 @@ class Day14Data(NamedTuple):
     robots: list[RobotData]
 
     @classmethod
-    def load_test_input(cls) -> Day14Data:
+    def load(cls, test_input: bool = False) -> Day14Data:
+        lines = list(iter_input_lines(14, test_input=test_input))
+        # generated inputs (see `aoc.generators`) start with a `size=x,y` line;
+        # the real input and the example leave it implicit
+        header = re.fullmatch(r"size=(\d+),(\d+)", lines[0]) if lines else None
+        if header is not None:
+            grid_x_size, grid_y_size = map(int, header.groups())
+            lines = lines[1:]
+        elif test_input:
+            grid_x_size, grid_y_size = 11, 7
+        else:
+            grid_x_size, grid_y_size = 101, 103
         return cls(
-            grid_x_size=11,
-            grid_y_size=7,
-            robots=RobotData.load_all_robots_from_puzzle_input(test_input=True),
+            grid_x_size=grid_x_size,
+            grid_y_size=grid_y_size,
+            robots=list(map(RobotData.from_text, lines)),
         )
 
-    @classmethod
-    def load(cls) -> Day14Data:
-        return cls(
-            grid_x_size=101,
-            grid_y_size=103,
-            robots=RobotData.load_all_robots_from_puzzle_input(),
-        )
+
+class QuadrantCounts(NamedTuple):
+    top_left: int
+    top_right: int
+    bottom_left: int
+    bottom_right: int
+
+    @property
+    def safety_factor(self) -> int:
+        return reduce(mul, self, 1)
+
+
+@cached_parse(14, version=3)
+def load(test_input: bool = False) -> Day14Data:
+    return Day14Data.load(test_input=test_input)
 
 
 def solve(
@@ -61,8 +81,12 @@ def solve(
     num_iterations: int,
     grid_x_size: int,
     grid_y_size: int,
-    part_1: bool = False,
-) -> bool:
+) -> tuple[QuadrantCounts, bool]:
+    """Simulate the robots for `num_iterations` seconds.
+
+    Returns the number of robots in each quadrant, and whether every robot
+    ended up on a different tile.
+    """
     # top_left would be anything within the
     # subgrid at units
     # (0, 0) ---------------------------------------- (0, (grid_y_size / 2) - 1)
@@ -114,7 +138,9 @@ def solve(
     # we could also express this as:
     #     "any cell where x is >= grid_x_size / 2 + 1 and y >= grid_y_size / 2 + 1"
     bottom_right = 0
-    result_grid = [[0 for _ in range(grid_y_size)] for _ in range(grid_x_size)]
+    all_robots_apart = True
+    # only the tiles robots stand on are stored, not the whole floor
+    result_grid = SparseGrid[bool](background=False, size=(grid_x_size, grid_y_size))
     for p, v in robots:
         # simulate where it ends up after 100 seconds.
         x, y = p
@@ -125,7 +151,10 @@ def solve(
             x = grid_x_size - x
         if y < 0:
             y = grid_y_size - y
-        result_grid[x][y] += 1
+        if (x, y) in result_grid:
+            all_robots_apart = False
+        else:
+            result_grid[x, y] = True
         assert 0 <= x <= grid_x_size - 1, ValueError(str(x))
         assert 0 <= y <= grid_y_size - 1
         # check in which quadrant its final coordinates are in.
@@ -144,46 +173,39 @@ def solve(
                 bottom_left += 1
             else:
                 bottom_right += 1
-    safety_factor = reduce(mul, [top_left, top_right, bottom_left, bottom_right], 1)
-    if part_1:
-        print(
-            f"{safety_factor=} {top_left=} {top_right=} {bottom_left=} {bottom_right=}"
-        )
-        return True
-    else:
-        for i in range(len(result_grid)):
-            for j in range(len(result_grid[i])):
-                if result_grid[i][j] > 1:
-                    return False
-        # result_grid_display = "\n".join(
-        #     [
-        #         "".join(
-        #             [
-        #                 "⬜️" if result_grid[x][y] == 0 else "⬛️"
-        #                 for y in range(len(result_grid[x]))
-        #             ]
-        #         )
-        #         for x in range(len(result_grid))
-        #     ]
-        # )
-        # print(result_grid_display)
-        return True
-
-
-def part1(grid_x_size: int, grid_y_size: int, robots: list[RobotData]) -> None:
-    solve(robots, 100, grid_x_size, grid_y_size, part_1=True)
-
-
-def part2(grid_x_size: int, grid_y_size: int, robots: list[RobotData]) -> None:
+    # result_grid_display = "\n".join(
+    #     [
+    #         "".join(
+    #             [
+    #                 "⬜️" if result_grid[x][y] == 0 else "⬛️"
+    #                 for y in range(len(result_grid[x]))
+    #             ]
+    #         )
+    #         for x in range(len(result_grid))
+    #     ]
+    # )
+    # print(result_grid_display)
+    quadrants = QuadrantCounts(top_left, top_right, bottom_left, bottom_right)
+    return quadrants, all_robots_apart
+
+
+def part1(data: Day14Data) -> Answer[int]:
+    grid_x_size, grid_y_size, robots = data
+    quadrants, _ = solve(robots, 100, grid_x_size, grid_y_size)
+    return Answer(quadrants.safety_factor, diagnostics=quadrants._asdict())
+
+
+def part2(data: Day14Data) -> int | None:
+    grid_x_size, grid_y_size, robots = data
     for i in range(grid_x_size * grid_y_size):
-        if solve(robots, i, grid_x_size, grid_y_size):
-            print("Seconds it takes for easter egg to appear", i)
-            return
-
-    print("No easter egg found")
+        _, all_robots_apart = solve(robots, i, grid_x_size, grid_y_size)
+        if all_robots_apart:
+            return i
+    # No easter egg found
+    return None
 
 
 if __name__ == "__main__":
-    data = Day14Data.load()
-    part1(*data)
-    part2(*data)
+    data = load()
+    print(part1(data))
+    print("Seconds it takes for easter egg to appear", part2(data))
@@ -4,6 +4,7 @@ from typing import Literal
 
 # from rich import print
 from aoc.helpers import Cell, Grid, get_input_text
+from aoc.helpers.animation import GridAnimation
 
 Direction = Literal[">", "<", "v", "^"]
 
@@ -18,10 +19,8 @@ class LanternfishWarehouseRobotMap:
         self.warehouse_map_text = warehouse_map_text.strip()
         self.robot_directions = list(robot_directions.strip().replace("\n", ""))
 
-    def solve_part_1(self):
-        warehouse_map = Grid(
-            [list(line) for line in self.warehouse_map_text.splitlines()]
-        )
+    def solve_part_1(self) -> int:
+        warehouse_map = Grid.from_string(self.warehouse_map_text, storage="bytes")
         robot = warehouse_map.first("@")
         if robot is None:
             raise ValueError(f"Could not find robot in {warehouse_map}")
@@ -47,13 +46,13 @@ class LanternfishWarehouseRobotMap:
                 boxes_next_to_robot = True
             if cell.value != "#":
                 assert cell.value == ".", ValueError(cell.value)
-                warehouse_map[robot.i][robot.j] = "."
+                warehouse_map[robot.i, robot.j] = "."
                 robot = warehouse_map.at(
                     (robot.i + delta_i, robot.j + delta_j), strict=True
                 )
-                warehouse_map[robot.i][robot.j] = "@"
+                warehouse_map[robot.i, robot.j] = "@"
                 if boxes_next_to_robot:
-                    warehouse_map[cell.i][cell.j] = "O"
+                    warehouse_map[cell.i, cell.j] = "O"
             # print grid to make sure everything looks right
             # print(
             #     f"Move {direction}:\n{warehouse_map}\nNext move: {self.robot_directions[direction_i + 1] if direction_i < len(self.robot_directions) - 1 else "None"}"
@@ -62,17 +61,14 @@ class LanternfishWarehouseRobotMap:
         # print("")
         # after all moves, calculate sum of boxes's GPS value
         gps_sum = 0
-        for cell in warehouse_map.traverse():
-            if cell.value == "O":
-                gps_value = 100 * cell.i + cell.j
-                # print(
-                #     f"Box({cell.i}, {cell.j}) GPS: 100 * {cell.i} + {cell.j} = {gps_value}"
-                # )
-                gps_sum += gps_value
+        for cell_id in warehouse_map.positions_where("O"):
+            i, j = warehouse_map.coords_of(cell_id)
+            gps_value = 100 * i + j
+            # print(f"Box({i}, {j}) GPS: 100 * {i} + {j} = {gps_value}")
+            gps_sum += gps_value
+        return gps_sum
 
-        print(f"sum of all boxes' GPS coordinates after robot moves: {gps_sum}")
-
-    def solve_part_2(self):
+    def solve_part_2(self) -> int:
         widened_warehouse_map_text = ""
         for line in self.warehouse_map_text.splitlines():
             for char in line:
@@ -88,9 +84,7 @@ class LanternfishWarehouseRobotMap:
                     raise ValueError(f"Unknown character in input text: {char!r}")
             widened_warehouse_map_text += "\n"
         # [[char for char in line] for line in self.warehouse_map_text.splitlines()]
-        warehouse_map = Grid(
-            [list(line) for line in widened_warehouse_map_text.splitlines()]
-        )
+        warehouse_map = Grid.from_string(widened_warehouse_map_text, storage="bytes")
 
         def get_cell_box_pair(cell: Cell) -> tuple[Cell, Cell]:
             if cell.value == "[":
@@ -115,13 +109,16 @@ class LanternfishWarehouseRobotMap:
         robot = warehouse_map.first("@")
         if robot is None:
             raise ValueError(f"Could not find robot in {warehouse_map}")
-        if self.debug:
-            print(warehouse_map)
+        # redraws only the cells each move changes, not the whole warehouse
+        animation = GridAnimation() if self.debug else None
+        if animation is not None:
+            animation.draw(warehouse_map)
         for direction_i in range(len(self.robot_directions)):
             direction = self.robot_directions[direction_i]
             assert direction in (">", "<", "v", "^")
             delta_i = (direction == "v") - (direction == "^")
             delta_j = (direction == ">") - (direction == "<")
+            notes: list[str] = []
             boxes_next_to_robot: list[tuple[Cell, Cell]] = []
             box_cell_positions: set[tuple[int, int]] = set()
             next_spot = warehouse_map.at((robot.i + delta_i, robot.j + delta_j))
@@ -129,8 +126,8 @@ class LanternfishWarehouseRobotMap:
                 breakpoint()
                 raise ValueError
             elif next_spot.value == "#":
-                if self.debug:
-                    print("Cannot move!")
+                if animation is not None:
+                    notes.append("Cannot move!")
             else:
                 neighbors_to_check: list[Cell] = [next_spot]
 
@@ -160,8 +157,9 @@ class LanternfishWarehouseRobotMap:
                     eval_cell_boxiness(neighbor)
 
                 # at this point we should have all boxes in the boxes_next_to_robot.
-                if self.debug:
-                    print(f"{boxes_next_to_robot=}")
+                # notes are only for the animation's caption
+                if animation is not None and boxes_next_to_robot:
+                    notes.append(f"{len(boxes_next_to_robot)} boxes in the way")
 
                 # if any of the boxes are not movable, then we're not movable. continue
                 def box_is_movable(box: tuple[Cell, Cell]) -> bool:
@@ -197,48 +195,67 @@ class LanternfishWarehouseRobotMap:
                         raise ValueError(f"What direction is this {direction!r}")
 
                 if not all(box_is_movable(box) for box in boxes_next_to_robot):
-                    if self.debug:
-                        print("Cannot move!")
+                    if animation is not None:
+                        notes.append("Cannot move!")
                 else:
                     # okay now we move the boxes.
                     for box in boxes_next_to_robot:
                         left_side, right_side = box
-                        warehouse_map[left_side.i][left_side.j] = "."
-                        warehouse_map[right_side.i][right_side.j] = "."
+                        warehouse_map[left_side.i, left_side.j] = "."
+                        warehouse_map[right_side.i, right_side.j] = "."
                     for box in boxes_next_to_robot:
                         left_side, right_side = box
-                        warehouse_map[left_side.i + delta_i][left_side.j + delta_j] = (
+                        warehouse_map[left_side.i + delta_i, left_side.j + delta_j] = (
                             "["
                         )
-                        warehouse_map[right_side.i + delta_i][
-                            right_side.j + delta_j
+                        warehouse_map[
+                            right_side.i + delta_i, right_side.j + delta_j
                         ] = "]"
 
                     # and lastly we move the robot
-                    warehouse_map[robot.i][robot.j] = "."
-                    warehouse_map[robot.i + delta_i][robot.j + delta_j] = "@"
+                    warehouse_map[robot.i, robot.j] = "."
+                    warehouse_map[robot.i + delta_i, robot.j + delta_j] = "@"
                     robot = warehouse_map.at(
                         (robot.i + delta_i, robot.j + delta_j), strict=True
                     )
 
             # print grid to make sure everything looks right
-            if self.debug:
-                print(
-                    f"Move {direction}:\n{warehouse_map}\nNext move: {self.robot_directions[direction_i + 1] if direction_i < len(self.robot_directions) - 1 else 'None'}"
+            if animation is not None:
+                next_move = (
+                    self.robot_directions[direction_i + 1]
+                    if direction_i < len(self.robot_directions) - 1
+                    else "None"
+                )
+                animation.draw(
+                    warehouse_map,
+                    caption="\n".join(
+                        [f"Move {direction}:", *notes, f"Next move: {next_move}"]
+                    ),
                 )
                 # breakpoint()
         # after all moves, calculate sum of boxes's GPS value
         gps_sum = 0
-        for cell in warehouse_map.traverse():
-            if cell.value == "[":
-                gps_value = 100 * cell.i + cell.j
-                # print(
-                #     f"Box({cell.i}, {cell.j}) GPS: 100 * {cell.i} + {cell.j} = {gps_value}"
-                # )
-                gps_sum += gps_value
+        for cell_id in warehouse_map.positions_where("["):
+            i, j = warehouse_map.coords_of(cell_id)
+            gps_value = 100 * i + j
+            # print(f"Box({i}, {j}) GPS: 100 * {i} + {j} = {gps_value}")
+            gps_sum += gps_value
+        return gps_sum
+
+
+def load(test_input: bool = False) -> LanternfishWarehouseRobotMap:
+    return LanternfishWarehouseRobotMap(test_input=test_input)
+
+
+def part1(warehouse: LanternfishWarehouseRobotMap) -> int:
+    return warehouse.solve_part_1()
+
 
-        print(f"sum of all boxes' GPS coordinates after robot moves: {gps_sum}")
+def part2(warehouse: LanternfishWarehouseRobotMap) -> int:
+    return warehouse.solve_part_2()
 
 
-print("------------------------------" * 4)
-LanternfishWarehouseRobotMap().solve_part_2()
+if __name__ == "__main__":
+    print("------------------------------" * 4)
+    gps_sum = part2(load())
+    print(f"sum of all boxes' GPS coordinates after robot moves: {gps_sum}")
@@ -4,9 +4,8 @@ import re
 from functools import cached_property
 from typing import Any, Callable, Literal, NamedTuple, TypeAlias
 
-from rich import print
-
 from aoc.helpers import get_input_text
+from aoc.helpers.console import print
 
 INPUT_PATTERN = r"""
 Register A: (\d+)
@@ -161,12 +160,16 @@ class Day17Interpreter:
         return self.output
 
 
-def part1():
-    output = Day17Interpreter(InputData.load()).run()
-    print(",".join(map(str, output)))
+def load(test_input: bool = False) -> InputData:
+    return InputData.load(test_input=test_input)
+
+
+def part1(data: InputData) -> str:
+    output = Day17Interpreter(data).run()
+    return ",".join(map(str, output))
 
 
-def part2():
+def part2(data: InputData) -> int:
     """
     # I manually converted my puzzle input
     # into the pseudocode below:
@@ -198,7 +201,6 @@ def part2():
     # that suggests that we can finesse the right answer by thinking of this problem in
     # terms of bit representations.... i think....
     """
-    data = InputData.load(test_input=False)
     a = 0
     for i in reversed(range(len(data.instructions))):
         a <<= 3
@@ -214,7 +216,8 @@ def part2():
             != data.instructions[i:]
         ):
             a += 1
-    print(f"Minimal register A start value needed {a}")
+    return a
 
 
-part2()
+if __name__ == "__main__":
+    print(f"Minimal register A start value needed {part2(load())}")
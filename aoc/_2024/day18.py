@@ -1,77 +1,75 @@
 import sys
-from collections import deque
+from typing import NamedTuple
 
-from rich import print
-from tqdm import tqdm
-
-from aoc.helpers import Grid, get_input_text
+from aoc.helpers import BitGrid, get_input_text
 
 sys.setrecursionlimit(5_000)
 
 
+class Day18Data(NamedTuple):
+    coords: list[tuple[int, ...]]
+    grid_size: int
+    max_iteration: int
+
+
+def load(test_input: bool = False) -> Day18Data:
+    lines = get_input_text(18, test_input=test_input).splitlines()
+    # generated inputs (see `aoc.generators`) start with a `size=n` line; the
+    # real input (71) and the example (7) leave it implicit
+    if lines and lines[0].startswith("size="):
+        grid_size = int(lines[0].removeprefix("size="))
+        lines = lines[1:]
+    else:
+        grid_size = 71 if not test_input else 7
+    coords: list[tuple[int, ...]] = [tuple(map(int, line.split(","))) for line in lines]
+    return Day18Data(
+        coords=coords,
+        grid_size=grid_size,
+        max_iteration=1_024 if not test_input else 12,
+    )
+
+
 def find_shortest_path(
-    grid: Grid[str], start: tuple[int, int], end: tuple[int, int]
+    corrupted: BitGrid, start: tuple[int, int], end: tuple[int, int]
 ) -> int | None:
-    queue = deque[tuple[int, int, int]]([(start[0], start[1], 0)])
-    seen = set[tuple[int, int]]()
-    while queue:
-        x, y, distance = queue.popleft()
-        if x == y == len(grid) - 1:
-            return distance
-        for neighbor in grid.get_nondiagonal_neighbors((x, y)):
-            if neighbor.value == "." and neighbor.coords not in seen:
-                seen.add(neighbor.coords)
-                queue.append((neighbor.i, neighbor.j, distance + 1))
-    return None
-    raise ValueError(f"Cannot get from {start} to {end}")
+    # the frontier of every BFS layer is advanced in one go over the packed
+    # free cells, rather than a queue popping one cell at a time
+    return (~corrupted).distance(start, end)
 
 
-def part1(test_input: bool = False) -> None:
-    coords: list[tuple[int, ...]] = [
-        tuple(map(int, line.split(",")))
-        for line in get_input_text(18, test_input=test_input).splitlines()
-    ]
-    grid_size = 71 if not test_input else 7
-    grid = Grid[str].full_of(fill=".", size=grid_size)
-    max_iteration = 1_024 if not test_input else 12
+def part1(data: Day18Data) -> int | None:
+    coords, grid_size, max_iteration = data
+    corrupted = BitGrid(grid_size)
     for i in range(max_iteration):
         x, y = coords[i]
-        grid[y][x] = "#"
-    print(
-        find_shortest_path(
-            grid=grid,
-            start=(0, 0),
-            end=(grid_size - 1, grid_size - 1),
-        )
+        corrupted[y, x] = True
+    return find_shortest_path(
+        corrupted=corrupted,
+        start=(0, 0),
+        end=(grid_size - 1, grid_size - 1),
     )
 
 
-def part2(test_input: bool = False) -> None:
-    coords: list[tuple[int, ...]] = [
-        tuple(map(int, line.split(",")))
-        for line in get_input_text(18, test_input=test_input).splitlines()
-    ]
-    # breakpoint()
-    grid_size = 71 if not test_input else 7
-    grid = Grid[str].full_of(fill=".", size=grid_size)
-    max_iteration = 1_024 if not test_input else 12
+def part2(data: Day18Data) -> str | None:
+    coords, grid_size, max_iteration = data
+    corrupted = BitGrid(grid_size)
     for i in range(max_iteration):
         x, y = coords[i]
-        grid[y][x] = "#"
-    for i in tqdm(list(range(max_iteration + 1, len(coords)))):
+        corrupted[y, x] = True
+    for i in range(max_iteration + 1, len(coords)):
         x, y = coords[i]
-        grid[y][x] = "#"
+        corrupted[y, x] = True
         if (
             find_shortest_path(
-                grid=grid,
+                corrupted=corrupted,
                 start=(0, 0),
                 end=(grid_size - 1, grid_size - 1),
             )
             is None
         ):
-            print(f"Exit becomes inaccessible at {coords[i]}")
-            break
+            return ",".join(map(str, coords[i]))
+    return None
 
 
 if __name__ == "__main__":
-    part2(test_input=False)
+    print(f"Exit becomes inaccessible at {part2(load())}")
@@ -1,8 +1,6 @@
 import functools
 from typing import NamedTuple
 
-from rich import print
-
 from aoc.helpers import get_input_text
 
 
@@ -20,8 +18,12 @@ class Day19InputData(NamedTuple):
         )
 
 
-def part1(test_input: bool = False) -> None:
-    patterns, designs = Day19InputData.load(test_input=test_input)
+def load(test_input: bool = False) -> Day19InputData:
+    return Day19InputData.load(test_input=test_input)
+
+
+def part1(data: Day19InputData) -> int:
+    patterns, designs = data
 
     @functools.cache
     def design_is_possible(design: str) -> bool:
@@ -32,12 +34,11 @@ def part1(test_input: bool = False) -> None:
             for pattern in patterns
         )
 
-    result = sum(map(design_is_possible, designs))
-    print(f"Total possible designs: {result}")
+    return sum(map(design_is_possible, designs))
 
 
-def part2(test_input: bool = False) -> None:
-    patterns, designs = Day19InputData.load(test_input=test_input)
+def part2(data: Day19InputData) -> int:
+    patterns, designs = data
 
     @functools.cache
     def count_ways(design: str) -> int:
@@ -48,9 +49,8 @@ def part2(test_input: bool = False) -> None:
             for pattern in patterns
         )
 
-    result = sum(map(count_ways, designs))
-    print(f"Total possible designs: {result}")
+    return sum(map(count_ways, designs))
 
 
 if __name__ == "__main__":
-    part2(test_input=False)
+    print(f"Total possible designs: {part2(load())}")
@@ -1,6 +1,6 @@
 import itertools
 
-from aoc.helpers import get_input_text
+from aoc.helpers import iter_input_lines
 
 
 def _check_if_levels_is_safe(levels: list[int]) -> bool:
@@ -18,26 +18,25 @@ def _check_if_levels_is_safe(levels: list[int]) -> bool:
     return True
 
 
-def part1() -> None:
-    lines = get_input_text(2).splitlines()
+def load(test_input: bool = False) -> list[list[int]]:
+    return [
+        [int(level_str) for level_str in report.split()]
+        for report in iter_input_lines(2, test_input=test_input)
+    ]
+
+
+def part1(reports: list[list[int]]) -> int:
     total_safe_reports: int = 0
-    for report in lines:
-        levels = [int(level_str) for level_str in report.split()]
+    for levels in reports:
         is_safe = _check_if_levels_is_safe(levels)
         if is_safe:
             total_safe_reports += 1
-        print(report, f"-> {'SAFE' if is_safe else 'UNSAFE'}")
-    print(f"Total safe reports: {total_safe_reports}/{len(lines)}")
+    return total_safe_reports
 
 
-def part2() -> None:
-    lines = get_input_text(
-        2,
-        # test_input=True,
-    ).splitlines()
+def part2(reports: list[list[int]]) -> int:
     total_safe_reports: int = 0
-    for report in lines:
-        levels = [int(level_str) for level_str in report.split()]
+    for levels in reports:
         is_safe = _check_if_levels_is_safe(levels)
         if is_safe:
             total_safe_reports += 1
@@ -49,11 +48,9 @@ def part2() -> None:
                 if is_safe:
                     total_safe_reports += 1
                     break
-
-        print(report, f"-> {'SAFE' if is_safe else 'UNSAFE'}")
-    print(f"Total safe reports: {total_safe_reports}/{len(lines)}")
+    return total_safe_reports
 
 
 if __name__ == "__main__":
-    part1()
-    part2()
+    print("Total safe reports:", part1(load()))
+    print("Total safe reports:", part2(load()))
@@ -1,8 +1,10 @@
-from collections import deque
+from aoc.helpers import Grid, cached_parse, search
+from aoc.helpers.console import print
 
-from rich import print
 
-from aoc.helpers import Grid
+@cached_parse(20, version=3)
+def load(test_input: bool = False) -> Grid[str]:
+    return Grid.for_day(20, test_input=test_input, storage="bytes")
 
 
 def find_shortest_path(
@@ -10,24 +12,10 @@ def find_shortest_path(
     start: tuple[int, int],
     end: tuple[int, int],
 ) -> list[tuple[int, int]] | None:
-    queue = deque[tuple[int, int, list[tuple[int, int]]]](
-        [(start[0], start[1], [start])]
-    )
-    seen = set[tuple[int, int]]()
-    while queue:
-        i, j, path = queue.popleft()
-        if i == end[0] and j == end[1]:
-            return path
-        for neighbor in grid.get_nondiagonal_neighbors((i, j)):
-            if neighbor.value in (".", "E") and neighbor.coords not in seen:
-                seen.add(neighbor.coords)
-                queue.append((neighbor.i, neighbor.j, path + [neighbor.coords]))
-    return None
-    # raise ValueError(f"Cannot get from {start} to {end}")
+    return search.grid_path(grid, start, end, passable=".SE")
 
 
-def part1(test_input: bool = False) -> None:
-    grid = Grid.for_day(20, test_input=test_input)
+def part1(grid: Grid[str]) -> int:
     start = grid.first("S", strict=True)
     end = grid.first("E", strict=True)
     path = find_shortest_path(grid, start.coords, end.coords)
@@ -73,11 +61,10 @@ def part1(test_input: bool = False) -> None:
     for dist, cheats in all_cheats_by_distance.items():
         if dist > 99:
             cheats_over_99 += len(cheats)
-    print(f"{cheats_over_99=}")
+    return cheats_over_99
 
 
-def part2(test_input: bool = False) -> None:
-    grid = Grid.for_day(20, test_input=test_input)
+def part2(grid: Grid[str], debug: bool = False) -> int:
     start = grid.first("S", strict=True)
     end = grid.first("E", strict=True)
     path = find_shortest_path(grid, start.coords, end.coords)
@@ -111,7 +98,7 @@ def part2(test_input: bool = False) -> None:
                 cheats_by_distance[cheat_distance] = 0
             cheats_by_distance[cheat_distance] += 1
     cheats_over_99 = 0
-    if test_input:
+    if debug:
         items = sorted(
             cheats_by_distance.items(),
             key=lambda item: item[0],
@@ -121,9 +108,10 @@ def part2(test_input: bool = False) -> None:
     for dist, cheats in items:
         if dist > 99:
             cheats_over_99 += cheats
-        if test_input and dist >= 50:
+        if debug and dist >= 50:
             print(f"- There are {cheats} cheats that save {dist} picoseconds.")
-    print(f"{cheats_over_99=}")
+    return cheats_over_99
 
 
-part2(test_input=False)
+if __name__ == "__main__":
+    print(f"cheats_over_99={part2(load())}")
@@ -0,0 +1,2 @@
+# pyright: reportUnusedImport=false
+from .final_attempt import load, part1, part2  # noqa: F401
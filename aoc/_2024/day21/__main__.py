@@ -1,5 +1,5 @@
-from aoc._2024.day21.final_attempt import part1, part2
+from aoc._2024.day21.final_attempt import load, part1, part2
 
 if __name__ == "__main__":
-    print(part1())
-    print(part2())
+    print(part1(load()))
+    print(part2(load()))
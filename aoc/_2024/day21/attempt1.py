@@ -1,8 +1,7 @@
 from typing import Literal, TypeAlias
 
-from rich import print
-
 from aoc.helpers import Grid, get_input_text
+from aoc.helpers.console import print
 
 vibes = """
 Numerical keypad:
@@ -3,9 +3,8 @@ import itertools
 from collections import deque
 from typing import Callable, Literal, Sequence, TypeAlias, cast
 
-from rich import print
-
 from aoc.helpers import Cell, Grid, get_input_text
+from aoc.helpers.console import print
 
 DirectionalKey: TypeAlias = Literal["^", "<", "v", ">", "A", " "]
 NumericKey: TypeAlias = Literal[
@@ -10,13 +10,13 @@ NUMERIC_KEYPAD = Grid(
         ["1", "2", "3"],
         [" ", "0", "A"],
     ]
-)
+).index_values()
 DIRECTIONAL_KEYPAD = Grid(
     [
         [" ", "^", "A"],
         ["<", "v", ">"],
     ]
-)
+).index_values()
 
 
 @functools.cache
@@ -79,19 +79,22 @@ def get_code_complexity(code: str, depth: int) -> int:
     )
 
 
-def part1():
-    return solve(3)
+def load(test_input: bool = False) -> list[str]:
+    return get_input_text(21, test_input=test_input).splitlines()
 
 
-def part2():
-    return solve(26)
+def part1(codes: list[str]):
+    return solve(codes, 3)
 
 
-def solve(depth: int) -> int:
-    codes = get_input_text(21).splitlines()
+def part2(codes: list[str]):
+    return solve(codes, 26)
+
+
+def solve(codes: list[str], depth: int) -> int:
     return sum(map(lambda code: get_code_complexity(code, depth), codes))
 
 
 if __name__ == "__main__":
-    print(part1())
-    print(part2())
+    print(part1(load()))
+    print(part2(load()))
@@ -2,7 +2,7 @@ import itertools
 from collections import defaultdict
 from typing import Generator
 
-from aoc.helpers import get_input_text
+from aoc.helpers import Answer, get_input_bytes
 
 
 def evolve_secret(secret: int) -> int:
@@ -28,15 +28,12 @@ def produce_secrets(secret: int, n: int) -> list[int]:
     return secrets
 
 
-def iter_input_secrets() -> Generator[int]:
-    yield from map(int, get_input_text(22).splitlines())
+def load(test_input: bool = False) -> list[int]:
+    return [int(line.tobytes()) for line in get_input_bytes(22, test_input=test_input)]
 
 
-def part1() -> None:
-    sum_of_2000th_secret_number = sum(
-        produce_secrets(secret, 2_000)[-1] for secret in iter_input_secrets()
-    )
-    print(f"{sum_of_2000th_secret_number=}")
+def part1(initial_secrets: list[int]) -> int:
+    return sum(produce_secrets(secret, 2_000)[-1] for secret in initial_secrets)
 
 
 def sliding_window(arr: list[int], size: int) -> Generator[list[int]]:
@@ -44,9 +41,9 @@ def sliding_window(arr: list[int], size: int) -> Generator[list[int]]:
         yield arr[i : i + size]
 
 
-def part2() -> None:
+def part2(initial_secrets: list[int]) -> Answer[int]:
     cache: dict[tuple[int, ...], dict[int, int]] = defaultdict(dict)
-    for secret in iter_input_secrets():
+    for secret in initial_secrets:
         secrets = produce_secrets(secret, 2_000)
         bananas = [int(str(secret)[-1]) for secret in secrets]
         deltas = [prev - curr for prev, curr in itertools.pairwise(bananas)]
@@ -62,8 +59,8 @@ def part2() -> None:
             max_value = bananas
             max_combo = combo
 
-    print(f"{max_combo=} {max_value=}")
+    return Answer(max_value, diagnostics={"price changes": max_combo})
 
 
 if __name__ == "__main__":
-    part2()
+    print(part2(load()))
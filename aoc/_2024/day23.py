@@ -4,7 +4,7 @@ import functools
 import itertools
 from typing import Callable
 
-from aoc.helpers import get_input_text
+from aoc.helpers import Answer, cached_parse, get_input_text
 
 
 def sorted_tuple(*items: str) -> tuple[str, ...]:
@@ -39,6 +39,10 @@ class Graph(dict[str, list[str]]):
             complete_sets_of_size_n_that_contain_node
         )
 
+    def __reduce__(self):
+        # the memoized search closure can't be pickled; rebuild it on load
+        return (self.__class__, (), None, None, iter(self.items()))
+
     def get_complete_sets_of_size_n_in_graph(
         self,
         n: int,
@@ -67,30 +71,37 @@ class Graph(dict[str, list[str]]):
         return nodes
 
 
-def part1(graph: Graph):
-    print(
-        len(
-            graph.get_complete_sets_of_size_n_in_graph(
-                n=3,
-                filter=lambda node: node[0] == "t",
-            )
+@cached_parse(23)
+def load(test_input: bool = False) -> Graph:
+    return Graph.for_day_23(test_input=test_input)
+
+
+def part1(graph: Graph) -> int:
+    return len(
+        graph.get_complete_sets_of_size_n_in_graph(
+            n=3,
+            filter=lambda node: node[0] == "t",
         )
     )
 
 
-def part2(graph: Graph):
+def part2(graph: Graph) -> Answer[str]:
     prev_unique_complete_sets = set[tuple[str, ...]]()
+    complete_set_counts: dict[int, int] = {}
     for n in itertools.count(start=3):
         unique_comple_sets = graph.get_complete_sets_of_size_n_in_graph(n)
         if not unique_comple_sets:
             break
         prev_unique_complete_sets = unique_comple_sets
-        print(n, len(unique_comple_sets))
+        complete_set_counts[n] = len(unique_comple_sets)
     assert len(prev_unique_complete_sets) == 1
-    print(",".join(list(prev_unique_complete_sets)[0]))
+    return Answer(
+        ",".join(list(prev_unique_complete_sets)[0]),
+        diagnostics={"complete sets by size": complete_set_counts},
+    )
 
 
 if __name__ == "__main__":
-    graph = Graph.for_day_23(test_input=False)
-    part1(graph)
-    part2(graph)
+    graph = load(test_input=False)
+    print(part1(graph))
+    print(part2(graph))
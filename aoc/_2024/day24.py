@@ -3,7 +3,7 @@ from __future__ import annotations
 import re
 from typing import Generator, NamedTuple
 
-from aoc.helpers import get_input_text
+from aoc.helpers import cached_parse, get_input_text
 
 WIRE_CONNECTION_PATTERN = re.compile(
     r"(?P<i1>.*?) (?P<op>AND|OR|XOR) (?P<i2>.*?) -> (?P<o>.*?)"
@@ -45,6 +45,10 @@ class Day24Data(NamedTuple):
     def iter_outputs(self) -> Generator[str]:
         yield from self.output_to_inputs.keys()
 
+    @property
+    def lowest_x(self) -> str:
+        return min(w for w in self.wire_states if w.startswith("x"))
+
     @property
     def highest_z(self) -> str:
         return max(o for o in self.iter_outputs() if o.startswith("z"))
@@ -86,25 +90,51 @@ class Day24Data(NamedTuple):
             )
         return cls(wire_states, wire_connections)
 
-    def get_wire_state(self, wire: str) -> int:
-        if wire in self.wire_states:
-            return self.wire_states[wire]
-        if wire not in self.output_to_inputs:
-            raise ValueError(f"Unknown wire {wire!r}")
-        i1, i2, op, _ = self.output_to_inputs[wire]
-        assert op in ("AND", "OR", "XOR")
-        i1_state = self.get_wire_state(i1)
-        i2_state = self.get_wire_state(i2)
-        wire_state = process(op, i1_state, i2_state)
-        return wire_state
-
-
-def part1() -> None:
-    data = Day24Data.load(test_input=False)
+    def get_wire_state(
+        self, wire: str, gate_states: dict[str, int] | None = None
+    ) -> int:
+        """The state of `wire`; pass the same `gate_states` to reuse gate outputs."""
+        # an explicit stack rather than recursion: a scaled-up adder (see
+        # `aoc.generators`) chains gates deeper than the recursion limit
+        wire_states = self.wire_states
+        if gate_states is None:
+            gate_states = {}
+        stack = [wire]
+        while stack:
+            current = stack[-1]
+            if current in wire_states or current in gate_states:
+                stack.pop()
+                continue
+            if current not in self.output_to_inputs:
+                raise ValueError(f"Unknown wire {current!r}")
+            i1, i2, op, _ = self.output_to_inputs[current]
+            assert op in ("AND", "OR", "XOR")
+            pending = [
+                i for i in (i1, i2) if i not in wire_states and i not in gate_states
+            ]
+            if pending:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            gate_states[current] = process(
+                op,
+                wire_states.get(i1, gate_states.get(i1, 0)),
+                wire_states.get(i2, gate_states.get(i2, 0)),
+            )
+        return wire_states[wire] if wire in wire_states else gate_states[wire]
+
+
+@cached_parse(24)
+def load(test_input: bool = False) -> Day24Data:
+    return Day24Data.load(test_input=test_input)
+
+
+def part1(data: Day24Data) -> int:
     z_wire_states: list[str] = [""] * (int(data.highest_z[1:]) + 1)
+    gate_states: dict[str, int] = {}
     for wire in data.iter_outputs():
         if wire.startswith("z"):
-            z_wire_states[int(wire[1:])] = str(data.get_wire_state(wire))
+            z_wire_states[int(wire[1:])] = str(data.get_wire_state(wire, gate_states))
     z_number_repr = "".join(reversed(z_wire_states))
     z_number = int(z_number_repr, 2)
     # from rich import print
@@ -120,14 +150,14 @@ def part1() -> None:
     #         ]
     #     )
     # )
-    print(f"{len(z_number_repr)=} {z_number_repr=} {z_number=}")
+    return z_number
 
 
-def part2() -> None:
+def part2(data: Day24Data) -> str:
     """Credit to Iscddit:
     https://www.reddit.com/r/adventofcode/comments/1hl698z/comment/m3kt1je
     """
-    data = Day24Data.load(test_input=False)
+    lowest_x = data.lowest_x
 
     def is_wrong(conn: WireConnection) -> bool:
         subconnections = data.input_to_outputs.get(conn.output, [])
@@ -146,15 +176,15 @@ def part2() -> None:
             )
             or (
                 conn.op == "AND"
-                and "x00" not in conn.inputs
+                and lowest_x not in conn.inputs
                 and any(subconn.op != "OR" for subconn in subconnections)
             )
         )
 
     wrong = [conn.output for conn in data.iter_connections() if is_wrong(conn)]
-    print(",".join(sorted(wrong)))
+    return ",".join(sorted(wrong))
 
 
 if __name__ == "__main__":
-    part1()
-    part2()
+    print(part1(load()))
+    print(part2(load()))
@@ -1,6 +1,7 @@
+import itertools
 from typing import Iterable
 
-from aoc.helpers import get_input_text
+from aoc.helpers import Grid, get_input_text
 
 
 def find_XMAS_count_in_line(line: str) -> int:
@@ -11,50 +12,34 @@ def find_XMAS_count_in_lines(lines: Iterable[str]) -> int:
     return sum(map(find_XMAS_count_in_line, lines))
 
 
-def find_XMAS_count_in_horizontal_lines(text: str) -> int:
-    return find_XMAS_count_in_lines(text.splitlines())
+def find_XMAS_count_in_horizontal_lines(grid: Grid[str]) -> int:
+    return find_XMAS_count_in_lines(grid.render_rows())
 
 
-def find_XMAS_count_in_vertical_lines(text: str) -> int:
-    lines_by_index: dict[int, str] = {}
-    for line in text.splitlines():
-        for i, char in enumerate(line):
-            if i not in lines_by_index:
-                lines_by_index[i] = ""
-            lines_by_index[i] += char
-    return find_XMAS_count_in_lines(lines_by_index.values())
+def find_XMAS_count_in_vertical_lines(grid: Grid[str]) -> int:
+    # the columns, read off a transposed view rather than rebuilt char by char
+    return find_XMAS_count_in_lines(grid.transposed().render_rows())
 
 
-def find_left_to_right_diagonal_lines_in_2d_grid_text(text: str) -> list[str]:
-    lines_by_diagonal_id: dict[int, str] = {}
-    for i, line in enumerate(text.splitlines()):
-        for j, char in enumerate(line):
-            diagonal_id = i - j
-            if diagonal_id not in lines_by_diagonal_id:
-                lines_by_diagonal_id[diagonal_id] = ""
-            lines_by_diagonal_id[diagonal_id] += char
-    return list(lines_by_diagonal_id.values())
-
-
-def find_XMAS_count_in_diagonal_lines(text: str) -> int:
-    reversed_text = "\n".join(["".join(reversed(line)) for line in text.splitlines()])
-    lines = find_left_to_right_diagonal_lines_in_2d_grid_text(
-        text
-    ) + find_left_to_right_diagonal_lines_in_2d_grid_text(reversed_text)
-    return find_XMAS_count_in_lines(lines)
-
-
-def part1(test_input: bool = False):
-    text = get_input_text(4, test_input=test_input)
-    horizontal_count = find_XMAS_count_in_horizontal_lines(text)
-    vertical_count = find_XMAS_count_in_vertical_lines(text)
-    diagonal_count = find_XMAS_count_in_diagonal_lines(text)
+def find_XMAS_count_in_diagonal_lines(grid: Grid[str]) -> int:
+    lines = itertools.chain(grid.diagonals(), grid.anti_diagonals())
+    return find_XMAS_count_in_lines(map("".join, lines))
+
+
+def load(test_input: bool = False) -> str:
+    return get_input_text(4, test_input=test_input)
+
+
+def part1(text: str) -> int:
+    grid = Grid.from_string(text, storage="bytes")
+    horizontal_count = find_XMAS_count_in_horizontal_lines(grid)
+    vertical_count = find_XMAS_count_in_vertical_lines(grid)
+    diagonal_count = find_XMAS_count_in_diagonal_lines(grid)
     count = horizontal_count + vertical_count + diagonal_count
-    print("XMAS count:", count)
+    return count
 
 
-def part2(test_input: bool = False):
-    text = get_input_text(4, test_input=test_input)
+def part2(text: str) -> int:
     lines = text.splitlines()
     count = 0
     for i, line in enumerate(lines):
@@ -82,13 +67,13 @@ def part2(test_input: bool = False):
             if top_right != top_left and top_right != bottom_right:
                 continue
             count += 1
-    print("X-MAS count", count)
+    return count
 
 
 if __name__ == "__main__":
     print("PART 1")
-    part1(test_input=True)
-    part1()
+    print("XMAS count:", part1(load(test_input=True)))
+    print("XMAS count:", part1(load()))
     print("PART 2")
-    part2(test_input=True)
-    part2()
+    print("X-MAS count", part2(load(test_input=True)))
+    print("X-MAS count", part2(load()))
@@ -2,31 +2,37 @@
 
 from __future__ import annotations
 
-from typing import Literal, overload
-
-from rich import print
+from typing import Literal, NamedTuple, overload
 
 from aoc.helpers import get_input_text
 
 
-def part1(test_input: bool = False) -> None:
+class Day5Data(NamedTuple):
+    ordering_rules: list[tuple[int, int]]
+    updates: list[list[int]]
+
+
+def load(test_input: bool = False) -> Day5Data:
     text = get_input_text(5, test_input=test_input)
-    ordering_text, updates_text = text.split("\n\n")
-    ordering_lines = ordering_text.splitlines()
-    joe: dict[int, list[int]] = {}
-    for line in ordering_lines:
+    ordering_section, updates_section = text.split("\n\n")
+    ordering_rules: list[tuple[int, int]] = []
+    for line in ordering_section.splitlines():
         # each line should be of the form X|Y
         x_str, y_str = line.split("|")
-        x = int(x_str)
-        y = int(y_str)
+        ordering_rules.append((int(x_str), int(y_str)))
+    updates = [list(map(int, line.split(","))) for line in updates_section.splitlines()]
+    return Day5Data(ordering_rules, updates)
+
+
+def part1(data: Day5Data) -> int:
+    joe: dict[int, list[int]] = {}
+    for x, y in data.ordering_rules:
         if x not in joe:
             joe[x] = []
         joe[x].append(y)
-    updates_lines = updates_text.splitlines()
-    valid_lines: list[str] = []
-    for update_line in updates_lines:
+    valid_lines: list[list[int]] = []
+    for nums in data.updates:
         is_valid: bool = True
-        nums = list(map(int, update_line.split(",")))
         for n in nums:
             things_that_should_go_after_n = joe.get(n, [])
             for y in things_that_should_go_after_n:
@@ -34,22 +40,18 @@ def part1(test_input: bool = False) -> None:
                     is_valid = False
                     break
         if is_valid:
-            valid_lines.append(update_line)
+            valid_lines.append(nums)
 
     # return total sum of middle numbers of valid "update" lines.
     total: int = 0
-    for update_line in valid_lines:
-        nums = list(map(int, update_line.split(",")))
+    for nums in valid_lines:
         total += nums[len(nums) // 2]
 
-    print("Sum of middle numbers of valid lines is", total)
+    return total
 
 
 # restarting part 2. no peeking at part 1 either.
-def part2(test_input: bool = False) -> None:
-    text = get_input_text(5, test_input=test_input)
-    ordering_section, updates_section = text.split("\n\n")
-
+def part2(data: Day5Data) -> int:
     class Node:
         n: int
         children: list[Node]
@@ -107,15 +109,13 @@ def part2(test_input: bool = False) -> None:
             return True
 
     graph = Graph()
-    for line in ordering_section.splitlines():
-        x_str, y_str = line.split("|")
-        x_node = graph.get(int(x_str), create_if_not_exists=True)
-        y_node = graph.get(int(y_str), create_if_not_exists=True)
+    for x, y in data.ordering_rules:
+        x_node = graph.get(x, create_if_not_exists=True)
+        y_node = graph.get(y, create_if_not_exists=True)
         x_node.children.append(y_node)
 
     total = 0
-    for line in updates_section.splitlines():
-        nums = list(map(int, line.split(",")))
+    for nums in data.updates:
         if graph.is_traversable_sequence(nums):
             continue
         fixed_nums: list[int] = []
@@ -133,11 +133,11 @@ def part2(test_input: bool = False) -> None:
         assert len(nums) == len(fixed_nums)
         assert graph.is_traversable_sequence(fixed_nums)
         total += fixed_nums[len(fixed_nums) // 2]
-    print(
-        "The sum of the middle number of all fixed, originally invalid sequences is",
-        total,
-    )
+    return total
 
 
 if __name__ == "__main__":
-    part2(test_input=False)
+    print(
+        "The sum of the middle number of all fixed, originally invalid sequences is",
+        part2(load()),
+    )
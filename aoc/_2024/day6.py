@@ -1,149 +1,73 @@
-from rich import print
-from tqdm import tqdm
+from aoc.helpers import Grid
 
-from aoc.helpers import get_input_text
+# borders the map: the guard has left the map as soon as she steps on it, so
+# her walk needs no bounds checks
+OFF_MAP = " "
+TURN_RIGHT = {"^": ">", ">": "v", "v": "<", "<": "^"}
 
 
-def part1(test_input: bool = False) -> None:
-    text = get_input_text(6, test_input=test_input)
+def load(test_input: bool = False) -> Grid[str]:
+    return Grid.for_day(6, test_input=test_input, storage="bytes", sentinel=OFF_MAP)
 
-    # convert input into grid
-    grid: list[list[str]] = []
-    for line in text.splitlines():
-        grid.append(list(line))
 
-    # find the start position of the guard
-    start_pos: tuple[int, int] = (-1, -1)
-    for i in range(len(grid)):
-        for j in range(len(grid[i])):
-            if grid[i][j] == "^":
-                start_pos = (i, j)
-
-    if start_pos == (-1, -1):
+def _find_guard(grid: Grid[str]) -> tuple[int, str]:
+    guards = grid.positions_where(TURN_RIGHT.__contains__)
+    if not guards:
         raise RuntimeError("Invalid input does not contain a start position")
+    return guards[0], grid.value_at_id(guards[0])
+
+
+def _steps(grid: Grid[str]) -> dict[str, int]:
+    up, right, down, left = grid.neighbor_offsets
+    return {"^": up, ">": right, "v": down, "<": left}
+
 
+def part1(grid: Grid[str]) -> int:
+    cell_id, direction = _find_guard(grid)
+    steps = _steps(grid)
     # traverse grid
     #    * making sure to count unique positions
-    unique_positions: set[tuple[int, int]] = set()
-    # keep checking as long as current position is within grid
-    i, j = start_pos
-    direction_dictionary = {"^": (-1, 0), ">": (0, 1), "<": (0, -1), "v": (1, 0)}
+    unique_positions: set[int] = set()
     while True:
-        unique_positions.add((i, j))
-        # traverse!
-        delta_i, delta_j = direction_dictionary[grid[i][j]]
-        new_i, new_j = (i + delta_i), (j + delta_j)
-        if not (
-            new_i >= 0 and new_i < len(grid) and new_j >= 0 and new_j < len(grid[new_i])
-        ):
+        unique_positions.add(cell_id)
+        ahead = grid.value_at_id(cell_id + steps[direction])
+        if ahead == OFF_MAP:
             break
-        if grid[new_i][new_j] == "#":
+        if ahead == "#":
             # rotate 90 degrees to the right
-            match grid[i][j]:
-                case "^":
-                    grid[i][j] = ">"
-                case ">":
-                    grid[i][j] = "v"
-                case "v":
-                    grid[i][j] = "<"
-                case "<":
-                    grid[i][j] = "^"
-                case _:
-                    print("This should have never happened!")
-                    breakpoint()
-                    raise RuntimeError
+            direction = TURN_RIGHT[direction]
         else:
-            grid[new_i][new_j] = grid[i][j]
-            grid[i][j] = "."
-            i = new_i
-            j = new_j
-
-    count: int = len(unique_positions)
-    print(f"Unique positions traversed by guard {count}")
-
-
-def _is_stuck_in_a_loop(grid: list[list[str]]) -> bool:
-    # find the start position of the guard
-    start_pos: tuple[int, int] = (-1, -1)
-    for i in range(len(grid)):
-        for j in range(len(grid[i])):
-            if grid[i][j] in ("^", ">", "<", "v"):
-                start_pos = (i, j)
-                break
+            cell_id += steps[direction]
+    return len(unique_positions)
 
-    grid = [[char for char in line] for line in grid]
 
-    if start_pos == (-1, -1):
-        print(grid)
-        raise RuntimeError("Invalid input does not contain a start position")
-
-    # traverse grid
-    #    * making sure to count unique positions
-    unique_positions: set[tuple[int, int]] = set()
-    unique_positions_with_direction: set[tuple[int, int, str]] = set()
-    # keep checking as long as current position is within grid
-    i, j = start_pos
-    direction_dictionary = {"^": (-1, 0), ">": (0, 1), "<": (0, -1), "v": (1, 0)}
+def _is_stuck_in_a_loop(grid: Grid[str]) -> bool:
+    cell_id, direction = _find_guard(grid)
+    steps = _steps(grid)
+    unique_positions_with_direction: set[tuple[int, str]] = set()
     while True:
-        unique_positions.add((i, j))
-        # traverse!
-        direction = grid[i][j]
-        delta_i, delta_j = direction_dictionary[direction]
-        if (i, j, direction) in unique_positions_with_direction:
-            # breakpoint()
+        if (cell_id, direction) in unique_positions_with_direction:
             return True
-        unique_positions_with_direction.add((i, j, direction))
-        new_i, new_j = (i + delta_i), (j + delta_j)
-        if not (
-            new_i >= 0 and new_i < len(grid) and new_j >= 0 and new_j < len(grid[new_i])
-        ):
-            break
-        if grid[new_i][new_j] == "#":
+        unique_positions_with_direction.add((cell_id, direction))
+        ahead = grid.value_at_id(cell_id + steps[direction])
+        if ahead == OFF_MAP:
+            return False
+        if ahead == "#":
             # rotate 90 degrees to the right
-            match grid[i][j]:
-                case "^":
-                    grid[i][j] = ">"
-                case ">":
-                    grid[i][j] = "v"
-                case "v":
-                    grid[i][j] = "<"
-                case "<":
-                    grid[i][j] = "^"
-                case _:
-                    print("This should have never happened!")
-                    breakpoint()
-                    raise RuntimeError
+            direction = TURN_RIGHT[direction]
         else:
-            grid[new_i][new_j] = grid[i][j]
-            grid[i][j] = "."
-            i = new_i
-            j = new_j
-        # print(grid)
-    # breakpoint()
-    return False
-
-
-def part2(test_input: bool = False) -> None:
-    text = get_input_text(6, test_input=test_input)
+            cell_id += steps[direction]
 
-    # convert input into grid
-    grid: list[list[str]] = []
-    for line in text.splitlines():
-        grid.append(list(line))
 
-    result = _is_stuck_in_a_loop(grid)
+def part2(grid: Grid[str]) -> int:
     possible_spots: int = 0
-    coords = [(i, j) for i in range(len(grid)) for j in range(len(grid[i]))]
-    for i, j in tqdm(coords):
-        if grid[i][j] != ".":
-            continue
-        grid[i][j] = "#"
-        result = _is_stuck_in_a_loop(grid)
-        if result is True:
+    for i, j in grid.positions("."):
+        grid[i, j] = "#"
+        if _is_stuck_in_a_loop(grid):
             possible_spots += 1
-        grid[i][j] = "."
-    print(f"Possible spots to force a loop: {possible_spots}")
+        grid[i, j] = "."
+    return possible_spots
 
 
 if __name__ == "__main__":
-    part2(test_input=False)
+    print(f"Possible spots to force a loop: {part2(load())}")
@@ -1,6 +1,4 @@
-from rich import print
-
-from aoc.helpers import get_input_text
+from aoc.helpers import iter_input_lines
 
 
 def does_nums_add_up_to_n(nums: list[int], n: float) -> bool:
@@ -36,7 +34,8 @@ def _concat_nums(a: float, b: float, *, debug: bool = False) -> int:
 
 
 def does_nums_add_up_to_n_part2(nums: list[int], n: float) -> bool:
-    if not nums:
+    # the numbers are all positive, so no operator can reach a negative total
+    if not nums or n < 0:
         return False
     if len(nums) == 1:
         return nums[0] == n
@@ -60,37 +59,33 @@ def does_nums_add_up_to_n_part2(nums: list[int], n: float) -> bool:
     return False
 
 
-def part1(test_input: bool = False) -> None:
-    text = get_input_text(7, test_input=test_input)
+def load(test_input: bool = False) -> list[tuple[int, list[int]]]:
+    equations: list[tuple[int, list[int]]] = []
+    for line in iter_input_lines(7, test_input=test_input):
+        answer_str, rest = line.split(": ")
+        equations.append((int(answer_str), [int(x) for x in rest.split(" ")]))
+    return equations
+
 
-    lines = text.splitlines()
+def part1(equations: list[tuple[int, list[int]]]) -> int:
     total: int = 0
-    for line in lines:
-        answer_str, rest = line.split(": ")
-        answer = int(answer_str)
-        nums = [int(x) for x in rest.split(" ")]
+    for answer, nums in equations:
         result = does_nums_add_up_to_n(nums, answer)
-        print(f"{answer}: {rest} -> {result}")
         if result is True:
             total += answer
 
-    print(f"Sum of valid totals is {total}")
+    return total
 
 
-def part2(test_input: bool = False) -> None:
-    text = get_input_text(7, test_input=test_input)
-    lines = text.splitlines()
+def part2(equations: list[tuple[int, list[int]]]) -> int:
     total: int = 0
-    for line in lines:
-        answer_str, rest = line.split(": ")
-        answer = int(answer_str)
-        nums = [int(x) for x in rest.split(" ")]
+    for answer, nums in equations:
         result = does_nums_add_up_to_n_part2(nums, answer)
-        # print(f"{answer}: {rest} -> {result}")
+        # print(f"{answer}:", *nums, f"-> {result}")
         if result is True:
             total += answer
 
-    print(f"Sum of valid totals is {total}")
+    return total
 
 
 def n_ends_with_n2(n: float, n2: int) -> bool:
@@ -107,4 +102,4 @@ def n_ends_with_n2(n: float, n2: int) -> bool:
 
 
 if __name__ == "__main__":
-    part2(test_input=False)
+    print(f"Sum of valid totals is {part2(load())}")
@@ -2,30 +2,29 @@
 
 import itertools
 
-from rich import print
-
-from aoc.helpers import get_input_text
+from aoc.helpers import SparseGrid, get_input_text
 
 DAY_NUM = 8
 
 
-def part1(test_input: bool = False) -> None:
-    text = get_input_text(DAY_NUM, test_input=test_input)
-    # gotta find "antennas" of the "same frequency" and then
-    # determine what are the antinode positions of the antennas.
+def load(test_input: bool = False) -> SparseGrid[str]:
+    # the map is nearly all empty space; only the antennas are stored
+    return SparseGrid.from_string(get_input_text(DAY_NUM, test_input=test_input))
 
-    grid: list[list[str]] = [[char for char in line] for line in text.splitlines()]
 
+def get_antenna_locations_by_frequency(
+    grid: SparseGrid[str],
+) -> dict[str, list[tuple[int, int]]]:
     antenna_locations_by_frequency: dict[str, list[tuple[int, int]]] = {}
-    for i in range(len(grid)):
-        for j in range(len(grid[i])):
-            char = grid[i][j]
-            if char == ".":
-                continue
-            if char not in antenna_locations_by_frequency:
-                antenna_locations_by_frequency[char] = []
+    for i, j, char in grid.traverse():
+        antenna_locations_by_frequency.setdefault(char, []).append((i, j))
+    return antenna_locations_by_frequency
 
-            antenna_locations_by_frequency[char].append((i, j))
+
+def part1(grid: SparseGrid[str]) -> int:
+    # gotta find "antennas" of the "same frequency" and then
+    # determine what are the antinode positions of the antennas.
+    antenna_locations_by_frequency = get_antenna_locations_by_frequency(grid)
 
     antinode_locations: set[tuple[int, int]] = set()
     for _, locations in antenna_locations_by_frequency.items():
@@ -44,43 +43,20 @@ def part1(test_input: bool = False) -> None:
             #     (antinode1_i, antinode1_j),
             #     (antinode2_i, antinode2_j),
             # )
-            if (
-                antinode1_i >= 0
-                and antinode1_i < len(grid)
-                and antinode1_j >= 0
-                and antinode1_j < len(grid[antinode1_i])
-            ):
+            if not grid.is_off_grid((antinode1_i, antinode1_j)):
                 antinode_locations.add((antinode1_i, antinode1_j))
-            if (
-                antinode2_i >= 0
-                and antinode2_i < len(grid)
-                and antinode2_j >= 0
-                and antinode2_j < len(grid[antinode2_i])
-            ):
+            if not grid.is_off_grid((antinode2_i, antinode2_j)):
                 antinode_locations.add((antinode2_i, antinode2_j))
 
-    print(f"Unique antinode locations: {len(antinode_locations)}")
     # print(grid)
     # for i, j in antinode_locations:
     #     grid[i][j] = "#"
     # print(grid)
+    return len(antinode_locations)
 
 
-def part2(test_input: bool = False) -> None:
-    text = get_input_text(DAY_NUM, test_input=test_input)
-
-    grid: list[list[str]] = [[char for char in line] for line in text.splitlines()]
-
-    antenna_locations_by_frequency: dict[str, list[tuple[int, int]]] = {}
-    for i in range(len(grid)):
-        for j in range(len(grid[i])):
-            char = grid[i][j]
-            if char == ".":
-                continue
-            if char not in antenna_locations_by_frequency:
-                antenna_locations_by_frequency[char] = []
-
-            antenna_locations_by_frequency[char].append((i, j))
+def part2(grid: SparseGrid[str]) -> int:
+    antenna_locations_by_frequency = get_antenna_locations_by_frequency(grid)
 
     # get all same-freq-antenna pairs
     antenna_pairs = set[tuple[tuple[int, int], tuple[int, int]]]()
@@ -94,18 +70,18 @@ def part2(test_input: bool = False) -> None:
         delta_y = loc1[1] - loc2[1]
         x = loc1[0]
         y = loc1[1]
-        while x >= 0 and x < len(grid) and y >= 0 and y < len(grid[x]):
+        while not grid.is_off_grid((x, y)):
             antinode_locations.add((x, y))
             x -= delta_x
             y -= delta_y
         x = loc2[0]
         y = loc2[1]
-        while x >= 0 and x < len(grid) and y >= 0 and y < len(grid[x]):
+        while not grid.is_off_grid((x, y)):
             antinode_locations.add((x, y))
             x += delta_x
             y += delta_y
-    print(f"Unique antinode locations: {len(antinode_locations)}")
+    return len(antinode_locations)
 
 
 if __name__ == "__main__":
-    part2(test_input=False)
+    print(f"Unique antinode locations: {part2(load())}")
@@ -2,32 +2,36 @@
 
 from __future__ import annotations
 
-from aoc.helpers import get_input_text
+from aoc.helpers import get_input_bytes
 
 DAY_NUM = 9
+DIGIT_ZERO = ord("0")
 
 
-def part1(test_input: bool = False) -> None:
-    text = get_input_text(DAY_NUM, test_input=test_input)
-    text = text.strip()
-    # convert text string to representation of disk space
+def load(test_input: bool = False) -> memoryview:
+    """The dense disk map: a view of the ASCII digits on the input's first line."""
+    return get_input_bytes(DAY_NUM, test_input=test_input)[0]
+
+
+def part1(dense_map: memoryview, debug: bool = False) -> int:
+    # convert dense disk map to representation of disk space
     disk_map: list[str] = []
     file_id: int = 0
-    for i in range(len(text)):
+    for i in range(len(dense_map)):
         is_file_size_repr = i % 2 == 0
-        char = text[i]
+        size = dense_map[i] - DIGIT_ZERO
         if is_file_size_repr:
-            for _ in range(int(char)):
+            for _ in range(size):
                 disk_map.append(str(file_id))
             file_id += 1
         else:
-            for _ in range(int(char)):
+            for _ in range(size):
                 disk_map.append(".")
     # now update disk map by "moving" over leftmost
     # file blocks into free space
     free_space_i: int = 0
     file_block_i: int = len(disk_map) - 1
-    if test_input:
+    if debug:
         print("|".join(disk_map))
     while (
         free_space_i < file_block_i
@@ -58,7 +62,7 @@ def part1(test_input: bool = False) -> None:
         disk_map[file_block_i] = "."
         free_space_i += 1
         file_block_i -= 1
-        # if test_input:
+        # if debug:
         #     print("".join(disk_map))
 
     # compute checksum
@@ -67,7 +71,7 @@ def part1(test_input: bool = False) -> None:
         if disk_map[i] != ".":
             checksum += int(disk_map[i]) * i
 
-    print(f"Disk map cheksum: {checksum}")
+    return checksum
 
 
 class Node:
@@ -99,13 +103,10 @@ class Node:
         print("|".join(disk_map_str))
 
 
-def part2(test_input: bool = False) -> None:
-    text = get_input_text(DAY_NUM, test_input=test_input)
-    text = text.strip()
-
+def part2(dense_map: memoryview, debug: bool = False) -> int:
     index = 0
     head: Node = Node(
-        size=int(text[0]),
+        size=dense_map[0] - DIGIT_ZERO,
         file_id=0,
     )
     file_id: int = 1
@@ -113,9 +114,9 @@ def part2(test_input: bool = False) -> None:
     leftmost_space_by_size_cache: list[tuple[Node, int] | None] = [None] * 9
     leftmost_free_space: Node | None = None
     leftmost_free_space_index: int | None = None
-    for i in range(1, len(text)):
+    for i in range(1, len(dense_map)):
         is_file_size_repr = i % 2 == 0
-        size = int(text[i])
+        size = dense_map[i] - DIGIT_ZERO
         if is_file_size_repr:
             node = Node(
                 size=size,
@@ -148,7 +149,7 @@ def part2(test_input: bool = False) -> None:
     assert leftmost_free_space is not None
     seen = set[int]()
     # with tqdm(total=file_id) as pbar:
-    if test_input:
+    if debug:
         print("ORIGINAL")
         head.print_disk_map()
         print("---")
@@ -234,7 +235,7 @@ def part2(test_input: bool = False) -> None:
                             break
                         leftmost_free_space = leftmost_free_space.next
                         leftmost_free_space_index += 1
-                if test_input:
+                if debug:
                     head.print_disk_map()
             else:
                 rightmost_space = rightmost_space.prev
@@ -246,18 +247,18 @@ def part2(test_input: bool = False) -> None:
     # compute checksum
     checksum: int = 0
     disk_map = head.as_disk_map()
-    if test_input:
+    if debug:
         head.print_disk_map()
     for i in range(len(disk_map)):
         val = disk_map[i]
         if val is not None:
             checksum += val * i
-    if test_input:
+    if debug:
         print()
 
-    print(f"Disk map checksum is {checksum}")
+    return checksum
 
 
 if __name__ == "__main__":
-    part1(test_input=False)
-    part2(test_input=False)
+    print(f"Disk map cheksum: {part1(load())}")
+    print(f"Disk map checksum is {part2(load())}")
@@ -0,0 +1,261 @@
+"""Command line entry point: `python -m aoc {list,run,bench,generate} [DAY ...]`."""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from typing import Sequence
+
+from aoc import benchmark, generators, profiling, registry, runner
+from aoc.helpers import cache
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="aoc")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = subparsers.add_parser(
+        "list", help="list available solutions without importing them"
+    )
+    list_parser.add_argument("-y", "--year", type=int, action="append", dest="years")
+
+    run_parser = subparsers.add_parser(
+        "run", help="run solutions and report parse/solve time per part"
+    )
+    add_selection_arguments(run_parser)
+    run_parser.add_argument(
+        "-s",
+        "--scale",
+        type=int,
+        default=1,
+        help="run against generated inputs this many times the real size",
+    )
+    run_parser.add_argument(
+        "-q",
+        "--quiet",
+        action="store_true",
+        help="discard anything the solutions print while running",
+    )
+    run_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="solve parts in this many worker processes; 0 uses every CPU "
+        "(default: %(default)s)",
+    )
+    run_parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="show the diagnostics solutions report alongside their answers",
+    )
+    run_parser.add_argument(
+        "--profile",
+        nargs="?",
+        const=profiling.DEFAULT_PROFILE_DIR,
+        metavar="DIR",
+        dest="profile_dir",
+        help="profile each part, write .prof stats and .collapsed stacks to DIR "
+        "(default: %(const)s) and list the hottest functions",
+    )
+    run_parser.add_argument(
+        "-m",
+        "--memory",
+        action="store_true",
+        help="trace allocations and report peak/net memory and the top "
+        "allocation sites of each part",
+    )
+    run_parser.add_argument(
+        "--top",
+        type=int,
+        default=profiling.DEFAULT_TOP,
+        metavar="N",
+        help="hot functions or allocation sites to list per part with --profile "
+        "or --memory (default: %(default)s)",
+    )
+
+    bench_parser = subparsers.add_parser(
+        "bench", help="benchmark solutions and compare against a stored baseline"
+    )
+    add_selection_arguments(bench_parser)
+    bench_parser.add_argument(
+        "-s",
+        "--scale",
+        type=int,
+        action="append",
+        dest="scales",
+        help="benchmark against generated inputs this many times the real size; "
+        "may be repeated (default: the real inputs)",
+    )
+    bench_parser.add_argument(
+        "-n",
+        "--repeat",
+        type=int,
+        default=benchmark.DEFAULT_REPEAT,
+        help="timed runs per part (default: %(default)s)",
+    )
+    bench_parser.add_argument(
+        "-w",
+        "--warmup",
+        type=int,
+        default=benchmark.DEFAULT_WARMUP,
+        help="untimed runs per part before timing (default: %(default)s)",
+    )
+    bench_parser.add_argument(
+        "-b",
+        "--baseline",
+        default=benchmark.DEFAULT_BASELINE_PATH,
+        help="baseline JSON file (default: %(default)s)",
+    )
+    bench_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=benchmark.DEFAULT_THRESHOLD,
+        help="allowed slowdown/memory growth as a fraction (default: %(default)s)",
+    )
+    bench_parser.add_argument(
+        "--save",
+        action="store_true",
+        help="write the results into the baseline instead of comparing",
+    )
+
+    generate_parser = subparsers.add_parser(
+        "generate", help="write synthetic inputs scaled up from the real ones"
+    )
+    generate_parser.add_argument(
+        "days",
+        nargs="*",
+        type=int,
+        metavar="DAY",
+        help="days to generate inputs for (default: every day with a generator)",
+    )
+    generate_parser.add_argument("-s", "--scale", type=int, required=True)
+    generate_parser.add_argument("--seed", type=int, default=generators.DEFAULT_SEED)
+    generate_parser.add_argument(
+        "-f", "--force", action="store_true", help="overwrite existing inputs"
+    )
+    return parser
+
+
+def add_selection_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "days",
+        nargs="*",
+        type=int,
+        metavar="DAY",
+        help="days to run (default: every day with a solution module)",
+    )
+    parser.add_argument(
+        "-p",
+        "--part",
+        type=int,
+        choices=runner.PARTS,
+        action="append",
+        dest="parts",
+        help="part to run; may be repeated (default: both parts)",
+    )
+    parser.add_argument("-y", "--year", type=int, default=runner.DEFAULT_YEAR)
+    parser.add_argument(
+        "-t", "--test", action="store_true", help="use the example (test) inputs"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="parse inputs from scratch instead of using the parsed-input cache",
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if getattr(args, "no_cache", False):
+        # set in the environment so that worker processes see it too
+        os.environ[cache.ENV_VAR] = "0"
+    if args.command == "list":
+        for year in args.years or registry.discover_years():
+            for solution in registry.discover_days(year).values():
+                print(f"{solution.year} day {solution.day:>2}  {solution.module_name}")
+    elif args.command == "run":
+        if args.jobs < 0:
+            parser.error(f"--jobs must be 0 or more, got {args.jobs}")
+        if args.test and args.scale != 1:
+            parser.error(
+                "--scale replaces the real inputs; it can't be used with --test"
+            )
+        start = time.perf_counter()
+        results = runner.run(
+            days=args.days or None,
+            parts=args.parts or runner.PARTS,
+            year=args.year,
+            test_input=args.test,
+            quiet=args.quiet,
+            jobs=args.jobs,
+            scale=args.scale,
+            profile_dir=args.profile_dir,
+            trace_memory=args.memory,
+            memory_top=args.top,
+        )
+        wall_seconds = time.perf_counter() - start
+        print(runner.format_results(results, verbose=args.verbose))
+        if args.jobs != 1:
+            cpu_seconds = sum(result.total_seconds for result in results)
+            print(
+                f"wall time {runner.format_seconds(wall_seconds)} "
+                f"(sum of parts {runner.format_seconds(cpu_seconds)})"
+            )
+        for result in results:
+            if result.profile_path is not None:
+                print(f"\nday {result.day} part {result.part}: {result.profile_path}")
+                print(profiling.format_top_functions(result.profile_path, args.top))
+            if result.memory is not None and result.memory.top_sites:
+                print(f"\nday {result.day} part {result.part}: largest net allocations")
+                print(profiling.format_allocation_sites(result.memory.top_sites))
+    elif args.command == "bench":
+        if args.test and any(scale != 1 for scale in args.scales or []):
+            parser.error(
+                "--scale replaces the real inputs; it can't be used with --test"
+            )
+        return bench(args)
+    elif args.command == "generate":
+        folder = generators.write_scaled_inputs(
+            args.days or generators.GENERATORS,
+            args.scale,
+            seed=args.seed,
+            overwrite=args.force,
+        )
+        print(f"Wrote x{args.scale} inputs to {folder}")
+    return 0
+
+
+def bench(args: argparse.Namespace) -> int:
+    results = [
+        result
+        for scale in args.scales or [1]
+        for result in benchmark.benchmark(
+            days=args.days or None,
+            parts=args.parts or runner.PARTS,
+            year=args.year,
+            test_input=args.test,
+            repeat=args.repeat,
+            warmup=args.warmup,
+            scale=scale,
+        )
+    ]
+    if args.save:
+        print(benchmark.format_benchmark_results(results))
+        benchmark.save_baseline(args.baseline, results)
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+
+    baseline = benchmark.load_baseline(args.baseline)
+    print(benchmark.format_benchmark_results(results, baseline))
+    regressions = benchmark.find_regressions(results, baseline, args.threshold)
+    for regression in regressions:
+        print(benchmark.format_regression(regression))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,237 @@
+"""Repeatable benchmarks of the daily solutions, with stored baselines.
+
+Each part is solved `warmup + repeat` times on freshly loaded input (several
+solvers mutate their input); only the solve step is timed. Memory is measured
+in one extra, untimed run because tracing allocations slows the interpreter
+down considerably: the peak bytes allocated while solving, and the net bytes
+still allocated once the solver returns (caches, the answer, anything it kept).
+
+Benchmarks can also run against generated inputs scaled up from the real ones
+(see `aoc.generators`); each result records its scale, so runs at several
+scales show how a solution's runtime grows with its input.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import statistics
+import time
+from typing import Any, Iterable, NamedTuple
+
+from aoc import generators, registry
+from aoc.profiling import MemoryTracer, format_bytes
+from aoc.registry import PARTS, Part
+from aoc.runner import DEFAULT_YEAR, format_seconds
+
+DEFAULT_REPEAT = 5
+DEFAULT_WARMUP = 1
+DEFAULT_THRESHOLD = 0.2
+DEFAULT_BASELINE_PATH = os.path.join("benchmarks", "baseline.json")
+# a few stray objects must not count as a memory regression
+MIN_MEMORY_REGRESSION_BYTES = 64 * 1024
+MEMORY_METRICS = ("peak_memory_bytes", "net_memory_bytes")
+
+
+class BenchmarkResult(NamedTuple):
+    year: int
+    day: int
+    part: Part
+    runs: int
+    min_seconds: float
+    median_seconds: float
+    p95_seconds: float
+    peak_memory_bytes: int
+    scale: int = 1
+    net_memory_bytes: int = 0
+
+    @property
+    def key(self) -> tuple[int, int, int, int]:
+        return (self.year, self.day, self.part, self.scale)
+
+
+class Regression(NamedTuple):
+    result: BenchmarkResult
+    baseline: BenchmarkResult
+    metric: str
+    ratio: float
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Linearly interpolated percentile of `samples` (`pct` in [0, 100])."""
+    ordered = sorted(samples)
+    position = (len(ordered) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def benchmark_part(
+    day: int,
+    part: Part,
+    *,
+    year: int = DEFAULT_YEAR,
+    test_input: bool = False,
+    repeat: int = DEFAULT_REPEAT,
+    warmup: int = DEFAULT_WARMUP,
+    scale: int = 1,
+) -> BenchmarkResult:
+    if repeat < 1:
+        raise ValueError(f"repeat must be at least 1, got {repeat}")
+    solution = registry.get_solution(year, day)
+    load = solution.load.resolve()
+    solver = solution.part(part).resolve()
+
+    samples: list[float] = []
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for i in range(warmup + repeat):
+            data = load(test_input=test_input)
+            start = time.perf_counter()
+            solver(data)
+            elapsed = time.perf_counter() - start
+            if i >= warmup:
+                samples.append(elapsed)
+
+        data = load(test_input=test_input)
+        with MemoryTracer(top=0) as tracer:
+            solver(data)
+    assert tracer.usage is not None
+
+    return BenchmarkResult(
+        year=year,
+        day=day,
+        part=part,
+        runs=repeat,
+        min_seconds=min(samples),
+        median_seconds=statistics.median(samples),
+        p95_seconds=percentile(samples, 95),
+        peak_memory_bytes=tracer.usage.peak_bytes,
+        scale=scale,
+        net_memory_bytes=tracer.usage.net_bytes,
+    )
+
+
+def benchmark(
+    days: Iterable[int] | None = None,
+    parts: Iterable[Part] = PARTS,
+    *,
+    year: int = DEFAULT_YEAR,
+    test_input: bool = False,
+    repeat: int = DEFAULT_REPEAT,
+    warmup: int = DEFAULT_WARMUP,
+    scale: int = 1,
+) -> list[BenchmarkResult]:
+    if scale != 1 and test_input:
+        raise ValueError("Scaled inputs replace the real inputs, not the examples")
+    if days is None:
+        days = registry.discover_days(year)
+        if scale != 1:
+            days = [day for day in days if day in generators.GENERATORS]
+    days = list(days)
+    with contextlib.ExitStack() as stack:
+        if scale != 1:
+            stack.enter_context(generators.scaled_inputs(days, scale, year=year))
+        return [
+            benchmark_part(
+                day,
+                part,
+                year=year,
+                test_input=test_input,
+                repeat=repeat,
+                warmup=warmup,
+                scale=scale,
+            )
+            for day in days
+            for part in parts
+        ]
+
+
+def load_baseline(path: str) -> dict[tuple[int, int, int, int], BenchmarkResult]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r") as fp:
+        records: list[dict[str, Any]] = json.load(fp)["results"]
+    baseline = [BenchmarkResult(**record) for record in records]
+    return {result.key: result for result in baseline}
+
+
+def save_baseline(path: str, results: Iterable[BenchmarkResult]) -> None:
+    """Merge `results` into the baseline at `path`, replacing older entries."""
+    baseline = load_baseline(path)
+    baseline.update({result.key: result for result in results})
+    records = [baseline[key]._asdict() for key in sorted(baseline)]
+    if directory := os.path.dirname(path):
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as fp:
+        json.dump({"results": records}, fp, indent=2)
+        fp.write("\n")
+
+
+def find_regressions(
+    results: Iterable[BenchmarkResult],
+    baseline: dict[tuple[int, int, int, int], BenchmarkResult],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[Regression]:
+    """Compare median time, peak memory and net memory against the baseline.
+
+    A metric regresses when it exceeds its baseline value by more than
+    `threshold` (a fraction, so 0.2 allows a 20% slowdown). Memory below
+    `MIN_MEMORY_REGRESSION_BYTES` never counts as a regression.
+    """
+    regressions: list[Regression] = []
+    for result in results:
+        previous = baseline.get(result.key)
+        if previous is None:
+            continue
+        for metric in ("median_seconds", *MEMORY_METRICS):
+            current_value = getattr(result, metric)
+            previous_value = getattr(previous, metric)
+            if previous_value <= 0:
+                continue
+            if metric in MEMORY_METRICS and current_value < MIN_MEMORY_REGRESSION_BYTES:
+                continue
+            ratio = current_value / previous_value
+            if ratio > 1 + threshold:
+                regressions.append(Regression(result, previous, metric, ratio))
+    return regressions
+
+
+def format_benchmark_results(
+    results: Iterable[BenchmarkResult],
+    baseline: dict[tuple[int, int, int, int], BenchmarkResult] | None = None,
+) -> str:
+    baseline = baseline or {}
+    lines = [
+        f"{'day':>4} {'part':>4} {'scale':>6} {'min':>10} {'median':>10} {'p95':>10} "
+        f"{'peak mem':>10} {'net mem':>10} {'vs base':>8}"
+    ]
+    for result in results:
+        previous = baseline.get(result.key)
+        change = ""
+        if previous is not None and previous.median_seconds > 0:
+            change = f"{result.median_seconds / previous.median_seconds - 1:+.0%}"
+        lines.append(
+            f"{result.day:>4} {result.part:>4} {f'x{result.scale}':>6} "
+            f"{format_seconds(result.min_seconds):>10} "
+            f"{format_seconds(result.median_seconds):>10} "
+            f"{format_seconds(result.p95_seconds):>10} "
+            f"{format_bytes(result.peak_memory_bytes):>10} "
+            f"{format_bytes(result.net_memory_bytes):>10} {change:>8}"
+        )
+    return "\n".join(lines)
+
+
+def format_regression(regression: Regression) -> str:
+    result, previous, metric, ratio = regression
+    if metric in MEMORY_METRICS:
+        before = format_bytes(getattr(previous, metric))
+        after = format_bytes(getattr(result, metric))
+    else:
+        before = format_seconds(previous.median_seconds)
+        after = format_seconds(result.median_seconds)
+    return (
+        f"{result.year} day {result.day} part {result.part} (x{result.scale}): "
+        f"{metric} "
+        f"regressed {ratio - 1:+.0%} ({before} -> {after})"
+    )
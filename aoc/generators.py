@@ -0,0 +1,628 @@
+"""Synthetic puzzle inputs, scaled up from the size of the real ones.
+
+`GENERATORS[day](scale, rng)` returns the text of a valid 2024 input that is
+about `scale` times the size of the real one: list-like inputs get `scale`
+times as many lines, and grids get `scale` times as many cells (so each side
+grows by `sqrt(scale)`). Every generator draws from a `random.Random` seeded
+with the year, day, scale and `seed`, so the same call always writes the same
+file.
+
+Day 17 has no generator: part 2 searches over the program, whose length is
+fixed, so a bigger input would take exactly as long as the real one. Runs and
+benchmarks at a scale skip it unless it is asked for by name.
+
+Generated inputs are written to
+`inputs/scaled/x<scale>-seed<seed>-v<version>/<year>/`, which the `--scale`
+option of the runner and the benchmarks points the loaders at. The folder
+names `GENERATOR_VERSION`, so inputs written by an older generator are never
+reused: bump it whenever a generator's output changes.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import math
+import os
+import random
+import string
+from collections import deque
+from typing import Callable, Generator, Iterable
+
+from aoc.helpers.input import INPUTS_FOLDER, use_inputs_folder
+
+DEFAULT_SEED = 2024
+GENERATOR_VERSION = 3
+SCALED_INPUTS_FOLDER = os.path.join(INPUTS_FOLDER, "scaled")
+
+InputGenerator = Callable[[int, random.Random], str]
+
+
+def scaled_inputs_folder(scale: int, seed: int = DEFAULT_SEED) -> str:
+    return os.path.join(
+        SCALED_INPUTS_FOLDER, f"x{scale}-seed{seed}-v{GENERATOR_VERSION}"
+    )
+
+
+def generate(
+    day: int, scale: int, *, year: int = 2024, seed: int = DEFAULT_SEED
+) -> str:
+    if year != 2024:
+        raise ValueError(f"No input generators for year {year}")
+    if day not in GENERATORS:
+        raise ValueError(f"No input generator for {year} day {day}")
+    if scale < 1:
+        raise ValueError(f"scale must be at least 1, got {scale}")
+    rng = random.Random(f"{seed}:{year}:{day}:{scale}")
+    return GENERATORS[day](scale, rng)
+
+
+def write_scaled_inputs(
+    days: Iterable[int],
+    scale: int,
+    *,
+    year: int = 2024,
+    seed: int = DEFAULT_SEED,
+    overwrite: bool = False,
+) -> str:
+    """Generate (unless already present) the inputs of `days` at `scale`.
+
+    Returns the inputs folder to read them from.
+    """
+    folder = scaled_inputs_folder(scale, seed)
+    os.makedirs(os.path.join(folder, str(year)), exist_ok=True)
+    for day in days:
+        path = os.path.join(folder, str(year), f"day{day}.txt")
+        if overwrite or not os.path.exists(path):
+            text = generate(day, scale, year=year, seed=seed)
+            with open(path, "w") as fp:
+                fp.write(text)
+    return folder
+
+
+@contextlib.contextmanager
+def scaled_inputs(
+    days: Iterable[int], scale: int, *, year: int = 2024, seed: int = DEFAULT_SEED
+) -> Generator[str]:
+    """Read the inputs of `days` at `scale`, generating any that are missing."""
+    folder = write_scaled_inputs(days, scale, year=year, seed=seed)
+    with use_inputs_folder(folder):
+        yield folder
+
+
+def _side(base: int, scale: int) -> int:
+    return round(base * math.sqrt(scale))
+
+
+def _lines(lines: Iterable[str]) -> str:
+    return "".join(f"{line}\n" for line in lines)
+
+
+def _random_grid(
+    side: int, rng: random.Random, weights: dict[str, float]
+) -> list[list[str]]:
+    return [
+        rng.choices(list(weights), weights=list(weights.values()), k=side)
+        for _ in range(side)
+    ]
+
+
+def _grid_text(grid: list[list[str]]) -> str:
+    return _lines("".join(row) for row in grid)
+
+
+def _carve_maze(side: int, rng: random.Random) -> list[list[str]]:
+    """A perfect maze on the odd cells of a `side` x `side` wall grid."""
+    grid = [["#"] * side for _ in range(side)]
+    grid[1][1] = "."
+    stack = [(1, 1)]
+    while stack:
+        i, j = stack[-1]
+        options = [
+            (i + di, j + dj)
+            for di, dj in ((-2, 0), (2, 0), (0, -2), (0, 2))
+            if 0 < i + di < side - 1
+            and 0 < j + dj < side - 1
+            and grid[i + di][j + dj] == "#"
+        ]
+        if not options:
+            stack.pop()
+            continue
+        ni, nj = rng.choice(options)
+        grid[(i + ni) // 2][(j + nj) // 2] = "."
+        grid[ni][nj] = "."
+        stack.append((ni, nj))
+    return grid
+
+
+def day1(scale: int, rng: random.Random) -> str:
+    n = 1_000 * scale
+    left = [rng.randrange(10_000, 100_000) for _ in range(n)]
+    # part 2 scores the right-list values that also appear in the left list
+    right = [
+        rng.choice(left) if rng.random() < 0.3 else rng.randrange(10_000, 100_000)
+        for _ in range(n)
+    ]
+    return _lines(f"{x}   {y}" for x, y in zip(left, right))
+
+
+def day2(scale: int, rng: random.Random) -> str:
+    reports: list[str] = []
+    for _ in range(1_000 * scale):
+        level = rng.randrange(30, 70)
+        direction = rng.choice((1, -1))
+        levels = [level]
+        for _ in range(rng.randrange(4, 8)):
+            level += direction * rng.randrange(1, 4)
+            levels.append(level)
+        if rng.random() < 0.5:
+            # break the report in one or two places
+            for _ in range(rng.randrange(1, 3)):
+                levels[rng.randrange(len(levels))] += rng.randrange(-4, 5)
+        reports.append(" ".join(map(str, levels)))
+    return _lines(reports)
+
+
+def day3(scale: int, rng: random.Random) -> str:
+    junk = "!@#$%^&*()[]{}<>,;:'?/-+ "
+    words = ("do()", "don't()", "what()", "how()", "where()", "select()", "who()")
+    corrupted = (
+        "mul[{},{}]",
+        "mul({},{}]",
+        "mul ( {},{} )",
+        "mul({}*{})",
+        "mul({}, {})",
+    )
+    lines: list[str] = []
+    for _ in range(6 * scale):
+        tokens: list[str] = []
+        length = 0
+        while length < 3_000:
+            roll = rng.random()
+            a, b = rng.randrange(1, 1_000), rng.randrange(1, 1_000)
+            if roll < 0.25:
+                token = f"mul({a},{b})"
+            elif roll < 0.3:
+                token = rng.choice(corrupted).format(a, b)
+            elif roll < 0.4:
+                token = rng.choice(words)
+            else:
+                token = "".join(rng.choices(junk, k=rng.randrange(1, 4)))
+            tokens.append(token)
+            length += len(token)
+        lines.append("".join(tokens))
+    return _lines(lines)
+
+
+def day4(scale: int, rng: random.Random) -> str:
+    weights: dict[str, float] = {"X": 1, "M": 1, "A": 1, "S": 1}
+    return _grid_text(_random_grid(_side(140, scale), rng, weights))
+
+
+def day5(scale: int, rng: random.Random) -> str:
+    pages = rng.sample(range(10, 100), 49)
+    rules = [(x, y) for i, x in enumerate(pages) for y in pages[i + 1 :]]
+    rng.shuffle(rules)
+    position = {page: i for i, page in enumerate(pages)}
+    updates: list[str] = []
+    for _ in range(200 * scale):
+        update = rng.sample(pages, rng.randrange(5, 24, 2))
+        if rng.random() < 0.5:
+            update.sort(key=position.__getitem__)
+        updates.append(",".join(map(str, update)))
+    return _lines(f"{x}|{y}" for x, y in rules) + "\n" + _lines(updates)
+
+
+def day6(scale: int, rng: random.Random) -> str:
+    side = _side(130, scale)
+    grid = _random_grid(side, rng, {".": 0.952, "#": 0.048})
+    # both parts assume the guard walks off the map; of a few starting spots
+    # where they do, use the one with the longest patrol
+    best: tuple[int, tuple[int, int]] | None = None
+    while best is None:
+        for _ in range(20):
+            start = (rng.randrange(side), rng.randrange(side))
+            if grid[start[0]][start[1]] != ".":
+                continue
+            visited = _guard_patrol_length(grid, start)
+            if visited is not None and (best is None or visited > best[0]):
+                best = (visited, start)
+    i, j = best[1]
+    grid[i][j] = "^"
+    return _grid_text(grid)
+
+
+def _guard_patrol_length(grid: list[list[str]], start: tuple[int, int]) -> int | None:
+    """Tiles the guard visits before leaving the map, or None if they loop."""
+    side = len(grid)
+    (i, j), (di, dj) = start, (-1, 0)
+    seen: set[tuple[int, int, int, int]] = set()
+    while (i, j, di, dj) not in seen:
+        seen.add((i, j, di, dj))
+        ni, nj = i + di, j + dj
+        if not (0 <= ni < side and 0 <= nj < side):
+            return len({(i, j) for i, j, _, _ in seen})
+        if grid[ni][nj] == "#":
+            di, dj = dj, -di
+        else:
+            i, j = ni, nj
+    return None
+
+
+def day7(scale: int, rng: random.Random) -> str:
+    equations: list[str] = []
+    for _ in range(850 * scale):
+        nums = [
+            rng.randrange(1, 10) if rng.random() < 0.7 else rng.randrange(10, 1_000)
+            for _ in range(rng.randrange(3, 13))
+        ]
+        answer = nums[0]
+        for num in nums[1:]:
+            op = rng.choice("+*|")
+            if op == "+":
+                answer += num
+            elif op == "*":
+                answer *= num
+            else:
+                answer = int(f"{answer}{num}")
+        if rng.random() < 0.4:
+            # most of these are unreachable
+            answer += rng.randrange(1, 1_000)
+        equations.append(f"{answer}: {' '.join(map(str, nums))}")
+    return _lines(equations)
+
+
+def day8(scale: int, rng: random.Random) -> str:
+    side = _side(50, scale)
+    grid = [["."] * side for _ in range(side)]
+    frequencies = string.digits + string.ascii_letters
+    cells = rng.sample(range(side * side), int(0.075 * side * side))
+    for cell in cells:
+        grid[cell // side][cell % side] = rng.choice(frequencies)
+    return _grid_text(grid)
+
+
+def day9(scale: int, rng: random.Random) -> str:
+    files = 10_000 * scale
+    digits: list[str] = []
+    for file_id in range(files):
+        digits.append(str(rng.randrange(1, 10)))
+        if file_id < files - 1:
+            digits.append(str(rng.randrange(0, 10)))
+    return "".join(digits) + "\n"
+
+
+def day10(scale: int, rng: random.Random) -> str:
+    side = _side(41, scale)
+    # slopes that climb one step per tile, facing a random way in each block
+    # of 10x10 tiles; random heights alone almost never make a trail
+    slopes = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+    blocks = -(-side // 10)
+    facing = [rng.choices(slopes, k=blocks) for _ in range(blocks)]
+    grid: list[list[str]] = []
+    for i in range(side):
+        row: list[str] = []
+        for j in range(side):
+            if rng.random() < 0.1:
+                row.append(rng.choice(string.digits))
+                continue
+            si, sj = facing[i // 10][j // 10]
+            row.append(str((si * i + sj * j) % 10))
+        grid.append(row)
+    return _grid_text(grid)
+
+
+def day11(scale: int, rng: random.Random) -> str:
+    stones = [rng.choice((0, rng.randrange(10_000_000))) for _ in range(8 * scale)]
+    return " ".join(map(str, stones)) + "\n"
+
+
+def day12(scale: int, rng: random.Random) -> str:
+    side = _side(140, scale)
+    block = 6
+    blocks = -(-side // block)
+    letters = [rng.choices(string.ascii_uppercase, k=blocks) for _ in range(blocks)]
+    grid = [
+        [
+            letters[i // block][j // block]
+            if rng.random() < 0.93
+            else rng.choice(string.ascii_uppercase)
+            for j in range(side)
+        ]
+        for i in range(side)
+    ]
+    return _grid_text(grid)
+
+
+DAY13_PART_2_OFFSET = 10_000_000_000_000
+
+
+def _day13_presses(
+    a_x: int, a_y: int, b_x: int, b_y: int, prize_x: int, prize_y: int
+) -> tuple[int, int] | None:
+    """The whole numbers of A and B presses that reach the prize, if any."""
+    det = a_x * b_y - a_y * b_x
+    a, a_remainder = divmod(prize_x * b_y - prize_y * b_x, det)
+    b, b_remainder = divmod(a_x * prize_y - a_y * prize_x, det)
+    return None if a_remainder or b_remainder else (a, b)
+
+
+def day13(scale: int, rng: random.Random) -> str:
+    machines: list[str] = []
+    while len(machines) < 320 * scale:
+        a_x, a_y, b_x, b_y = (rng.randrange(10, 100) for _ in range(4))
+        if a_x * b_y == a_y * b_x:
+            # the solver only handles machines with at most one solution
+            continue
+        kind = rng.random()
+        if kind < 0.35:
+            a, b = rng.randrange(1, 101), rng.randrange(1, 101)
+            prize_x, prize_y = a * a_x + b * b_x, a * a_y + b * b_y
+        elif kind < 0.7:
+            # a prize only reachable once moved by the part 2 offset: aim for
+            # one in the usual range and round the presses that would reach it
+            det = a_x * b_y - a_y * b_x
+            target_x = rng.randrange(1_000, 20_000) + DAY13_PART_2_OFFSET
+            target_y = rng.randrange(1_000, 20_000) + DAY13_PART_2_OFFSET
+            a = round((target_x * b_y - target_y * b_x) / det)
+            b = round((a_x * target_y - a_y * target_x) / det)
+            prize_x = a * a_x + b * b_x - DAY13_PART_2_OFFSET
+            prize_y = a * a_y + b * b_y - DAY13_PART_2_OFFSET
+            if min(a, b, prize_x, prize_y) < 0:
+                continue
+        else:
+            prize_x, prize_y = (
+                rng.randrange(1_000, 20_000),
+                rng.randrange(1_000, 20_000),
+            )
+        # like the real machines, a prize is either out of reach or reached
+        # by pressing each button zero or more times, in both parts
+        solutions = [
+            _day13_presses(a_x, a_y, b_x, b_y, prize_x + offset, prize_y + offset)
+            for offset in (0, DAY13_PART_2_OFFSET)
+        ]
+        if any(presses is not None and min(presses) < 0 for presses in solutions):
+            continue
+        machines.append(
+            f"Button A: X+{a_x}, Y+{a_y}\n"
+            f"Button B: X+{b_x}, Y+{b_y}\n"
+            f"Prize: X={prize_x}, Y={prize_y}\n"
+        )
+    return "\n".join(machines)
+
+
+def day14(scale: int, rng: random.Random) -> str:
+    # odd sides, so the quadrants are split by a middle row and column
+    width = _side(101, scale) | 1
+    height = _side(103, scale) | 1
+    n = 500 * scale
+    # place every robot on its own tile at some second, so that part 2 has an
+    # answer
+    seconds = rng.randrange(1, min(width * height, 10_000))
+    velocities = [
+        (rng.randrange(-(width - 1), width), rng.randrange(-(height - 1), height))
+        for _ in range(n)
+    ]
+    tiles = rng.sample(range(width * height), n)
+    # the space is only 101x103 for the real input: give the loader the size
+    robots = [f"size={width},{height}"]
+    for (v_x, v_y), tile in zip(velocities, tiles):
+        p_x = (tile % width - v_x * seconds) % width
+        p_y = (tile // width - v_y * seconds) % height
+        robots.append(f"p={p_x},{p_y} v={v_x},{v_y}")
+    return _lines(robots)
+
+
+def day15(scale: int, rng: random.Random) -> str:
+    side = _side(50, scale)
+    grid = _random_grid(side, rng, {".": 0.66, "#": 0.08, "O": 0.26})
+    for k in range(side):
+        grid[0][k] = grid[side - 1][k] = grid[k][0] = grid[k][side - 1] = "#"
+    grid[side // 2][side // 2] = "@"
+    moves = rng.choices("<>^v", k=20_000 * scale)
+    move_lines = ("".join(moves[k : k + 1_000]) for k in range(0, len(moves), 1_000))
+    return _grid_text(grid) + "\n" + _lines(move_lines)
+
+
+def day16(scale: int, rng: random.Random) -> str:
+    side = _side(141, scale) | 1
+    grid = _carve_maze(side, rng)
+    # open up some walls between corridors so there are several best paths
+    for _ in range(side * side // 40):
+        i, j = rng.randrange(1, side - 1), rng.randrange(1, side - 1)
+        if (i % 2) != (j % 2):
+            grid[i][j] = "."
+    grid[side - 2][1] = "S"
+    grid[1][side - 2] = "E"
+    return _grid_text(grid)
+
+
+def day18(scale: int, rng: random.Random) -> str:
+    side = _side(71, scale)
+    cells = [
+        (x, y)
+        for x in range(side)
+        for y in range(side)
+        if (x, y) not in ((0, 0), (side - 1, side - 1))
+    ]
+    coords = rng.sample(cells, int(0.68 * side * side))
+    # the memory space is only 71 wide for the real input: give the loader
+    # the size
+    return _lines([f"size={side}", *(f"{x},{y}" for x, y in coords)])
+
+
+def day19(scale: int, rng: random.Random) -> str:
+    colors = "wubrg"
+    lengths = (1, 2, 2, 3, 3, 4, 5, 6, 7, 8)
+    patterns = {"".join(rng.choices(colors, k=rng.choice(lengths))) for _ in range(447)}
+    # no towel has "gg" in it or ends in "g", so no design with "gg" in it can
+    # be made; most of the random (rather than towel-built) designs have one
+    towels = sorted(p for p in patterns if "gg" not in p and not p.endswith("g"))
+    designs: list[str] = []
+    for _ in range(400 * scale):
+        length = rng.randrange(40, 61)
+        if rng.random() < 0.7:
+            design = ""
+            while len(design) < length:
+                design += rng.choice(towels)
+        else:
+            design = "".join(rng.choices(colors, k=length))
+        designs.append(design)
+    return ", ".join(towels) + "\n\n" + _lines(designs)
+
+
+def day20(scale: int, rng: random.Random) -> str:
+    side = _side(141, scale) | 1
+    grid = _carve_maze(side, rng)
+    # the race is a single track: keep only the maze's path from the start to
+    # the cell farthest from it
+    start = (1, 1)
+    parents: dict[tuple[int, int], tuple[int, int] | None] = {start: None}
+    queue: deque[tuple[int, int]] = deque([start])
+    end = start
+    while queue:
+        end = queue.popleft()
+        i, j = end
+        for neighbor in ((i - 1, j), (i + 1, j), (i, j - 1), (i, j + 1)):
+            if grid[neighbor[0]][neighbor[1]] == "." and neighbor not in parents:
+                parents[neighbor] = end
+                queue.append(neighbor)
+    track = [["#"] * side for _ in range(side)]
+    cell: tuple[int, int] | None = end
+    while cell is not None:
+        track[cell[0]][cell[1]] = "."
+        cell = parents[cell]
+    track[start[0]][start[1]] = "S"
+    track[end[0]][end[1]] = "E"
+    return _grid_text(track)
+
+
+def day21(scale: int, rng: random.Random) -> str:
+    return _lines(f"{rng.randrange(1_000):03d}A" for _ in range(5 * scale))
+
+
+def day22(scale: int, rng: random.Random) -> str:
+    return _lines(str(rng.randrange(1, 1 << 24)) for _ in range(2_000 * scale))
+
+
+def day23(scale: int, rng: random.Random) -> str:
+    n = 520 * scale
+    name_length = 2
+    while len(string.ascii_lowercase) ** name_length < n:
+        name_length += 1
+    names: set[str] = set()
+    while len(names) < n:
+        names.add("".join(rng.choices(string.ascii_lowercase, k=name_length)))
+    nodes = sorted(names)
+    rng.shuffle(nodes)
+    edges: set[tuple[str, str]] = set()
+    # a sparse random graph (cliques of more than 4 are vanishingly rare), and
+    # one planted clique of 13 that part 2 should find
+    clique = nodes[:13]
+    edges.update((a, b) for k, a in enumerate(clique) for b in clique[k + 1 :])
+    while len(edges) < 13 * n // 2:
+        a, b = rng.sample(nodes, 2)
+        if (b, a) not in edges:
+            edges.add((a, b))
+    connections = list(edges)
+    rng.shuffle(connections)
+    return _lines(f"{a}-{b}" for a, b in connections)
+
+
+def day24(scale: int, rng: random.Random) -> str:
+    bits = 45 * scale
+    width = max(2, len(str(bits)))
+
+    def wire(prefix: str, k: int) -> str:
+        return f"{prefix}{k:0{width}d}"
+
+    names: set[str] = set()
+
+    def gate_name() -> str:
+        while True:
+            name = "".join(rng.choices(string.ascii_lowercase, k=max(3, width + 1)))
+            if name[0] not in "xyz" and name not in names:
+                names.add(name)
+                return name
+
+    # a ripple-carry adder: gates maps each output wire to (op, input, input)
+    gates: dict[str, tuple[str, str, str]] = {}
+    sums: dict[int, str] = {}
+    carries: dict[int, str] = {}
+    ands: dict[int, str] = {}
+    carries_through: dict[int, str] = {}
+    for k in range(bits):
+        x, y = wire("x", k), wire("y", k)
+        if k == 0:
+            gates[wire("z", 0)] = ("XOR", x, y)
+            carries[0] = gate_name()
+            gates[carries[0]] = ("AND", x, y)
+            continue
+        sums[k], ands[k] = gate_name(), gate_name()
+        gates[sums[k]] = ("XOR", x, y)
+        gates[ands[k]] = ("AND", x, y)
+        carries_through[k] = gate_name()
+        gates[wire("z", k)] = ("XOR", sums[k], carries[k - 1])
+        gates[carries_through[k]] = ("AND", sums[k], carries[k - 1])
+        carries[k] = wire("z", bits) if k == bits - 1 else gate_name()
+        gates[carries[k]] = ("OR", ands[k], carries_through[k])
+
+    # swap four pairs of outputs in four different, non-adjacent bits; like
+    # the real puzzle's swaps, none of these creates a loop in the circuit
+    swapped_bits = rng.sample(range(2, bits - 2, 4), 4)
+    swaps = [
+        (wire("z", swapped_bits[0]), carries[swapped_bits[0]]),
+        (wire("z", swapped_bits[1]), ands[swapped_bits[1]]),
+        (wire("z", swapped_bits[2]), carries_through[swapped_bits[2]]),
+        (sums[swapped_bits[3]], ands[swapped_bits[3]]),
+    ]
+    for a, b in swaps:
+        gates[a], gates[b] = gates[b], gates[a]
+
+    initial = [f"{wire('x', k)}: {rng.randrange(2)}" for k in range(bits)]
+    initial += [f"{wire('y', k)}: {rng.randrange(2)}" for k in range(bits)]
+    connections = [f"{a} {op} {b} -> {out}" for out, (op, a, b) in gates.items()]
+    rng.shuffle(connections)
+    return _lines(initial) + "\n" + _lines(connections)
+
+
+def day25(scale: int, rng: random.Random) -> str:
+    schematics: list[str] = []
+    for _ in range(500 * scale):
+        heights = [rng.randrange(6) for _ in range(5)]
+        is_lock = rng.random() < 0.5
+        rows: list[str] = []
+        for row in range(7):
+            if is_lock:
+                rows.append("".join("#" if row <= h else "." for h in heights))
+            else:
+                rows.append("".join("#" if row >= 6 - h else "." for h in heights))
+        schematics.append(_lines(rows))
+    return "\n".join(schematics)
+
+
+GENERATORS: dict[int, InputGenerator] = {
+    1: day1,
+    2: day2,
+    3: day3,
+    4: day4,
+    5: day5,
+    6: day6,
+    7: day7,
+    8: day8,
+    9: day9,
+    10: day10,
+    11: day11,
+    12: day12,
+    13: day13,
+    14: day14,
+    15: day15,
+    16: day16,
+    18: day18,
+    19: day19,
+    20: day20,
+    21: day21,
+    22: day22,
+    23: day23,
+    24: day24,
+    25: day25,
+}
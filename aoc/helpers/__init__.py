@@ -1,3 +1,14 @@
 # pyright: reportUnusedImport=false
+from .answer import Answer  # noqa: F401
+from .bit_grid import BitGrid  # noqa: F401
+from .cache import cached_parse  # noqa: F401
 from .grid import Cell, Grid  # noqa: F401
-from .input import get_input_as_grid, get_input_text  # noqa: F401
+from .input import (  # noqa: F401
+    InputBytes,
+    get_input_as_grid,
+    get_input_bytes,
+    get_input_text,
+    iter_input_blocks,
+    iter_input_lines,
+)
+from .sparse_grid import SparseGrid  # noqa: F401
@@ -0,0 +1,91 @@
+"""Step-by-step terminal animation of a changing `Grid`.
+
+Reprinting a whole grid after every step of a long simulation floods the
+terminal and spends most of its time formatting cells that did not change.
+`GridAnimation` draws the first frame in full, then, for each later frame,
+only rewrites the runs of characters that differ from the frame before, using
+ANSI cursor movement. A caption (the current move, say) is redrawn under the
+grid on every frame.
+
+When the output is not a terminal, escape sequences would only garble it, so
+every frame is written in full instead.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import TextIO
+
+from .grid import Grid
+
+CLEAR_SCREEN = "\x1b[H\x1b[2J"
+CLEAR_TO_END = "\x1b[J"
+
+
+def _move_to(row: int, column: int) -> str:
+    # ANSI cursor positions are 1-based
+    return f"\x1b[{row + 1};{column + 1}H"
+
+
+def _changed_spans(old: str, new: str) -> list[tuple[int, int]]:
+    """The `(start, stop)` ranges of positions where two lines differ.
+
+    Positions past the end of the shorter line count as changed.
+    """
+    spans: list[tuple[int, int]] = []
+    start = None
+    for j, (a, b) in enumerate(zip(old, new)):
+        if a != b:
+            if start is None:
+                start = j
+        elif start is not None:
+            spans.append((start, j))
+            start = None
+    shortest = min(len(old), len(new))
+    if max(len(old), len(new)) > shortest:
+        spans.append((shortest if start is None else start, max(len(old), len(new))))
+    elif start is not None:
+        spans.append((start, shortest))
+    return spans
+
+
+class GridAnimation:
+    """Draws frames of a grid, rewriting only what changed since the last one."""
+
+    def __init__(
+        self, stream: TextIO | None = None, *, incremental: bool | None = None
+    ) -> None:
+        self.stream = stream if stream is not None else sys.stdout
+        if incremental is None:
+            incremental = self.stream.isatty()
+        self.incremental = incremental
+        self._previous: list[str] | None = None
+
+    def draw(self, grid: Grid, caption: str = "") -> None:
+        rows = grid.render_rows()
+        previous = self._previous
+        parts: list[str] = []
+        if not self.incremental:
+            parts.append(grid.render())
+            if caption:
+                parts.append(f"{caption}\n")
+        elif previous is None or len(previous) != len(rows):
+            parts.append(CLEAR_SCREEN)
+            parts.extend([f"{row}\n" for row in rows])
+            parts.append(f"{caption}\n")
+        else:
+            for i, (old, new) in enumerate(zip(previous, rows)):
+                if old == new:
+                    continue
+                for start, stop in _changed_spans(old, new):
+                    # blank out what is left of a line that got shorter
+                    text = new[start:stop].ljust(stop - start)
+                    parts.append(f"{_move_to(i, start)}{text}")
+            parts.append(f"{_move_to(len(rows), 0)}{CLEAR_TO_END}{caption}\n")
+        self._previous = rows
+        self.stream.write("".join(parts))
+        self.stream.flush()
+
+    def reset(self) -> None:
+        """Draw the next frame in full."""
+        self._previous = None
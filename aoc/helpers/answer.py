@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from typing import Any, NamedTuple
+
+
+class Answer[T](NamedTuple):
+    """A part's answer plus optional diagnostics for the runner to display.
+
+    Solvers may return a bare value instead; wrap it in `Answer` only when
+    there is extra information worth showing alongside it.
+    """
+
+    value: T
+    diagnostics: dict[str, Any] | None = None
@@ -0,0 +1,191 @@
+"""Grids of on/off cells packed into the bits of a single integer.
+
+Wall maps, obstacle maps and occupancy maps only need one bit per cell. A
+`BitGrid` keeps them all in one Python `int`: cell `(i, j)` is bit
+`i * stride + j`, where `stride` is one more than the width. That spare bit
+at the end of every row is always clear, so it works like `Grid`'s sentinel
+border: shifting the whole grid by one bit (a step left or right) or by
+`stride` bits (a step up or down) never carries a cell into the next row.
+
+Set operations (`&`, `|`, `^`, `~`) therefore combine whole grids at once,
+and `expand` moves every set cell one orthogonal step in a handful of shifts.
+`flood` builds a breadth-first search on that: each frontier is a single
+`BitGrid`, advanced a whole layer at a time, with no queue and no per-cell
+work. `row` gives a single row's bits, for the rare per-row test.
+
+Single-cell reads and writes are supported but have to shift the whole
+integer, so walks that test one cell at a time should stay on a `Grid`.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Generator, Iterable
+
+from .grid import Grid
+
+
+class BitGrid:
+    def __init__(self, size: int | tuple[int, int], bits: int = 0) -> None:
+        self.size = (size, size) if isinstance(size, int) else size
+        self.stride = self.size[1] + 1
+        self.bits = bits
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[str], set_chars: str = "#") -> BitGrid:
+        """Set the cells of a text map holding one of `set_chars`."""
+        rows = list(rows)
+        width = len(rows[0]) if rows else 0
+        stride = width + 1
+        bits = 0
+        for i, row in enumerate(rows):
+            # the first character is the lowest bit, so read the row backwards
+            row_bits = "".join(["1" if char in set_chars else "0" for char in row])
+            if "1" in row_bits:
+                bits |= int(row_bits[::-1], 2) << (i * stride)
+        return cls((len(rows), width), bits)
+
+    @classmethod
+    def from_string(cls, s: str, set_chars: str = "#") -> BitGrid:
+        return cls.from_rows(s.splitlines(), set_chars)
+
+    @classmethod
+    def from_grid[T](cls, grid: Grid[T], item: T | Callable[[T], bool]) -> BitGrid:
+        """Set the cells of `grid` holding `item` (or matching a predicate)."""
+        bit_grid = cls(grid.size)
+        stride = bit_grid.stride
+        bits = 0
+        for cell_id in grid.positions_where(item):
+            i, j = grid.coords_of(cell_id)
+            bits |= 1 << (i * stride + j)
+        bit_grid.bits = bits
+        return bit_grid
+
+    @classmethod
+    def full(cls, size: int | tuple[int, int]) -> BitGrid:
+        """A grid with every cell set."""
+        grid = cls(size)
+        height, width = grid.size
+        row = (1 << width) - 1
+        grid.bits = sum(row << (i * grid.stride) for i in range(height))
+        return grid
+
+    def _with_bits(self, bits: int) -> BitGrid:
+        grid = BitGrid.__new__(BitGrid)
+        grid.size, grid.stride, grid.bits = self.size, self.stride, bits
+        return grid
+
+    def _bit(self, coords: tuple[int, int]) -> int:
+        i, j = coords
+        if not (0 <= i < self.size[0] and 0 <= j < self.size[1]):
+            raise IndexError(f"grid index {coords} out of range")
+        return i * self.stride + j
+
+    def __getitem__(self, coords: tuple[int, int]) -> bool:
+        return bool(self.bits >> self._bit(coords) & 1)
+
+    def __setitem__(self, coords: tuple[int, int], value: bool) -> None:
+        if value:
+            self.bits |= 1 << self._bit(coords)
+        else:
+            self.bits &= ~(1 << self._bit(coords))
+
+    def __bool__(self) -> bool:
+        return self.bits != 0
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BitGrid):
+            return NotImplemented
+        return self.size == other.size and self.bits == other.bits
+
+    def __and__(self, other: BitGrid) -> BitGrid:
+        return self._with_bits(self.bits & other.bits)
+
+    def __or__(self, other: BitGrid) -> BitGrid:
+        return self._with_bits(self.bits | other.bits)
+
+    def __xor__(self, other: BitGrid) -> BitGrid:
+        return self._with_bits(self.bits ^ other.bits)
+
+    def __invert__(self) -> BitGrid:
+        return self._with_bits(BitGrid.full(self.size).bits ^ self.bits)
+
+    def __repr__(self) -> str:
+        return self.render()
+
+    def render(self, set_char: str = "#", clear_char: str = ".") -> str:
+        return "".join([f"{line}\n" for line in self.render_rows(set_char, clear_char)])
+
+    def render_rows(self, set_char: str = "#", clear_char: str = ".") -> list[str]:
+        height, width = self.size
+        return [
+            f"{self.row(i):0{width}b}"[::-1]
+            .replace("0", clear_char)
+            .replace("1", set_char)
+            for i in range(height)
+        ]
+
+    def row(self, i: int) -> int:
+        """Row `i` as an integer, with column `j` at bit `j`."""
+        if not 0 <= i < self.size[0]:
+            raise IndexError(f"row {i} out of range")
+        return self.bits >> (i * self.stride) & ((1 << self.size[1]) - 1)
+
+    def count(self) -> int:
+        """How many cells are set."""
+        return self.bits.bit_count()
+
+    def positions(self) -> list[tuple[int, int]]:
+        """Coordinates of every set cell, in row-major order."""
+        positions: list[tuple[int, int]] = []
+        for i in range(self.size[0]):
+            row = self.row(i)
+            while row:
+                low = row & -row
+                positions.append((i, low.bit_length() - 1))
+                row ^= low
+        return positions
+
+    def expand(self, within: BitGrid | None = None) -> BitGrid:
+        """The set cells and their orthogonal neighbors, limited to `within`.
+
+        Without `within`, the result is limited to the grid.
+        """
+        bits, stride = self.bits, self.stride
+        spread = bits | bits << 1 | bits >> 1 | bits << stride | bits >> stride
+        mask = within if within is not None else BitGrid.full(self.size)
+        return self._with_bits(spread & mask.bits)
+
+    def flood(self, start: BitGrid | tuple[int, int]) -> Generator[BitGrid]:
+        """Breadth-first frontiers through this grid's set cells.
+
+        Yields the start cell(s), then the set cells one step away from them,
+        and so on until no new cell can be reached; the n-th frontier holds
+        the cells exactly n steps from the start. Start cells that are not
+        set are dropped, so a start on a clear cell yields nothing.
+        """
+        if isinstance(start, tuple):
+            start_cell = BitGrid(self.size)
+            start_cell[start] = True
+            start = start_cell
+        frontier = start & self
+        stride, free = self.stride, self.bits
+        reached = frontier.bits
+        while frontier:
+            yield frontier
+            bits = frontier.bits
+            spread = bits << 1 | bits >> 1 | bits << stride | bits >> stride
+            frontier = self._with_bits(spread & free & ~reached)
+            reached |= frontier.bits
+
+    def distance(
+        self, start: BitGrid | tuple[int, int], goal: tuple[int, int]
+    ) -> int | None:
+        """Fewest orthogonal steps over set cells from `start` to `goal`.
+
+        None when `goal` cannot be reached.
+        """
+        goal_bit = 1 << self._bit(goal)
+        for steps, frontier in enumerate(self.flood(start)):
+            if frontier.bits & goal_bit:
+                return steps
+        return None
@@ -0,0 +1,84 @@
+"""On-disk cache of parsed puzzle inputs.
+
+Decorating a day's `load` function with `cached_parse(day)` pickles whatever it
+returns into a `.cache/` folder next to the input itself. Entries are keyed
+by the SHA-256 of the input file and by the parser's `version`, so editing the
+input invalidates them automatically; bump `version` whenever the parser, or the
+classes it builds, change. Set `AOC_PARSE_CACHE=0` to bypass the cache.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import hashlib
+import os
+import pickle
+import tempfile
+from typing import Any, Callable
+
+from .input import _get_input_filename, get_inputs_folder
+
+CACHE_FOLDER = ".cache"
+ENV_VAR = "AOC_PARSE_CACHE"
+
+
+def is_enabled() -> bool:
+    return os.environ.get(ENV_VAR, "1") != "0"
+
+
+def cached_parse[T](
+    day: int, version: int = 1, year: int = 2024
+) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    def decorator(load: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(load)
+        def wrapper(test_input: bool = False) -> T:
+            if not is_enabled():
+                return load(test_input=test_input)
+            with open(_get_input_filename(day, year, test_input), "rb") as fp:
+                digest = hashlib.file_digest(fp, "sha256").hexdigest()
+            stem = f"day{day}-test" if test_input else f"day{day}"
+            prefix = f"{stem}.{load.__module__}.{load.__qualname__}."
+            path = os.path.join(
+                get_inputs_folder(),
+                str(year),
+                CACHE_FOLDER,
+                f"{prefix}v{version}.{digest[:16]}.pickle",
+            )
+            try:
+                with open(path, "rb") as fp:
+                    return pickle.load(fp)
+            except (OSError, EOFError, pickle.UnpicklingError, AttributeError):
+                # missing, truncated, or pickled from classes that have changed
+                pass
+            data = load(test_input=test_input)
+            _store(path, prefix, data)
+            return data
+
+        return wrapper
+
+    return decorator
+
+
+def _store(path: str, prefix: str, data: Any) -> None:
+    """Atomically write `data` to `path`, dropping stale entries for `prefix`."""
+    directory, entry = os.path.split(path)
+    os.makedirs(directory, exist_ok=True)
+    for filename in os.listdir(directory):
+        if (
+            filename != entry
+            and filename.startswith(prefix)
+            and filename.endswith(".pickle")
+        ):
+            # another run storing the same day may have removed it already
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(os.path.join(directory, filename))
+    # parallel runs may race to fill the same entry; os.replace keeps it whole
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            pickle.dump(data, fp, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
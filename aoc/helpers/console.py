@@ -0,0 +1,16 @@
+"""Lazily imported console helpers.
+
+`rich` takes a noticeable amount of time to import, and most runs never print
+a rich-formatted value. This wrapper imports it on first use so that importing
+a solution module stays cheap.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+def print(*objects: Any, **kwargs: Any) -> None:
+    from rich import print as rich_print
+
+    rich_print(*objects, **kwargs)
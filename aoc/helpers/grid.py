@@ -1,10 +1,43 @@
+"""Two-dimensional grids of puzzle cells.
+
+A `Grid` keeps its cells in one of several storage backends (see `Grid`);
+`grid[i]` is a live `GridRow` view and every write goes through
+`Grid.__setitem__`, which keeps the grid's caches and journal up to date.
+"""
+
 from __future__ import annotations
 
-from typing import Callable, Generator, Literal, NamedTuple, TypeAlias, overload
+import copy
+import functools
+import hashlib
+import itertools
+from array import array
+from collections.abc import Container, Sequence
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Generator,
+    Hashable,
+    Iterable,
+    Iterator,
+    Literal,
+    NamedTuple,
+    Protocol,
+    Self,
+    TypeAlias,
+    cast,
+    overload,
+)
+
+from .input import get_input_text
 
-from .input import get_input_as_grid
+if TYPE_CHECKING:
+    import numpy as np
 
 Direction: TypeAlias = Literal["left", "right", "top", "bottom"]
+StorageKind: TypeAlias = Literal["lists", "flat", "bytes", "array", "numpy"]
+Passable: TypeAlias = Callable[[Any], bool] | Container[Any]
 
 
 class NotGiven:
@@ -14,6 +47,10 @@ class NotGiven:
 NOT_GIVEN: NotGiven = NotGiven()
 
 
+def _cell_text(value: object) -> str:
+    return "." if value is None else str(value)
+
+
 class Cell[T = str](NamedTuple):
     i: int
     j: int
@@ -59,57 +96,1061 @@ class Cell[T = str](NamedTuple):
         return "bottom" if neighbor.i > self.i else "top"
 
 
+class _ListStorage[T]:
+    """Rows kept as the caller's own lists."""
+
+    kind: StorageKind = "lists"
+    sentinel: Any = NOT_GIVEN
+    padded = False
+    origin = 0
+
+    def __init__(self, rows: list[list[T]]) -> None:
+        self.rows = rows
+        self.height = len(rows)
+        self.width = len(rows[0]) if rows else 0
+        self.stride = self.width
+        self.id_count = self.height * self.width
+        # rows still shared with a fork, copied before their first write
+        self.shared_rows: set[int] = set()
+
+    def index(self, i: int, j: int) -> int:
+        if i < 0:
+            i += self.height
+        if j < 0:
+            j += self.width
+        if not (0 <= i < self.height and 0 <= j < self.width):
+            raise IndexError(f"grid index {(i, j)} out of range")
+        return i * self.width + j
+
+    def get(self, i: int, j: int) -> T:
+        return self.rows[i][j]
+
+    def set(self, i: int, j: int, value: T) -> None:
+        if self.shared_rows:
+            self._own_row(i)
+        self.rows[i][j] = value
+
+    def _own_row(self, i: int) -> None:
+        if i < 0:
+            i += self.height
+        if i in self.shared_rows:
+            self.rows[i] = list(self.rows[i])
+            self.shared_rows.discard(i)
+
+    def fork(self) -> _ListStorage[T]:
+        forked = _ListStorage(list(self.rows))
+        self.shared_rows = set(range(self.height))
+        forked.shared_rows = set(range(self.height))
+        return forked
+
+    def get_flat(self, index: int) -> T:
+        i, j = divmod(index, self.width)
+        return self.rows[i][j]
+
+    def row(self, i: int) -> list[T]:
+        # a copy, like the flat backends: writes must go through `set`
+        return list(self.rows[i])
+
+    def iter_rows(self) -> Iterator[list[T]]:
+        return iter(self.rows)
+
+    def flat_values(self) -> Iterable[T]:
+        return itertools.chain.from_iterable(self.rows)
+
+    def cell_ids(self) -> Iterable[int]:
+        return range(self.id_count)
+
+    def find(self, value: T) -> tuple[int, int] | None:
+        for i, row in enumerate(self.rows):
+            if value in row:
+                return i, row.index(value)
+        return None
+
+    def count(self, value: T) -> int:
+        return sum(row.count(value) for row in self.rows)
+
+    def ids_of(self, value: T) -> array[int]:
+        ids = array("q")
+        for offset, row in zip(
+            range(0, self.height * self.width, self.width), self.rows
+        ):
+            ids.extend(offset + j for j in _indexes_of(row, value))
+        return ids
+
+    def ids_where(self, predicate: Callable[[T], bool]) -> array[int]:
+        return _ids_where(self.flat_values(), predicate)
+
+    def group_ids(self) -> dict[T, array[int]]:
+        return _group_ids(self.flat_values())
+
+
+class _FlatStorage[T]:
+    """Cells kept row-major in one flat sequence (a list or an array).
+
+    With a `sentinel`, `values` also holds a one-cell border of it around the
+    cells, and cell ids are positions in `values`, border included.
+    """
+
+    kind: StorageKind = "flat"
+    # whether `values` is still shared with a fork, copied before a write
+    shared = False
+
+    def __init__(
+        self, values: Any, height: int, width: int, sentinel: Any = NOT_GIVEN
+    ) -> None:
+        self.values = values
+        self.height = height
+        self.width = width
+        self.sentinel = sentinel
+        self.padded = sentinel is not NOT_GIVEN
+        self.stride = width + 2 if self.padded else width
+        # the id of (0, 0)
+        self.origin = self.stride + 1 if self.padded else 0
+        self.id_count = len(values)
+
+    def index(self, i: int, j: int) -> int:
+        """Flat index of `(i, j)`.
+
+        Negative indexes count from the end, except on padded storage, where
+        one step past any edge addresses the sentinel border instead.
+        """
+        if self.padded:
+            if -1 <= i <= self.height and -1 <= j <= self.width:
+                return self.origin + i * self.stride + j
+            raise IndexError(f"grid index {(i, j)} is past the sentinel border")
+        if i < 0:
+            i += self.height
+        if j < 0:
+            j += self.width
+        if not (0 <= i < self.height and 0 <= j < self.width):
+            raise IndexError(f"grid index {(i, j)} out of range")
+        return i * self.width + j
+
+    def writable_index(self, i: int, j: int) -> int:
+        if self.shared:
+            self.values = copy.copy(self.values)
+            self.shared = False
+        if 0 <= i < self.height and 0 <= j < self.width:
+            return self.origin + i * self.stride + j
+        if self.padded:
+            raise IndexError(f"grid index {(i, j)} is not inside the sentinel border")
+        return self.index(i, j)
+
+    def get(self, i: int, j: int) -> T:
+        if 0 <= i < self.height and 0 <= j < self.width:
+            return self.values[self.origin + i * self.stride + j]
+        return self.values[self.index(i, j)]
+
+    def fork(self) -> Self:
+        forked = copy.copy(self)
+        self.shared = forked.shared = True
+        return forked
+
+    def set(self, i: int, j: int, value: T) -> None:
+        # the index first: it may swap in a copy of a forked `values`
+        index = self.writable_index(i, j)
+        self.values[index] = value
+
+    def get_flat(self, index: int) -> T:
+        return self.values[index]
+
+    def row(self, i: int) -> list[T]:
+        start = self._row_start(i)
+        return list(self.values[start : start + self.width])
+
+    def _row_start(self, i: int) -> int:
+        if i < 0:
+            i += self.height
+        if not 0 <= i < self.height:
+            raise IndexError(f"grid row {i} out of range")
+        return self.origin + i * self.stride
+
+    def iter_rows(self) -> Iterator[list[T]]:
+        for i in range(self.height):
+            yield self.row(i)
+
+    def flat_values(self) -> Iterable[T]:
+        if self.padded:
+            return itertools.chain.from_iterable(self.iter_rows())
+        return self.values
+
+    def cell_ids(self) -> Iterable[int]:
+        """The ids of the cells, in row-major order, border excluded."""
+        if not self.padded:
+            return range(self.id_count)
+        return itertools.chain.from_iterable(
+            range(start, start + self.width)
+            for start in range(
+                self.origin, self.origin + self.height * self.stride, self.stride
+            )
+        )
+
+    def coords_of(self, cell_id: int) -> tuple[int, int]:
+        return divmod(cell_id - self.origin, self.stride)
+
+    def find(self, value: T) -> tuple[int, int] | None:
+        if self.padded:
+            ids = self.ids_of(value)
+            return self.coords_of(ids[0]) if ids else None
+        try:
+            index = self.values.index(value)
+        except (ValueError, TypeError):
+            return None
+        return divmod(index, self.width)
+
+    def count(self, value: T) -> int:
+        if self.padded:
+            return len(self.ids_of(value))
+        return self.values.count(value)
+
+    def ids_of(self, value: T) -> array[int]:
+        return self._inside(array("q", _indexes_of(self.values, value)))
+
+    def ids_where(self, predicate: Callable[[T], bool]) -> array[int]:
+        return self._inside(_ids_where(self.values, predicate))
+
+    def group_ids(self) -> dict[T, array[int]]:
+        return self._inside_groups(_group_ids(self.values))
+
+    def _inside(self, ids: array[int]) -> array[int]:
+        """`ids` without those of the sentinel border."""
+        if not self.padded:
+            return ids
+        height, width, stride = self.height, self.width, self.stride
+        return array(
+            "q",
+            (
+                cell_id
+                for cell_id in ids
+                if 0 < cell_id // stride <= height and 0 < cell_id % stride <= width
+            ),
+        )
+
+    def _inside_groups[K](self, groups: dict[K, array[int]]) -> dict[K, array[int]]:
+        if not self.padded:
+            return groups
+        inside = {value: self._inside(ids) for value, ids in groups.items()}
+        return {value: ids for value, ids in inside.items() if ids}
+
+
+class _ArrayStorage(_FlatStorage[int]):
+    kind: StorageKind = "array"
+
+
+class _ByteStorage(_FlatStorage[str]):
+    """Single-character strings kept as one Latin-1 byte each."""
+
+    kind: StorageKind = "bytes"
+
+    def get(self, i: int, j: int) -> str:
+        if 0 <= i < self.height and 0 <= j < self.width:
+            return chr(self.values[self.origin + i * self.stride + j])
+        return chr(self.values[self.index(i, j)])
+
+    def get_flat(self, index: int) -> str:
+        return chr(self.values[index])
+
+    def set(self, i: int, j: int, value: str) -> None:
+        # the index first: it may swap in a copy of a forked `values`
+        index = self.writable_index(i, j)
+        self.values[index] = ord(value)
+
+    def row(self, i: int) -> list[str]:
+        return list(self.row_bytes(i).decode("latin-1"))
+
+    def row_bytes(self, i: int) -> bytearray:
+        start = self._row_start(i)
+        return self.values[start : start + self.width]
+
+    def flat_values(self) -> Iterable[str]:
+        if self.padded:
+            return b"".join(map(self.row_bytes, range(self.height))).decode("latin-1")
+        return self.values.decode("latin-1")
+
+    def find(self, value: str) -> tuple[int, int] | None:
+        if not isinstance(value, str) or len(value) != 1 or ord(value) > 0xFF:
+            return None
+        if self.padded:
+            return super().find(value)
+        index = self.values.find(ord(value))
+        return None if index < 0 else divmod(index, self.width)
+
+    def count(self, value: str) -> int:
+        if not isinstance(value, str) or len(value) != 1 or ord(value) > 0xFF:
+            return 0
+        if self.padded:
+            return super().count(value)
+        return self.values.count(ord(value))
+
+    def ids_of(self, value: str) -> array[int]:
+        if not isinstance(value, str) or len(value) != 1 or ord(value) > 0xFF:
+            return array("q")
+        return self._inside(array("q", _byte_indexes(self.values, ord(value))))
+
+    def ids_where(self, predicate: Callable[[str], bool]) -> array[int]:
+        # the predicate runs once per distinct byte, not once per cell
+        matching = [byte for byte in set(self.values) if predicate(chr(byte))]
+        table = bytearray(256)
+        for byte in matching:
+            table[byte] = 1
+        ids = array("q", _byte_indexes(self.values.translate(table), 1))
+        return self._inside(ids)
+
+    def group_ids(self) -> dict[str, array[int]]:
+        groups = self._inside_groups(_group_ids(self.values))
+        return {chr(byte): ids for byte, ids in groups.items()}
+
+
+class _NumpyStorage[T](_FlatStorage[T]):
+    """Cells kept in a flat NumPy array; reads give back Python scalars."""
+
+    kind: StorageKind = "numpy"
+
+    def get(self, i: int, j: int) -> T:
+        return self.values.item(self.index(i, j))
+
+    def get_flat(self, index: int) -> T:
+        return self.values.item(index)
+
+    def row(self, i: int) -> list[T]:
+        start = self._row_start(i)
+        return self.values[start : start + self.width].tolist()
+
+    def cells(self) -> np.ndarray:
+        """The cells as a 2-D view, without the sentinel border."""
+        if not self.padded:
+            return self.values.reshape(self.height, self.width)
+        rows = self.values.reshape(self.height + 2, self.stride)
+        return rows[1:-1, 1:-1]
+
+    def flat_values(self) -> Iterable[T]:
+        return self.cells().ravel().tolist()
+
+    def find(self, value: T) -> tuple[int, int] | None:
+        import numpy as np
+
+        if self.padded:
+            return super().find(value)
+        matches = np.flatnonzero(self.values == value)
+        return divmod(int(matches[0]), self.width) if len(matches) else None
+
+    def count(self, value: T) -> int:
+        return int((self.cells() == value).sum())
+
+    def ids_of(self, value: T) -> array[int]:
+        import numpy as np
+
+        return self._inside(_packed_ids(np.flatnonzero(self.values == value)))
+
+    def ids_where(self, predicate: Callable[[T], bool]) -> array[int]:
+        import numpy as np
+
+        # the predicate runs once per distinct value, not once per cell
+        matching = [
+            value for value in np.unique(self.values).tolist() if predicate(value)
+        ]
+        ids = _packed_ids(np.flatnonzero(np.isin(self.values, matching)))
+        return self._inside(ids)
+
+    def group_ids(self) -> dict[T, array[int]]:
+        import numpy as np
+
+        order = np.argsort(self.values, kind="stable")
+        values, starts = np.unique(self.values[order], return_index=True)
+        groups = np.split(order, starts[1:])
+        return self._inside_groups(
+            {value: _packed_ids(ids) for value, ids in zip(values.tolist(), groups)}
+        )
+
+
+def _indexes_of(values: Sequence[Any], value: Any) -> Iterator[int]:
+    """Every index of `value` in a list or array, each found by a C-level scan."""
+    index = -1
+    while True:
+        try:
+            index = values.index(value, index + 1)
+        except (ValueError, TypeError):
+            return
+        yield index
+
+
+def _byte_indexes(values: bytes | bytearray, byte: int) -> Iterator[int]:
+    index = values.find(byte)
+    while index >= 0:
+        yield index
+        index = values.find(byte, index + 1)
+
+
+def _ids_where(values: Iterable[Any], predicate: Callable[[Any], bool]) -> array[int]:
+    return array("q", itertools.compress(itertools.count(), map(predicate, values)))
+
+
+def _group_ids(values: Iterable[Any]) -> dict[Any, array[int]]:
+    groups: dict[Any, array[int]] = {}
+    for cell_id, value in enumerate(values):
+        ids = groups.get(value)
+        if ids is None:
+            ids = groups[value] = array("q")
+        ids.append(cell_id)
+    return groups
+
+
+def _packed_ids(ids: np.ndarray) -> array[int]:
+    return array("q", ids.astype("int64").tobytes())
+
+
+_Storage: TypeAlias = (
+    _ListStorage[Any] | _FlatStorage[Any] | _ByteStorage | _NumpyStorage[Any]
+)
+
+
+class _GridStorage[T](Protocol):
+    """What a `Grid[T]` needs from its storage, whichever backend it is."""
+
+    kind: StorageKind
+    sentinel: Any
+    padded: bool
+    height: int
+    width: int
+    stride: int
+    origin: int
+    id_count: int
+
+    def index(self, i: int, j: int) -> int: ...
+    def get(self, i: int, j: int) -> T: ...
+    def set(self, i: int, j: int, value: T) -> None: ...
+    def get_flat(self, index: int) -> T: ...
+    def fork(self) -> _GridStorage[T]: ...
+    def row(self, i: int) -> list[T]: ...
+    def iter_rows(self) -> Iterator[list[T]]: ...
+    def flat_values(self) -> Iterable[T]: ...
+    def cell_ids(self) -> Iterable[int]: ...
+    def find(self, value: T) -> tuple[int, int] | None: ...
+    def count(self, value: T) -> int: ...
+    def ids_of(self, value: T) -> array[int]: ...
+    def ids_where(self, predicate: Callable[[T], bool]) -> array[int]: ...
+    def group_ids(self) -> dict[T, array[int]]: ...
+
+
+def _make_storage(
+    kind: StorageKind,
+    values: list[Any],
+    height: int,
+    width: int,
+    sentinel: Any = NOT_GIVEN,
+) -> _Storage:
+    """Build flat storage of `kind` from row-major `values`."""
+    if len(values) != height * width:
+        raise ValueError(f"{len(values)} values can't fill a {height}x{width} grid")
+    if sentinel is not NOT_GIVEN:
+        values = _pad(values, height, width, sentinel)
+    match kind:
+        case "flat":
+            return _FlatStorage(values, height, width, sentinel)
+        case "bytes":
+            return _ByteStorage(bytearray(map(ord, values)), height, width, sentinel)
+        case "array":
+            return _ArrayStorage(array("q", values), height, width, sentinel)
+        case "numpy":
+            import numpy as np
+
+            return _NumpyStorage(np.array(values), height, width, sentinel)
+        case "lists":
+            raise ValueError("a sentinel border needs flat storage, not 'lists'")
+        case _:
+            raise ValueError(f"Unknown grid storage {kind!r}")
+
+
+def _pad(values: list[Any], height: int, width: int, sentinel: Any) -> list[Any]:
+    """Row-major `values` surrounded by a one-cell border of `sentinel`."""
+    padded = [sentinel] * (width + 2)
+    for i in range(height):
+        padded.append(sentinel)
+        padded += values[i * width : (i + 1) * width]
+        padded.append(sentinel)
+    padded += [sentinel] * (width + 2)
+    return padded
+
+
+def _rows_to_storage(
+    rows: list[list[Any]], kind: StorageKind, sentinel: Any = NOT_GIVEN
+) -> _Storage:
+    if kind == "lists" and sentinel is NOT_GIVEN:
+        return _ListStorage(rows)
+    height = len(rows)
+    width = len(rows[0]) if rows else 0
+    if any(len(row) != width for row in rows):
+        raise ValueError(f"{kind!r} storage needs rows of equal length")
+    values = list(itertools.chain.from_iterable(rows))
+    return _make_storage(kind, values, height, width, sentinel)
+
+
+class Adjacency(NamedTuple):
+    """Orthogonal adjacency between the passable cells of a grid, as CSR.
+
+    The passable neighbors of cell id `c` are
+    `targets[offsets[c] : offsets[c + 1]]`; impassable cells have none.
+    """
+
+    offsets: array[int]
+    targets: array[int]
+    # one 0/1 flag per cell id
+    passable: bytes
+
+    def neighbors(self, cell_id: int) -> array[int]:
+        return self.targets[self.offsets[cell_id] : self.offsets[cell_id + 1]]
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.targets)
+
+
+def _build_adjacency(
+    storage: _GridStorage[Any], predicate: Callable[[Any], bool]
+) -> Adjacency:
+    if storage.padded:
+        return _build_padded_adjacency(storage, predicate)
+    passable = bytes(map(predicate, storage.flat_values()))
+    offsets = array("q", [0])
+    targets = array("q")
+    width = storage.width
+    size = storage.id_count
+    for cell_id in range(size):
+        if passable[cell_id]:
+            j = cell_id % width
+            if cell_id >= width and passable[cell_id - width]:
+                targets.append(cell_id - width)
+            if j + 1 < width and passable[cell_id + 1]:
+                targets.append(cell_id + 1)
+            if cell_id + width < size and passable[cell_id + width]:
+                targets.append(cell_id + width)
+            if j and passable[cell_id - 1]:
+                targets.append(cell_id - 1)
+        offsets.append(len(targets))
+    return Adjacency(offsets, targets, passable)
+
+
+def _build_padded_adjacency(
+    storage: _GridStorage[Any], predicate: Callable[[Any], bool]
+) -> Adjacency:
+    # the border is never passable, so no step from a passable cell needs a
+    # bounds check
+    stride = storage.stride
+    passable = bytearray(storage.id_count)
+    for i, row in enumerate(storage.iter_rows()):
+        start = storage.origin + i * stride
+        passable[start : start + storage.width] = bytes(map(predicate, row))
+    offsets = array("q", [0])
+    targets = array("q")
+    for cell_id in range(storage.id_count):
+        if passable[cell_id]:
+            if passable[cell_id - stride]:
+                targets.append(cell_id - stride)
+            if passable[cell_id + 1]:
+                targets.append(cell_id + 1)
+            if passable[cell_id + stride]:
+                targets.append(cell_id + stride)
+            if passable[cell_id - 1]:
+                targets.append(cell_id - 1)
+        offsets.append(len(targets))
+    return Adjacency(offsets, targets, bytes(passable))
+
+
+def _spans(size: int, offset: int) -> tuple[slice, slice]:
+    """Target and source slices along one axis for a shift by `offset`.
+
+    `target[k] = source[k + offset]` wherever both ends are in `range(size)`.
+    """
+    target = slice(max(0, -offset), max(0, min(size, size - offset)))
+    source = slice(max(0, offset), max(0, min(size, size + offset)))
+    return target, source
+
+
+_MASK_64 = (1 << 64) - 1
+
+
+@functools.lru_cache(maxsize=1024)
+def _value_key(value: Hashable) -> int:
+    """A 64-bit key that is the same for any two equal values.
+
+    Strings are keyed by their text, since their `hash()` is salted per
+    process, and tuples by their items' keys. Anything else is keyed by its
+    `hash()`, which equal values share (`1`, `1.0` and `True` alike), and
+    which isn't salted for numbers or `None`.
+    """
+    if isinstance(value, str):
+        data = b"s" + value.encode("utf-8", "surrogatepass")
+    elif isinstance(value, tuple):
+        data = b"t" + b"".join(_value_key(item).to_bytes(8) for item in value)
+    else:
+        data = b"h" + hash(value).to_bytes(8, signed=True)
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest())
+
+
+def _zobrist_key(position: int, value: Hashable) -> int:
+    """The fingerprint key of `value` at row-major `position` (SplitMix64)."""
+    x = (position * 0x9E3779B97F4A7C15 + _value_key(value)) & _MASK_64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK_64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK_64
+    return x ^ (x >> 31)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _encode_byte(value: Any) -> int:
+    # matches no cell of a uint8 array unless it fits in a byte
+    if isinstance(value, str) and len(value) == 1:
+        return ord(value)
+    return -1
+
+
+class GridRow[T = str](Sequence[T]):
+    """A live view of one row of a `Grid`; writes go through the grid."""
+
+    __slots__ = ("_grid", "_i")
+
+    def __init__(self, grid: Grid[T], i: int) -> None:
+        self._grid = grid
+        self._i = i
+
+    def __len__(self) -> int:
+        return self._grid._storage.width
+
+    @overload
+    def __getitem__(self, j: int) -> T: ...
+
+    @overload
+    def __getitem__(self, j: slice) -> list[T]: ...
+
+    def __getitem__(self, j: int | slice) -> T | list[T]:
+        if isinstance(j, slice):
+            return self._grid._storage.row(self._i)[j]
+        return self._grid._storage.get(self._i, j)
+
+    def __setitem__(self, j: int, value: T) -> None:
+        self._grid[self._i, j] = value
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._grid._storage.row(self._i))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (GridRow, list, tuple)):
+            return list(self) == list(other)  # type: ignore[arg-type]
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"GridRow({list(self)!r})"
+
+
+class GridView[T = str]:
+    """A transposed, rotated and/or flipped view of a `Grid`.
+
+    View cell `(i, j)` is grid cell id `start + i * row_step + j * column_step`,
+    so every transformation only changes those numbers. Writes go through
+    `Grid.__setitem__`.
+    """
+
+    __slots__ = ("_grid", "start", "row_step", "column_step", "height", "width")
+
+    def __init__(
+        self,
+        grid: Grid[T],
+        start: int,
+        row_step: int,
+        column_step: int,
+        height: int,
+        width: int,
+    ) -> None:
+        self._grid = grid
+        self.start = start
+        self.row_step = row_step
+        self.column_step = column_step
+        self.height = height
+        self.width = width
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return (self.height, self.width)
+
+    def __len__(self) -> int:
+        return self.height
+
+    def cell_id(self, coords: tuple[int, int]) -> int:
+        """The grid cell id behind view cell `coords`."""
+        i, j = coords
+        if not (0 <= i < self.height and 0 <= j < self.width):
+            raise IndexError(f"grid view index {coords} out of range")
+        return self.start + i * self.row_step + j * self.column_step
+
+    def __getitem__(self, coords: tuple[int, int]) -> T:
+        return self._grid.value_at_id(self.cell_id(coords))
+
+    def __setitem__(self, coords: tuple[int, int], value: T) -> None:
+        self._grid[self._grid.coords_of(self.cell_id(coords))] = value
+
+    def __repr__(self) -> str:
+        return self.render()
+
+    def render(self) -> str:
+        return "".join([f"{line}\n" for line in self.render_rows()])
+
+    def render_rows(self) -> list[str]:
+        return ["".join(map(_cell_text, row)) for row in self.rows()]
+
+    def transposed(self) -> GridView[T]:
+        return GridView(
+            self._grid,
+            self.start,
+            self.column_step,
+            self.row_step,
+            self.width,
+            self.height,
+        )
+
+    def rotated(self, turns: int = 1) -> GridView[T]:
+        """The view turned clockwise by `turns` quarter turns."""
+        view = self
+        for _ in range(turns % 4):
+            # the first column, read from the bottom up, becomes the first row
+            view = GridView(
+                view._grid,
+                view.start + (view.height - 1) * view.row_step,
+                view.column_step,
+                -view.row_step,
+                view.width,
+                view.height,
+            )
+        return view
+
+    def flipped(self) -> GridView[T]:
+        """The view mirrored left to right."""
+        return GridView(
+            self._grid,
+            self.start + (self.width - 1) * self.column_step,
+            self.row_step,
+            -self.column_step,
+            self.height,
+            self.width,
+        )
+
+    def _line(self, start: int, step: int, length: int) -> list[T]:
+        storage = self._grid._storage
+        if isinstance(storage, _ByteStorage):
+            stop: int | None = start + length * step
+            if stop < 0:
+                # a stop of -1 would wrap around to the end of the buffer
+                stop = None
+            return list(storage.values[start:stop:step].decode("latin-1"))  # type: ignore
+        get_flat = storage.get_flat
+        return [get_flat(start + k * step) for k in range(length)]
+
+    def row(self, i: int) -> list[T]:
+        return self._line(self.cell_id((i, 0)), self.column_step, self.width)
+
+    def column(self, j: int) -> list[T]:
+        return self._line(self.cell_id((0, j)), self.row_step, self.height)
+
+    def rows(self) -> Iterator[list[T]]:
+        for i in range(self.height):
+            yield self.row(i)
+
+    def diagonals(self) -> Iterator[list[T]]:
+        """Every line of cells running down and to the right.
+
+        Starts with the bottom-left corner and ends with the top-right one.
+        """
+        height, width = self.height, self.width
+        step = self.row_step + self.column_step
+        for i in reversed(range(height)):
+            yield self._line(self.cell_id((i, 0)), step, min(height - i, width))
+        for j in range(1, width):
+            yield self._line(self.cell_id((0, j)), step, min(height, width - j))
+
+    def anti_diagonals(self) -> Iterator[list[T]]:
+        """Every line of cells running down and to the left.
+
+        Starts with the bottom-right corner and ends with the top-left one.
+        """
+        return self.flipped().diagonals()
+
+
 class Grid[T = str]:
     def __init__(
         self,
         grid: list[list[T]],
+        *,
+        storage: StorageKind = "lists",
+        sentinel: T | NotGiven = NOT_GIVEN,
     ) -> None:
-        self.__grid = grid
+        """Build a grid from its rows.
+
+        `storage` picks the backend: `"lists"` keeps the row lists, `"flat"`
+        one row-major list, `"bytes"` a `bytearray` of Latin-1 characters,
+        `"array"` 64-bit signed ints and `"numpy"` a NumPy array. A
+        `sentinel` (not with `"lists"`) surrounds the cells with a one-cell
+        border of that value: one step past any edge reads it, and negative
+        indexes no longer wrap around.
+        """
+        self._init_storage(_rows_to_storage(grid, storage, sentinel))
+
+    def _init_storage(self, storage: _Storage | _GridStorage[T]) -> None:
+        # the backends hold `Any` (or `str`, for bytes): this is where their
+        # values become the grid's `T`
+        self._storage = cast("_GridStorage[T]", storage)
+        # adjacency graphs by (predicate, passable values) key, see `adjacency`
+        self._adjacency: dict[Hashable, tuple[Callable[[Any], bool], Adjacency]] = {}
+        # cell ids by value, see `index_values`
+        self._value_index: dict[Any, set[int]] | None = None
+        # `(i, j, replaced value)` per write since the first snapshot, see
+        # `snapshot`
+        self._journal: list[tuple[int, int, Any]] | None = None
+        # see `fingerprint`; None until first asked for
+        self._fingerprint: int | None = None
+
+    @classmethod
+    def _from_storage(cls, storage: _Storage | _GridStorage[T]) -> Grid[T]:
+        grid = cls.__new__(cls)
+        grid._init_storage(storage)
+        return grid
+
+    def __getstate__(self) -> dict[str, Any]:
+        # derived caches are rebuilt on demand rather than pickled
+        return {"_storage": self._storage, "indexed": self.is_indexed}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self._init_storage(state["_storage"])
+        if state.get("indexed"):
+            self.index_values()
 
     @classmethod
-    def from_string(cls, s: str) -> Grid[str]:
-        return cls(list(map(list, s.splitlines())))  # type: ignore
+    def from_string(
+        cls,
+        s: str,
+        *,
+        storage: StorageKind = "lists",
+        sentinel: str | NotGiven = NOT_GIVEN,
+    ) -> Grid[str]:
+        lines = s.splitlines()
+        if storage != "bytes":
+            return cls(list(map(list, lines)), storage=storage, sentinel=sentinel)  # type: ignore
+        width = len(lines[0]) if lines else 0
+        if any(len(line) != width for line in lines):
+            raise ValueError("'bytes' storage needs rows of equal length")
+        if isinstance(sentinel, str):
+            border = sentinel * (width + 2)
+            lines = [border, *(f"{sentinel}{line}{sentinel}" for line in lines), border]
+        values = bytearray("".join(lines), "latin-1")
+        height = len(lines) - 2 if isinstance(sentinel, str) else len(lines)
+        return cls._from_storage(_ByteStorage(values, height, width, sentinel))  # type: ignore
 
     @classmethod
     def full_of(
         cls,
         fill: T | Callable[[], T],
         size: int | tuple[int, int],
+        *,
+        storage: StorageKind = "lists",
+        sentinel: T | NotGiven = NOT_GIVEN,
     ) -> Grid[T]:
         if isinstance(size, int):
             size = (size, size)
         i, j = size
+        if storage == "lists" and sentinel is NOT_GIVEN:
+            if callable(fill):
+                return cls([[fill() for _ in range(j)] for _ in range(i)])  # type: ignore
+            return cls([[fill for _ in range(j)] for _ in range(i)])
         if callable(fill):
-            return cls([[fill() for _ in range(j)] for _ in range(i)])  # type: ignore
-        return cls([[fill for _ in range(j)] for _ in range(i)])
+            values = [fill() for _ in range(i * j)]  # type: ignore
+        else:
+            values = [fill] * (i * j)
+        return cls._from_storage(_make_storage(storage, values, i, j, sentinel))
+
+    @property
+    def storage(self) -> StorageKind:
+        return self._storage.kind
+
+    @property
+    def sentinel(self) -> T | NotGiven:
+        """The value bordering the grid, or `NOT_GIVEN` if it has no border."""
+        return self._storage.sentinel
 
     def __len__(self) -> int:
-        return len(self.__grid)
+        return self._storage.height
 
     def __repr__(self) -> str:
-        text = ""
-        for x in range(len(self)):
-            for y in range(len(self[x])):
-                value = self[x][y]
-                if value is None:
-                    value = "."
-                else:
-                    value = str(value)
-                text += value
-            text += "\n"
-        return text
+        return self.render()
+
+    def render(self) -> str:
+        """The grid as text, one line per row; `None` cells show as `.`."""
+        return "".join([f"{line}\n" for line in self.render_rows()])
+
+    def render_rows(self) -> list[str]:
+        storage = self._storage
+        if isinstance(storage, _ByteStorage):
+            text = storage.values.decode("latin-1")
+            width, stride = storage.width, storage.stride
+            if not stride:
+                return [""] * storage.height
+            starts = range(
+                storage.origin, storage.origin + storage.height * stride, stride
+            )
+            return [text[start : start + width] for start in starts]
+        return ["".join(map(_cell_text, row)) for row in storage.iter_rows()]
 
     @overload
-    def __getitem__(self, item: int) -> list[T]: ...
+    def __getitem__(self, item: int) -> GridRow[T]: ...
 
     @overload
-    def __getitem__(self, item: slice[int]) -> list[list[T]]: ...
+    def __getitem__(self, item: slice) -> list[list[T]]: ...
+
+    @overload
+    def __getitem__(self, item: tuple[int, int]) -> T: ...
+
+    def __getitem__(
+        self, item: int | slice | tuple[int, int]
+    ) -> GridRow[T] | list[list[T]] | T:
+        if isinstance(item, tuple):
+            return self._storage.get(*item)
+        if isinstance(item, slice):
+            return [self._storage.row(i) for i in range(*item.indices(len(self)))]
+        if item < 0:
+            item += len(self)
+        if not 0 <= item < len(self):
+            raise IndexError(f"grid row {item} out of range")
+        return GridRow(self, item)
+
+    def __setitem__(self, coords: tuple[int, int], value: T) -> None:
+        i, j = coords
+        if not (
+            self._adjacency
+            or self._value_index is not None
+            or self._journal is not None
+            or self._fingerprint is not None
+        ):
+            self._storage.set(i, j, value)
+            return
+        old = self._storage.get(i, j)
+        self._storage.set(i, j, value)
+        if self._journal is not None:
+            self._journal.append((i, j, old))
+        self._on_change(i, j, old, value)
+
+    def _on_change(self, i: int, j: int, old: T, new: T) -> None:
+        """Keep the grid's derived state in step with a write to `(i, j)`."""
+        cell_id = self._storage.index(i, j)
+        if self._adjacency:
+            self._invalidate_adjacency(old, new)
+        if self._value_index is not None:
+            self._reindex(cell_id, old, new)
+        if self._fingerprint is not None:
+            storage = self._storage
+            i, j = divmod(cell_id - storage.origin, storage.stride)
+            position = i * storage.width + j
+            self._fingerprint ^= _zobrist_key(position, old) ^ _zobrist_key(
+                position, new
+            )
+
+    def _reindex(self, cell_id: int, old: T, new: T) -> None:
+        assert self._value_index is not None
+        ids = self._value_index[old]
+        ids.discard(cell_id)
+        if not ids:
+            del self._value_index[old]
+        self._value_index.setdefault(new, set()).add(cell_id)
+
+    def _invalidate_adjacency(self, old: T, new: T) -> None:
+        stale = [
+            key
+            for key, (predicate, _) in self._adjacency.items()
+            if predicate(old) != predicate(new)
+        ]
+        for key in stale:
+            del self._adjacency[key]
+
+    def fingerprint(self) -> int:
+        """A 64-bit hash of the grid's shape and cell values.
+
+        Equal grids have equal fingerprints, whatever their storage. A grid
+        of strings, numbers or tuples of them gets the same fingerprint in
+        every run (see `_value_key`). The first call
+        hashes every cell (values must be hashable); from then on each write
+        updates it in constant time.
+        """
+        if self._fingerprint is None:
+            storage = self._storage
+            fingerprint = _value_key(("shape", storage.height, storage.width))
+            for position, value in enumerate(storage.flat_values()):
+                fingerprint ^= _zobrist_key(position, value)
+            self._fingerprint = fingerprint
+        return self._fingerprint
+
+    def __hash__(self) -> int:
+        # changes with the grid: don't mutate a grid used as a key
+        return self.fingerprint()
+
+    def __eq__(self, other: object) -> bool:
+        """Whether `other` has the same shape and `==` cells.
+
+        Equal values of different types match: a grid of `1`s equals one of
+        `1.0`s, and the two hash alike.
+        """
+        if not isinstance(other, Grid):
+            return NotImplemented
+        if self is other:
+            return True
+        return (
+            self.size == other.size
+            and self.fingerprint() == other.fingerprint()
+            and list(self._storage.flat_values()) == list(other._storage.flat_values())
+        )
+
+    def fork(self) -> Grid[T]:
+        """An independent copy of the grid, sharing its cells until a write.
 
-    def __getitem__(self, item: int | slice[int]) -> list[T] | list[list[T]]:
-        return self.__grid[item]
+        Writes to either grid leave the other one alone: `"lists"` storage
+        copies a shared row on its first write, flat storage copies its
+        buffer on the first write. Cached adjacency graphs carry over; a
+        value index is copied, snapshots are not.
+        """
+        forked = type(self)._from_storage(self._storage.fork())
+        forked._adjacency = dict(self._adjacency)
+        forked._fingerprint = self._fingerprint
+        if self._value_index is not None:
+            forked._value_index = {
+                value: set(ids) for value, ids in self._value_index.items()
+            }
+        return forked
 
-    def __setitem__(self, item: int, thing: T) -> None:
-        self[item] = thing
+    def snapshot(self) -> int:
+        """Mark the grid's current state, for `rollback` to return to.
+
+        From the first snapshot on, every write also records the value it
+        replaced, until `commit`. Snapshots nest: rolling back to one also
+        undoes every snapshot taken after it.
+        """
+        if self._journal is None:
+            self._journal = []
+        return len(self._journal)
+
+    def rollback(self, snapshot: int) -> None:
+        """Undo every write made since `snapshot` was taken."""
+        journal = self._journal
+        if journal is None or not 0 <= snapshot <= len(journal):
+            raise ValueError(f"No snapshot {snapshot} to roll back to")
+        storage = self._storage
+        while len(journal) > snapshot:
+            i, j, old = journal.pop()
+            current = storage.get(i, j)
+            storage.set(i, j, old)
+            self._on_change(i, j, current, old)
+
+    def commit(self) -> None:
+        """Keep every write and stop recording them; drops all snapshots."""
+        self._journal = None
 
     @overload
     def at(self, coords: tuple[int, int], *, strict: Literal[True]) -> Cell[T]: ...
@@ -124,16 +1165,17 @@ class Grid[T = str]:
             if strict:
                 raise ValueError(f"Coords{coords} are out of bounds")
             return None
-        return Cell(i=coords[0], j=coords[1], value=self[coords[0]][coords[1]])
+        return Cell(i=coords[0], j=coords[1], value=self._storage.get(*coords))
 
     def is_off_grid(self, coords: tuple[int, int]) -> bool:
         x, y = coords
-        return len(self) == 0 or x < 0 or x >= len(self) or y < 0 or y >= len(self[0])
+        storage = self._storage
+        return not (0 <= x < storage.height and 0 <= y < storage.width)
 
     def traverse(self) -> Generator[Cell[T]]:
-        for i in range(len(self)):
-            for j in range(len(self[i])):
-                yield Cell(i, j, self[i][j])
+        for i, row in enumerate(self._storage.iter_rows()):
+            for j, value in enumerate(row):
+                yield Cell(i, j, value)
 
     @overload
     def first(self, item: T, strict: Literal[True]) -> Cell[T]: ...
@@ -141,9 +1183,13 @@ class Grid[T = str]:
     def first(self, item: T, strict: bool = False) -> Cell[T] | None: ...
 
     def first(self, item: T, strict: bool = False) -> Cell[T] | None:
-        for cell in self.traverse():
-            if cell.value == item:
-                return cell
+        if self._value_index is not None:
+            ids = self._value_index.get(item)
+            coords = self.coords_of(min(ids)) if ids else None
+        else:
+            coords = self._storage.find(item)
+        if coords is not None:
+            return Cell(*coords, self._storage.get(*coords))
         if strict:
             raise ValueError(f"item {item!r} not in grid {self}")
 
@@ -152,15 +1198,16 @@ class Grid[T = str]:
         coords: tuple[int, int],
     ) -> list[Cell[T]]:
         i, j = coords
+        storage = self._storage
         return [
-            Cell(i=x, j=y, value=self[x][y])
+            Cell(i=x, j=y, value=storage.get(x, y))
             for (x, y) in [
                 (i - 1, j - 1),  # top-left diagonal
                 (i - 1, j + 1),  # top-right diagonal
                 (i + 1, j - 1),  # bottom-left diagonal
                 (i + 1, j + 1),  # bottom-right diagonal
             ]
-            if not self.is_off_grid((x, y))
+            if 0 <= x < storage.height and 0 <= y < storage.width
         ]
 
     def get_nondiagonal_neighbors(
@@ -168,55 +1215,312 @@ class Grid[T = str]:
         coords: tuple[int, int],
     ) -> list[Cell[T]]:
         i, j = coords
+        storage = self._storage
         return [
-            Cell(i=x, j=y, value=self[x][y])
+            Cell(i=x, j=y, value=storage.get(x, y))
             for (x, y) in [
                 (i - 1, j),  # left
                 (i + 1, j),  # right
                 (i, j + 1),  # top
                 (i, j - 1),  # bottom
             ]
-            if not self.is_off_grid((x, y))
+            if 0 <= x < storage.height and 0 <= y < storage.width
         ]
 
+    def index_values(self) -> Grid[T]:
+        """Keep an index from each value to its cells; returns the grid.
+
+        The index is maintained by every later write, which then costs two
+        set updates, and needs hashable values.
+        """
+        if self._value_index is None:
+            index: dict[Any, set[int]] = {}
+            storage = self._storage
+            for cell_id, value in zip(storage.cell_ids(), storage.flat_values()):
+                index.setdefault(value, set()).add(cell_id)
+            self._value_index = index
+        return self
+
+    @property
+    def is_indexed(self) -> bool:
+        return self._value_index is not None
+
+    def count(self, item: T) -> int:
+        if self._value_index is not None:
+            return len(self._value_index.get(item, ()))
+        return self._storage.count(item)
+
+    def positions(self, item: T) -> list[tuple[int, int]]:
+        """Coordinates of every cell holding `item`, in row-major order."""
+        return list(map(self.coords_of, self.positions_where(item)))
+
+    def positions_where(self, item: T | Callable[[T], bool]) -> array[int]:
+        """Ids of the cells holding `item`, or whose value `item(value)` accepts.
+
+        The ids come packed in an `array` of 64-bit ints, in row-major order
+        (see `cell_id`; `coords_of` turns one back into coordinates), so no
+        per-cell tuple or `Cell` is built. Plain values are found with C-level
+        scans, and a predicate runs once per distinct value on `"bytes"` and
+        `"numpy"` storage.
+        """
+        if self._value_index is not None:
+            if callable(item):
+                groups = [
+                    ids for value, ids in self._value_index.items() if item(value)
+                ]
+                return array("q", sorted(itertools.chain.from_iterable(groups)))
+            return array("q", sorted(self._value_index.get(item, ())))
+        if callable(item):
+            return self._storage.ids_where(cast("Callable[[T], bool]", item))
+        return self._storage.ids_of(item)
+
+    def group_positions_by_value(self) -> dict[T, array[int]]:
+        """The ids of the cells holding each value, as for `positions_where`."""
+        if self._value_index is not None:
+            return {
+                value: array("q", sorted(ids))
+                for value, ids in self._value_index.items()
+            }
+        return self._storage.group_ids()
+
+    def cell_id(self, coords: tuple[int, int]) -> int:
+        """The flat id of the cell at `coords`: `i * width + j`.
+
+        On a grid with a sentinel border, ids count the border cells too:
+        the id of `(i, j)` is `(i + 1) * (width + 2) + j + 1`.
+        """
+        storage = self._storage
+        return storage.origin + coords[0] * storage.stride + coords[1]
+
+    def coords_of(self, cell_id: int) -> tuple[int, int]:
+        storage = self._storage
+        return divmod(cell_id - storage.origin, storage.stride)
+
+    def value_at_id(self, cell_id: int) -> T:
+        return self._storage.get_flat(cell_id)
+
+    @property
+    def id_count(self) -> int:
+        """One more than the largest cell id, border cells included."""
+        return self._storage.id_count
+
+    @property
+    def neighbor_offsets(self) -> tuple[int, int, int, int]:
+        """Id offsets to the top, right, bottom and left neighbors."""
+        stride = self._storage.stride
+        return (-stride, 1, stride, -1)
+
+    def neighbor_ids(self, cell_id: int) -> Iterator[int]:
+        """Ids of the orthogonal neighbors of `cell_id` that are on the grid."""
+        storage = self._storage
+        stride = storage.stride
+        offset = cell_id - storage.origin
+        j = offset % stride
+        if offset >= stride:
+            yield cell_id - stride
+        if j + 1 < storage.width:
+            yield cell_id + 1
+        if offset + stride < storage.height * stride:
+            yield cell_id + stride
+        if j:
+            yield cell_id - 1
+
+    def diagonal_ids(self, cell_id: int) -> Iterator[int]:
+        """Ids of the diagonal neighbors of `cell_id` that are on the grid."""
+        storage = self._storage
+        stride = storage.stride
+        offset = cell_id - storage.origin
+        j = offset % stride
+        has_left, has_right = j > 0, j + 1 < storage.width
+        if offset >= stride:
+            if has_left:
+                yield cell_id - stride - 1
+            if has_right:
+                yield cell_id - stride + 1
+        if offset + stride < storage.height * stride:
+            if has_left:
+                yield cell_id + stride - 1
+            if has_right:
+                yield cell_id + stride + 1
+
+    def adjacency(self, passable: Passable) -> Adjacency:
+        """The CSR graph of orthogonal moves between passable cells.
+
+        `passable` is either a predicate on cell values or a collection of
+        passable values (a string counts as a collection of characters). The
+        graph is cached on the grid, keyed by `passable`, and dropped as soon
+        as a write turns a cell passable or impassable for it; pass the same
+        predicate object each time to reuse it.
+        """
+        if callable(passable):
+            key: Hashable = passable
+            predicate = passable
+        else:
+            key = frozenset(passable)  # type: ignore[arg-type]
+            predicate = key.__contains__
+        cached = self._adjacency.get(key)
+        if cached is None:
+            adjacency = _build_adjacency(self._storage, predicate)
+            cached = self._adjacency[key] = (predicate, adjacency)
+        return cached[1]
+
+    def _numpy_cells(self) -> tuple[np.ndarray, Callable[[Any], Any]]:
+        """The cells as a 2-D array, and how to encode a value to match it."""
+        import numpy as np
+
+        storage = self._storage
+        shape = (storage.height, storage.width)
+        if isinstance(storage, _ByteStorage):
+            cells = np.frombuffer(storage.values, dtype=np.uint8)
+            if storage.padded:
+                cells = cells.reshape(storage.height + 2, storage.stride)[1:-1, 1:-1]
+            return cells.reshape(shape), _encode_byte
+        if isinstance(storage, _NumpyStorage):
+            return storage.cells(), _identity
+        return np.array(list(storage.flat_values())).reshape(shape), _identity
+
+    def to_numpy(self) -> np.ndarray:
+        """The cell values as a 2-D array (a copy, except for numpy storage)."""
+        cells, encode = self._numpy_cells()
+        if encode is _encode_byte:
+            return cells.view("S1").astype("U1")
+        return cells
+
+    def mask(self, item: T) -> np.ndarray:
+        """Boolean array, true where the cell holds `item`."""
+        cells, encode = self._numpy_cells()
+        return cells == encode(item)
+
+    def mask_any(self, items: Iterable[T]) -> np.ndarray:
+        """Boolean array, true where the cell holds any of `items`."""
+        import numpy as np
+
+        cells, encode = self._numpy_cells()
+        return np.isin(cells, [encode(item) for item in items])
+
+    def shifted(self, di: int, dj: int, fill: Any = None) -> np.ndarray:
+        """`result[i, j]` is the value at `(i + di, j + dj)`, or `fill` off the grid."""
+        import numpy as np
+
+        values = self.to_numpy()
+        dtype = np.result_type(values, np.asarray(fill))
+        result = np.full(values.shape, fill, dtype=dtype)
+        (rows, source_rows), (columns, source_columns) = (
+            _spans(values.shape[0], di),
+            _spans(values.shape[1], dj),
+        )
+        result[rows, columns] = values[source_rows, source_columns]
+        return result
+
+    def equals_neighbor(self, di: int, dj: int, *, border: bool = False) -> np.ndarray:
+        """Boolean array, true where the cell equals the one at `(i + di, j + dj)`.
+
+        Cells whose neighbor would be off the grid get `border`.
+        """
+        import numpy as np
+
+        cells, _ = self._numpy_cells()
+        result = np.full(cells.shape, border, dtype=bool)
+        (rows, source_rows), (columns, source_columns) = (
+            _spans(cells.shape[0], di),
+            _spans(cells.shape[1], dj),
+        )
+        result[rows, columns] = (
+            cells[rows, columns] == cells[source_rows, source_columns]
+        )
+        return result
+
+    def same_neighbor_counts(self, *, diagonal: bool = False) -> np.ndarray:
+        """Per cell, how many of its orthogonal neighbors hold the same value.
+
+        With `diagonal`, all eight neighbors are counted.
+        """
+        import numpy as np
+
+        offsets = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+        if diagonal:
+            offsets += [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+        counts = np.zeros(self.size, dtype=np.int64)
+        for di, dj in offsets:
+            counts += self.equals_neighbor(di, dj)
+        return counts
+
+    def row_counts(self, item: T) -> np.ndarray:
+        """How many cells of each row hold `item`."""
+        return self.mask(item).sum(axis=1)
+
+    def column_counts(self, item: T) -> np.ndarray:
+        """How many cells of each column hold `item`."""
+        return self.mask(item).sum(axis=0)
+
     def print_with_accent_at_i_j(self, i: int, j: int) -> None:
         from rich import print
 
-        text = ""
-        for x in range(len(self)):
-            for y in range(len(self[x])):
-                value = self[x][y]
-                if x == i and y == j:
-                    value = f"[bold blue]{value}[/bold blue]"
-                elif value is None:
-                    value = "."
-                else:
-                    value = str(value)
-                text += value
-            text += "\n"
-        print(text)
+        lines = self.render_rows()
+        cells = list(map(_cell_text, self._storage.row(i)))
+        cells[j] = f"[bold blue]{self._storage.get(i, j)}[/bold blue]"
+        lines[i] = "".join(cells)
+        print("".join([f"{line}\n" for line in lines]))
 
     def print_with_accent_for_item(self, item: T) -> None:
         from rich import print
 
-        text = ""
-        for x in range(len(self)):
-            for y in range(len(self[x])):
-                value = self[x][y]
-                if value == item:
-                    value = f"[bold blue]{value}[/bold blue]"
-                elif value is None:
-                    value = "."
-                else:
-                    value = str(value)
-                text += value
-            text += "\n"
-        print(text)
+        def cell_text(value: T) -> str:
+            if value == item:
+                return f"[bold blue]{value}[/bold blue]"
+            return _cell_text(value)
+
+        print(
+            "".join(
+                [
+                    "".join(map(cell_text, row)) + "\n"
+                    for row in self._storage.iter_rows()
+                ]
+            )
+        )
 
     @classmethod
-    def for_day(cls, day: int, *, test_input: bool = False) -> Grid[str]:
-        return cls(get_input_as_grid(day, test_input=test_input))  # type: ignore
+    def for_day(
+        cls,
+        day: int,
+        *,
+        test_input: bool = False,
+        storage: StorageKind = "lists",
+        sentinel: str | NotGiven = NOT_GIVEN,
+    ) -> Grid[str]:
+        return cls.from_string(
+            get_input_text(day, test_input=test_input),
+            storage=storage,
+            sentinel=sentinel,
+        )
 
     @property
     def size(self) -> tuple[int, int]:
-        return (len(self), len(self[0]) if len(self) else 0)
+        return (self._storage.height, self._storage.width)
+
+    def view(self) -> GridView[T]:
+        """A `GridView` of the whole grid, as it is."""
+        storage = self._storage
+        return GridView(
+            self, storage.origin, storage.stride, 1, storage.height, storage.width
+        )
+
+    def transposed(self) -> GridView[T]:
+        """A view with rows and columns swapped, copying no cells."""
+        return self.view().transposed()
+
+    def rotated(self, turns: int = 1) -> GridView[T]:
+        """A view turned clockwise by `turns` quarter turns, copying no cells."""
+        return self.view().rotated(turns)
+
+    def flipped(self) -> GridView[T]:
+        """A view mirrored left to right, copying no cells."""
+        return self.view().flipped()
+
+    def diagonals(self) -> Iterator[list[T]]:
+        """The lines of cells running down and to the right (see `GridView`)."""
+        return self.view().diagonals()
+
+    def anti_diagonals(self) -> Iterator[list[T]]:
+        """The lines of cells running down and to the left (see `GridView`)."""
+        return self.view().anti_diagonals()
@@ -1,14 +1,44 @@
 from __future__ import annotations
 
+import contextlib
+import mmap
 import os
+from array import array
+from typing import Generator, Iterator
 
 INPUTS_FOLDER = "inputs"
+INPUTS_FOLDER_ENV_VAR = "AOC_INPUTS_FOLDER"
+READ_CHUNK_SIZE = 1 << 16
+
+
+def get_inputs_folder() -> str:
+    """The folder inputs are read from; `AOC_INPUTS_FOLDER` overrides it.
+
+    The override is an environment variable rather than a module global so
+    that it carries over to worker processes.
+    """
+    return os.environ.get(INPUTS_FOLDER_ENV_VAR, INPUTS_FOLDER)
+
+
+@contextlib.contextmanager
+def use_inputs_folder(folder: str) -> Generator[None]:
+    """Read inputs from `folder` (e.g. generated, scaled-up ones) for a while."""
+    previous = os.environ.get(INPUTS_FOLDER_ENV_VAR)
+    os.environ[INPUTS_FOLDER_ENV_VAR] = folder
+    try:
+        yield
+    finally:
+        if previous is None:
+            del os.environ[INPUTS_FOLDER_ENV_VAR]
+        else:
+            os.environ[INPUTS_FOLDER_ENV_VAR] = previous
 
 
 def _get_input_filename(day: int, year: int, test_input: bool = False) -> str:
+    folder = get_inputs_folder()
     if test_input:
-        return os.path.join(INPUTS_FOLDER, str(year), f"day{day}-test.txt")
-    return os.path.join(INPUTS_FOLDER, str(year), f"day{day}.txt")
+        return os.path.join(folder, str(year), f"day{day}-test.txt")
+    return os.path.join(folder, str(year), f"day{day}.txt")
 
 
 def get_input_text(day: int, year: int = 2024, test_input: bool = False) -> str:
@@ -16,8 +46,97 @@ def get_input_text(day: int, year: int = 2024, test_input: bool = False) -> str:
         return fp.read()
 
 
+def iter_input_lines(
+    day: int, year: int = 2024, test_input: bool = False
+) -> Generator[str]:
+    """Yield the input's lines one at a time, without their line endings.
+
+    The file is read incrementally, so memory use does not grow with its size.
+    """
+    with open(_get_input_filename(day, year, test_input), "r") as fp:
+        for line in fp:
+            yield line.rstrip("\n")
+
+
+def iter_input_blocks(
+    day: int, year: int = 2024, test_input: bool = False, sep: str = "\n\n"
+) -> Generator[str]:
+    """Yield the `sep`-separated blocks of the input one at a time.
+
+    The blocks are those `get_input_text(...).split(sep)` would give (without a
+    trailing empty block), but the file is read in fixed-size chunks, so only
+    the block being assembled is held in memory.
+    """
+    with open(_get_input_filename(day, year, test_input), "r") as fp:
+        pending = ""
+        while chunk := fp.read(READ_CHUNK_SIZE):
+            pending += chunk
+            *blocks, pending = pending.split(sep)
+            yield from blocks
+        if pending:
+            yield pending
+
+
 def get_input_as_grid(
     day: int, year: int = 2024, test_input: bool = False
 ) -> list[list[str]]:
     text = get_input_text(day, year, test_input)
     return [[char for char in line] for line in text.splitlines()]
+
+
+class InputBytes:
+    """Read-only, memory-mapped contents of an input file.
+
+    `data` is a `memoryview` over the mapped file, so slicing it (or indexing a
+    line) never decodes or copies the file. Line start offsets are indexed
+    lazily, the first time a line is asked for. Views handed out keep the
+    mapping alive on their own, so they stay valid after this object is gone.
+    """
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as fp:
+            if os.fstat(fp.fileno()).st_size:
+                self._buffer = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                # empty files cannot be mapped
+                self._buffer = b""
+        self.data = memoryview(self._buffer)
+        self._line_offsets: array[int] | None = None
+
+    @property
+    def line_offsets(self) -> array[int]:
+        """Start offset of every line, followed by one past the end of the last.
+
+        Line `i` is `data[line_offsets[i] : line_offsets[i + 1] - 1]`.
+        """
+        if self._line_offsets is None:
+            offsets = array("Q", [0])
+            newline = self._buffer.find(b"\n")
+            while newline != -1:
+                offsets.append(newline + 1)
+                newline = self._buffer.find(b"\n", newline + 1)
+            if offsets[-1] != len(self.data):
+                # the last line has no trailing newline
+                offsets.append(len(self.data) + 1)
+            self._line_offsets = offsets
+        return self._line_offsets
+
+    def __len__(self) -> int:
+        return len(self.line_offsets) - 1
+
+    def __getitem__(self, i: int) -> memoryview:
+        offsets = self.line_offsets
+        if i < 0:
+            i += len(offsets) - 1
+        if not 0 <= i < len(offsets) - 1:
+            raise IndexError(f"line {i} out of range")
+        return self.data[offsets[i] : offsets[i + 1] - 1]
+
+    def __iter__(self) -> Iterator[memoryview]:
+        offsets = self.line_offsets
+        for i in range(len(offsets) - 1):
+            yield self.data[offsets[i] : offsets[i + 1] - 1]
+
+
+def get_input_bytes(day: int, year: int = 2024, test_input: bool = False) -> InputBytes:
+    return InputBytes(_get_input_filename(day, year, test_input))
@@ -0,0 +1,238 @@
+"""Shortest-path searches over small integer states.
+
+A state is a non-negative integer below `state_count`: usually a `Grid` cell id
+(see `Grid.cell_id`), or, when the cost of a move depends on more than the cell
+(which way a reindeer faces, say), a `StateSpace`-encoded `(cell id,
+orientation)` pair. Distances and parents are kept in flat arrays indexed by
+state, so a search allocates no tuples, dicts or sets per visited state.
+
+Every search takes its start state(s) and a `neighbors` function: BFS's
+yields next states, the weighted searches yield `(next state, cost)` pairs with
+non-negative integer costs. A `goal` (a state, a collection of states or a
+predicate) stops the search as soon as one is settled; `SearchResult.goal`
+then says which, and `SearchResult.path` rebuilds the route to it. Without a
+goal the search runs until every reachable state is settled.
+"""
+
+from __future__ import annotations
+
+import heapq
+from array import array
+from collections import deque
+from collections.abc import Container
+from typing import Callable, Iterable, NamedTuple, TypeAlias
+
+from .grid import Grid, Passable
+
+UNREACHED = -1
+
+Goal: TypeAlias = int | Container[int] | Callable[[int], bool] | None
+Starts: TypeAlias = int | Iterable[int]
+
+
+class StateSpace(NamedTuple):
+    """Encodes `(cell id, orientation)` pairs as single integer states."""
+
+    cell_count: int
+    orientation_count: int = 1
+
+    @property
+    def size(self) -> int:
+        return self.cell_count * self.orientation_count
+
+    def encode(self, cell_id: int, orientation: int = 0) -> int:
+        return cell_id * self.orientation_count + orientation
+
+    def decode(self, state: int) -> tuple[int, int]:
+        return divmod(state, self.orientation_count)
+
+    def cell_states(self, cell_id: int) -> range:
+        """Every state of `cell_id`, one per orientation."""
+        first = cell_id * self.orientation_count
+        return range(first, first + self.orientation_count)
+
+
+class SearchResult(NamedTuple):
+    # UNREACHED for states the search never got to
+    distances: array[int]
+    # UNREACHED for the start states, and for states never reached
+    parents: array[int]
+    goal: int | None = None
+
+    def distance(self, state: int) -> int | None:
+        distance = self.distances[state]
+        return None if distance == UNREACHED else distance
+
+    def path(self, state: int | None = None) -> list[int]:
+        """The states from a start to `state` (by default, the goal reached)."""
+        if state is None:
+            if self.goal is None:
+                raise ValueError("The search reached no goal")
+            state = self.goal
+        if self.distances[state] == UNREACHED:
+            raise ValueError(f"State {state} was not reached")
+        path = [state]
+        while (state := self.parents[state]) != UNREACHED:
+            path.append(state)
+        return path[::-1]
+
+
+def _goal_predicate(goal: Goal) -> Callable[[int], bool] | None:
+    if goal is None or callable(goal):
+        return goal
+    if isinstance(goal, int):
+        return goal.__eq__
+    return goal.__contains__
+
+
+def _initial_arrays(
+    state_count: int, starts: Starts
+) -> tuple[array[int], array[int], list[int]]:
+    starts = [starts] if isinstance(starts, int) else list(starts)
+    distances = array("q", [UNREACHED]) * state_count
+    parents = array("q", [UNREACHED]) * state_count
+    for start in starts:
+        distances[start] = 0
+    return distances, parents, starts
+
+
+def bfs(
+    state_count: int,
+    starts: Starts,
+    neighbors: Callable[[int], Iterable[int]],
+    *,
+    goal: Goal = None,
+) -> SearchResult:
+    """Breadth-first search, for moves that all cost 1."""
+    distances, parents, starts = _initial_arrays(state_count, starts)
+    is_goal = _goal_predicate(goal)
+    queue = deque(starts)
+    while queue:
+        state = queue.popleft()
+        if is_goal is not None and is_goal(state):
+            return SearchResult(distances, parents, state)
+        next_distance = distances[state] + 1
+        for neighbor in neighbors(state):
+            if distances[neighbor] == UNREACHED:
+                distances[neighbor] = next_distance
+                parents[neighbor] = state
+                queue.append(neighbor)
+    return SearchResult(distances, parents)
+
+
+def zero_one_bfs(
+    state_count: int,
+    starts: Starts,
+    neighbors: Callable[[int], Iterable[tuple[int, int]]],
+    *,
+    goal: Goal = None,
+) -> SearchResult:
+    """Shortest paths for moves that cost either 0 or 1, using a deque."""
+    distances, parents, starts = _initial_arrays(state_count, starts)
+    is_goal = _goal_predicate(goal)
+    settled = bytearray(state_count)
+    queue = deque(starts)
+    while queue:
+        state = queue.popleft()
+        if settled[state]:
+            continue
+        settled[state] = 1
+        if is_goal is not None and is_goal(state):
+            return SearchResult(distances, parents, state)
+        distance = distances[state]
+        for neighbor, cost in neighbors(state):
+            new_distance = distance + cost
+            current = distances[neighbor]
+            if current == UNREACHED or new_distance < current:
+                distances[neighbor] = new_distance
+                parents[neighbor] = state
+                if cost:
+                    queue.append(neighbor)
+                else:
+                    queue.appendleft(neighbor)
+    return SearchResult(distances, parents)
+
+
+def dijkstra(
+    state_count: int,
+    starts: Starts,
+    neighbors: Callable[[int], Iterable[tuple[int, int]]],
+    *,
+    goal: Goal = None,
+) -> SearchResult:
+    """Shortest paths for moves with non-negative integer costs."""
+    return astar(state_count, starts, neighbors, None, goal=goal)
+
+
+def astar(
+    state_count: int,
+    starts: Starts,
+    neighbors: Callable[[int], Iterable[tuple[int, int]]],
+    heuristic: Callable[[int], int] | None,
+    *,
+    goal: Goal = None,
+) -> SearchResult:
+    """A* search; `heuristic` must never overestimate the distance left.
+
+    Without a heuristic this is Dijkstra's algorithm.
+    """
+    distances, parents, starts = _initial_arrays(state_count, starts)
+    is_goal = _goal_predicate(goal)
+    settled = bytearray(state_count)
+    heap = [
+        (heuristic(start) if heuristic is not None else 0, 0, start) for start in starts
+    ]
+    heapq.heapify(heap)
+    while heap:
+        _, distance, state = heapq.heappop(heap)
+        if settled[state]:
+            continue
+        settled[state] = 1
+        if is_goal is not None and is_goal(state):
+            return SearchResult(distances, parents, state)
+        for neighbor, cost in neighbors(state):
+            new_distance = distance + cost
+            current = distances[neighbor]
+            if current == UNREACHED or new_distance < current:
+                distances[neighbor] = new_distance
+                parents[neighbor] = state
+                estimate = new_distance
+                if heuristic is not None:
+                    estimate += heuristic(neighbor)
+                heapq.heappush(heap, (estimate, new_distance, neighbor))
+    return SearchResult(distances, parents)
+
+
+def manhattan_distance(grid: Grid, target: tuple[int, int]) -> Callable[[int], int]:
+    """A* heuristic: the Manhattan distance from a cell id to `target`."""
+    coords_of = grid.coords_of
+    target_i, target_j = target
+
+    def heuristic(cell_id: int) -> int:
+        i, j = coords_of(cell_id)
+        return abs(i - target_i) + abs(j - target_j)
+
+    return heuristic
+
+
+def grid_path(
+    grid: Grid,
+    start: tuple[int, int],
+    end: tuple[int, int],
+    passable: Passable,
+) -> list[tuple[int, int]] | None:
+    """The coordinates along a shortest orthogonal walk from `start` to `end`.
+
+    Only `passable` cells (as for `Grid.adjacency`) are walked through; the
+    start itself needs to be passable too. Returns None if `end` is out of
+    reach.
+    """
+    result = bfs(
+        grid.id_count,
+        grid.cell_id(start),
+        grid.adjacency(passable).neighbors,
+        goal=grid.cell_id(end),
+    )
+    if result.goal is None:
+        return None
+    return [grid.coords_of(cell_id) for cell_id in result.path()]
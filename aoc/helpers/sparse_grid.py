@@ -0,0 +1,232 @@
+"""Grids that only store the cells that stand out from a background value.
+
+A dense `Grid` holds every cell, which is wasteful when nearly all of them
+hold the same thing (a few antennas on an empty map, robots scattered over a
+large floor) and impossible when the space has no edges at all. A
+`SparseGrid` keeps a dict from coordinates to the cells that don't hold its
+`background` value; every other cell reads as the background. Writing the
+background to a cell removes it, so the grid never grows beyond its occupied
+cells.
+
+A sparse grid is either bounded, by a `size` like a dense grid's, or
+unbounded (`size=None`), in which case any coordinates, negative ones
+included, are on the grid. It answers the same coordinate-based queries as
+`Grid` (`at`, `is_off_grid`, `first`, `count`, `positions`, the neighbor
+helpers), but `traverse` only yields the occupied cells. There are no flat
+cell ids.
+"""
+
+from __future__ import annotations
+
+from typing import Generator, Iterable, Literal, Mapping, cast, overload
+
+from .grid import NOT_GIVEN, Cell, Grid, StorageKind, _cell_text
+
+
+class SparseGrid[T = str]:
+    def __init__(
+        self,
+        cells: Mapping[tuple[int, int], T] | Iterable[tuple[tuple[int, int], T]] = (),
+        *,
+        background: T = ".",  # type: ignore[assignment]
+        size: int | tuple[int, int] | None = None,
+    ) -> None:
+        self.background = background
+        self.size = (size, size) if isinstance(size, int) else size
+        self._cells: dict[tuple[int, int], T] = {}
+        items: Iterable[tuple[tuple[int, int], T]]
+        if isinstance(cells, Mapping):
+            items = cast("Mapping[tuple[int, int], T]", cells).items()
+        else:
+            items = cells
+        for coords, value in items:
+            self[coords] = value
+
+    @classmethod
+    def from_string(
+        cls, s: str, *, background: str = ".", bounded: bool = True
+    ) -> SparseGrid[str]:
+        """Parse a text map, storing only the characters other than `background`."""
+        lines = s.splitlines()
+        grid = SparseGrid[str](
+            background=background,
+            size=(len(lines), len(lines[0]) if lines else 0) if bounded else None,
+        )
+        for i, line in enumerate(lines):
+            for j, char in enumerate(line):
+                if char != background:
+                    grid._cells[i, j] = char
+        return grid
+
+    @classmethod
+    def from_grid(cls, grid: Grid[T], *, background: T) -> SparseGrid[T]:
+        sparse = SparseGrid[T](background=background, size=grid.size)
+        for i, j, value in grid.traverse():
+            if value != background:
+                sparse._cells[i, j] = value
+        return sparse
+
+    def to_grid(self, *, storage: StorageKind = "lists") -> Grid[T]:
+        """A dense copy; unbounded grids are cut to `bounds()`."""
+        if self.size is not None:
+            top, left = 0, 0
+            height, width = self.size
+        elif (bounds := self.bounds()) is not None:
+            top, left, bottom, right = bounds
+            height, width = bottom - top + 1, right - left + 1
+        else:
+            top = left = height = width = 0
+        dense = Grid[T].full_of(self.background, (height, width), storage=storage)
+        for (i, j), value in self._cells.items():
+            dense[i - top, j - left] = value
+        return dense
+
+    @property
+    def occupied_count(self) -> int:
+        """How many cells hold something other than the background."""
+        return len(self._cells)
+
+    def bounds(self) -> tuple[int, int, int, int] | None:
+        """`(top, left, bottom, right)` around the occupied cells, inclusive."""
+        if not self._cells:
+            return None
+        rows = [i for i, _ in self._cells]
+        columns = [j for _, j in self._cells]
+        return min(rows), min(columns), max(rows), max(columns)
+
+    def __getitem__(self, coords: tuple[int, int]) -> T:
+        value = self._cells.get(coords, NOT_GIVEN)
+        if value is not NOT_GIVEN:
+            return value  # type: ignore[return-value]
+        if self.size is not None and self.is_off_grid(coords):
+            raise IndexError(f"grid index {coords} out of range")
+        return self.background
+
+    def __setitem__(self, coords: tuple[int, int], value: T) -> None:
+        if self.size is not None:
+            i, j = coords
+            height, width = self.size
+            if not (0 <= i < height and 0 <= j < width):
+                raise IndexError(f"grid index {coords} out of range")
+        if value == self.background:
+            self._cells.pop(coords, None)
+        else:
+            self._cells[coords] = value
+
+    def __contains__(self, coords: tuple[int, int]) -> bool:
+        """Whether the cell at `coords` holds something other than the background."""
+        return coords in self._cells
+
+    def __repr__(self) -> str:
+        return self.render()
+
+    def render(self) -> str:
+        return "".join([f"{line}\n" for line in self.render_rows()])
+
+    def render_rows(self) -> list[str]:
+        """The grid's rows as text; unbounded grids are cut to `bounds()`."""
+        if self.size is not None:
+            top, left = 0, 0
+            bottom, right = self.size[0] - 1, self.size[1] - 1
+        elif (bounds := self.bounds()) is not None:
+            top, left, bottom, right = bounds
+        else:
+            return []
+        background = _cell_text(self.background)
+        cells = self._cells
+        return [
+            "".join(
+                [
+                    _cell_text(cells[i, j]) if (i, j) in cells else background
+                    for j in range(left, right + 1)
+                ]
+            )
+            for i in range(top, bottom + 1)
+        ]
+
+    @overload
+    def at(self, coords: tuple[int, int], *, strict: Literal[True]) -> Cell[T]: ...
+
+    @overload
+    def at(
+        self, coords: tuple[int, int], *, strict: bool = False
+    ) -> Cell[T] | None: ...
+
+    def at(self, coords: tuple[int, int], *, strict: bool = False) -> Cell[T] | None:
+        if self.is_off_grid(coords):
+            if strict:
+                raise ValueError(f"Coords{coords} are out of bounds")
+            return None
+        return Cell(coords[0], coords[1], self._cells.get(coords, self.background))
+
+    def is_off_grid(self, coords: tuple[int, int]) -> bool:
+        if self.size is None:
+            return False
+        i, j = coords
+        return not (0 <= i < self.size[0] and 0 <= j < self.size[1])
+
+    def traverse(self) -> Generator[Cell[T]]:
+        """The occupied cells, in row-major order."""
+        for (i, j), value in sorted(self._cells.items()):
+            yield Cell(i, j, value)
+
+    @overload
+    def first(self, item: T, strict: Literal[True]) -> Cell[T]: ...
+    @overload
+    def first(self, item: T, strict: bool = False) -> Cell[T] | None: ...
+
+    def first(self, item: T, strict: bool = False) -> Cell[T] | None:
+        """The first cell holding `item`, in row-major order."""
+        if item == self.background:
+            coords = next(self._background_positions(), None)
+        else:
+            matches = [coords for coords, value in self._cells.items() if value == item]
+            coords = min(matches, default=None)
+        if coords is not None:
+            return Cell(*coords, item)
+        if strict:
+            raise ValueError(f"item {item!r} not in grid")
+        return None
+
+    def count(self, item: T) -> int:
+        if item == self.background:
+            height, width = self._bounded_size()
+            return height * width - len(self._cells)
+        return sum(value == item for value in self._cells.values())
+
+    def positions(self, item: T) -> list[tuple[int, int]]:
+        """Coordinates of every cell holding `item`, in row-major order."""
+        if item == self.background:
+            return list(self._background_positions())
+        return sorted(coords for coords, value in self._cells.items() if value == item)
+
+    def _bounded_size(self) -> tuple[int, int]:
+        if self.size is None:
+            raise ValueError("an unbounded grid has endless background cells")
+        return self.size
+
+    def _background_positions(self) -> Generator[tuple[int, int]]:
+        height, width = self._bounded_size()
+        cells = self._cells
+        for i in range(height):
+            for j in range(width):
+                if (i, j) not in cells:
+                    yield (i, j)
+
+    def get_diagonals(self, coords: tuple[int, int]) -> list[Cell[T]]:
+        i, j = coords
+        return self._cells_at(
+            [(i - 1, j - 1), (i - 1, j + 1), (i + 1, j - 1), (i + 1, j + 1)]
+        )
+
+    def get_nondiagonal_neighbors(self, coords: tuple[int, int]) -> list[Cell[T]]:
+        i, j = coords
+        return self._cells_at([(i - 1, j), (i + 1, j), (i, j + 1), (i, j - 1)])
+
+    def _cells_at(self, coords: list[tuple[int, int]]) -> list[Cell[T]]:
+        cells, background = self._cells, self.background
+        return [
+            Cell(i, j, cells.get((i, j), background))
+            for i, j in coords
+            if not self.is_off_grid((i, j))
+        ]
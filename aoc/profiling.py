@@ -0,0 +1,210 @@
+"""Profile solutions without editing them.
+
+`PartProfiler` wraps one part's parse and solve steps. It records them with
+`cProfile`, for per-function stats, and at the same time samples the call
+stack on a CPU-time timer, for flamegraphs. cProfile only keeps caller/callee
+pairs, so full stacks have to come from sampling. The runner writes both next
+to each other:
+
+- `<dir>/<year>-day<DD>-part<P>.prof`: `pstats`-loadable stats (snakeviz,
+  `python -m pstats`, ...);
+- `<dir>/<year>-day<DD>-part<P>.collapsed`: one `frame;frame;... count` line
+  per sampled stack, the input format of `flamegraph.pl`, speedscope and
+  inferno.
+
+`MemoryTracer` does the same for memory: it traces allocations with
+`tracemalloc` and reports the peak and net bytes allocated while it was
+active, along with the source lines holding the most memory at the end.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import cProfile
+import os
+import pstats
+import signal
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from types import FrameType
+from typing import Any, Iterable, NamedTuple
+
+DEFAULT_PROFILE_DIR = "profiles"
+DEFAULT_TOP = 15
+DEFAULT_SAMPLE_INTERVAL = 0.001
+
+# allocations made by the tracing machinery itself, or by lazy imports
+_IGNORED_ALLOCATIONS = (
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, contextlib.__file__),
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+)
+
+
+def profile_paths(directory: str, year: int, day: int, part: int) -> tuple[str, str]:
+    """Where a part's `.prof` stats and `.collapsed` stacks are written."""
+    stem = os.path.join(directory, f"{year}-day{day:02d}-part{part}")
+    return f"{stem}.prof", f"{stem}.collapsed"
+
+
+def frame_label(frame: FrameType) -> str:
+    module = frame.f_globals.get("__name__", "?")
+    return f"{module}:{frame.f_code.co_qualname}"
+
+
+class PartProfiler:
+    """Collects cProfile stats and sampled stacks while it is active."""
+
+    def __init__(self, sample_interval: float = DEFAULT_SAMPLE_INTERVAL) -> None:
+        self.sample_interval = sample_interval
+        self.profile = cProfile.Profile()
+        self.stacks: Counter[tuple[str, ...]] = Counter()
+        self._root: FrameType | None = None
+        self._previous_handler: Any = None
+
+    @staticmethod
+    def can_sample() -> bool:
+        # CPU-time timers are POSIX-only, and signals only reach the main thread
+        return (
+            hasattr(signal, "setitimer")
+            and threading.current_thread() is threading.main_thread()
+        )
+
+    def __enter__(self) -> PartProfiler:
+        if self.can_sample():
+            # stacks are recorded up to (not including) the frame entering us
+            self._root = sys._getframe(1)
+            self._previous_handler = signal.signal(signal.SIGPROF, self._sample)
+            signal.setitimer(
+                signal.ITIMER_PROF, self.sample_interval, self.sample_interval
+            )
+        self.profile.enable()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.profile.disable()
+        if self._root is not None:
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, self._previous_handler)
+            self._root = None
+
+    def _sample(self, signum: int, frame: FrameType | None) -> None:
+        # keep the sampler itself out of the cProfile stats
+        self.profile.disable()
+        labels: list[str] = []
+        while frame is not None and frame is not self._root:
+            labels.append(frame_label(frame))
+            frame = frame.f_back
+        if labels:
+            self.stacks[tuple(reversed(labels))] += 1
+        self.profile.enable()
+
+    def write(self, stats_path: str, collapsed_path: str) -> None:
+        os.makedirs(os.path.dirname(stats_path) or ".", exist_ok=True)
+        self.profile.dump_stats(stats_path)
+        with open(collapsed_path, "w") as fp:
+            for stack, count in sorted(self.stacks.items()):
+                fp.write(f"{';'.join(stack)} {count}\n")
+
+
+class AllocationSite(NamedTuple):
+    filename: str
+    line: int
+    size_bytes: int
+    blocks: int
+
+
+class MemoryUsage(NamedTuple):
+    peak_bytes: int
+    # allocated while tracing and still alive when it stopped
+    net_bytes: int
+    top_sites: tuple[AllocationSite, ...] = ()
+
+
+class MemoryTracer:
+    """Traces allocations while it is active; the result is in `usage`.
+
+    `top_sites` lists the source lines owning the most of the net (still
+    allocated) memory. Memory that was allocated and freed again, however
+    large, only shows up in `peak_bytes`.
+    """
+
+    def __init__(self, top: int = DEFAULT_TOP) -> None:
+        self.top = top
+        self.usage: MemoryUsage | None = None
+
+    def __enter__(self) -> MemoryTracer:
+        if tracemalloc.is_tracing():
+            raise RuntimeError("tracemalloc is already tracing allocations")
+        tracemalloc.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        try:
+            net_bytes, peak_bytes = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot() if self.top > 0 else None
+        finally:
+            tracemalloc.stop()
+        top_sites: tuple[AllocationSite, ...] = ()
+        if snapshot is not None:
+            statistics = snapshot.filter_traces(_IGNORED_ALLOCATIONS).statistics(
+                "lineno"
+            )
+            top_sites = tuple(
+                AllocationSite(
+                    stat.traceback[0].filename,
+                    stat.traceback[0].lineno,
+                    stat.size,
+                    stat.count,
+                )
+                for stat in statistics[: self.top]
+            )
+        self.usage = MemoryUsage(peak_bytes, net_bytes, top_sites)
+
+
+def format_top_functions(stats_path: str, top: int = DEFAULT_TOP) -> str:
+    """The `top` functions with the most time spent in their own code."""
+    stats = pstats.Stats(stats_path)
+    rows = sorted(
+        stats.stats.items(),  # type: ignore[attr-defined]
+        key=lambda item: item[1][2],
+        reverse=True,
+    )[:top]
+    lines = [f"{'calls':>10} {'own time':>10} {'cumulative':>10}  function"]
+    for (filename, line, name), (_, calls, own_time, cumulative, _) in rows:
+        if filename == "~":
+            # built-ins have no source location
+            where = name
+        else:
+            where = f"{name} ({_short_path(filename)}:{line})"
+        lines.append(
+            f"{calls:>10} {own_time * 1e3:>8.1f}ms {cumulative * 1e3:>8.1f}ms  {where}"
+        )
+    return "\n".join(lines)
+
+
+def format_allocation_sites(sites: Iterable[AllocationSite]) -> str:
+    lines = [f"{'blocks':>10} {'size':>10}  line"]
+    for site in sites:
+        lines.append(
+            f"{site.blocks:>10} {format_bytes(site.size_bytes):>10}  "
+            f"{_short_path(site.filename)}:{site.line}"
+        )
+    return "\n".join(lines)
+
+
+def format_bytes(n: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(n) < 1024:
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} GiB"
+
+
+def _short_path(filename: str) -> str:
+    relative = os.path.relpath(filename)
+    return filename if relative.startswith("..") else relative
@@ -0,0 +1,138 @@
+"""Lazy registry of puzzle solutions.
+
+Solution modules are found on disk (`aoc/_<year>/day<N>.py` or a `day<N>/`
+package) without being imported. The registry hands out `LazySolver`
+callables that import their module the first time they are invoked, so
+listing solutions, or running a single day, never pays the import cost of
+every other day.
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+import os
+import pkgutil
+import re
+from typing import Any, Callable, Literal, NamedTuple, TypeAlias
+
+import aoc
+
+Part: TypeAlias = Literal[1, 2]
+
+PARTS: tuple[Part, ...] = (1, 2)
+YEAR_PACKAGE_PATTERN = re.compile(r"_(?P<year>\d{4})")
+DAY_MODULE_PATTERN = re.compile(r"day(?P<day>\d+)")
+
+
+class LazySolver:
+    """Stands in for `<module_name>.<attribute>` until it is first called."""
+
+    __slots__ = ("module_name", "attribute", "_target")
+
+    def __init__(self, module_name: str, attribute: str) -> None:
+        self.module_name = module_name
+        self.attribute = attribute
+        self._target: Callable[..., Any] | None = None
+
+    def __repr__(self) -> str:
+        return f"LazySolver({self.module_name}.{self.attribute})"
+
+    def __getstate__(self) -> tuple[str, str]:
+        return (self.module_name, self.attribute)
+
+    def __setstate__(self, state: tuple[str, str]) -> None:
+        self.module_name, self.attribute = state
+        self._target = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._target is not None
+
+    def resolve(self) -> Callable[..., Any]:
+        target = self._target
+        if target is None:
+            module = importlib.import_module(self.module_name)
+            target = getattr(module, self.attribute, None)
+            if not callable(target):
+                raise ValueError(
+                    f"No {self.attribute} function in solution module "
+                    f"{self.module_name}"
+                )
+            self._target = target
+        return target
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+
+class Solution(NamedTuple):
+    year: int
+    day: int
+    module_name: str
+
+    @property
+    def load(self) -> LazySolver:
+        return _get_lazy_solver(self.module_name, "load")
+
+    def part(self, part: Part) -> LazySolver:
+        if part not in PARTS:
+            raise ValueError(f"Unknown part {part!r}")
+        return _get_lazy_solver(self.module_name, f"part{part}")
+
+
+@functools.cache
+def _get_lazy_solver(module_name: str, attribute: str) -> LazySolver:
+    return LazySolver(module_name, attribute)
+
+
+@functools.cache
+def discover_years() -> tuple[int, ...]:
+    years: list[int] = []
+    for module_info in pkgutil.iter_modules(aoc.__path__):
+        match = YEAR_PACKAGE_PATTERN.fullmatch(module_info.name)
+        if match is not None and module_info.ispkg:
+            years.append(int(match.group("year")))
+    return tuple(sorted(years))
+
+
+@functools.cache
+def discover_days(year: int) -> dict[int, Solution]:
+    """Map each day number of `year` to its (not yet imported) solution."""
+    package_name = f"{aoc.__name__}._{year}"
+    package_path = os.path.join(os.path.dirname(aoc.__file__), f"_{year}")
+    if not os.path.isdir(package_path):
+        raise ValueError(f"No solutions for year {year}")
+    days: dict[int, Solution] = {}
+    for module_info in pkgutil.iter_modules([package_path]):
+        match = DAY_MODULE_PATTERN.fullmatch(module_info.name)
+        if match is not None:
+            day = int(match.group("day"))
+            days[day] = Solution(year, day, f"{package_name}.{module_info.name}")
+    return dict(sorted(days.items()))
+
+
+def get_solution(year: int, day: int) -> Solution:
+    days = discover_days(year)
+    if day not in days:
+        raise ValueError(f"No solution module for {year} day {day}")
+    return days[day]
+
+
+def get_loader(year: int, day: int) -> LazySolver:
+    return get_solution(year, day).load
+
+
+def get_solver(year: int, day: int, part: Part) -> LazySolver:
+    return get_solution(year, day).part(part)
+
+
+def solvers(year: int | None = None) -> dict[tuple[int, int, Part], LazySolver]:
+    """Every registered solver, keyed by `(year, day, part)`."""
+    years = discover_years() if year is None else (year,)
+    return {
+        (solution.year, solution.day, part): solution.part(part)
+        for y in years
+        for solution in discover_days(y).values()
+        for part in PARTS
+    }
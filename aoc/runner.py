@@ -0,0 +1,223 @@
+"""Run and time the daily puzzle solutions.
+
+Every `aoc._<year>.day<N>` module exposes a `load(test_input=False)` function
+that parses the puzzle input, and `part1`/`part2` functions that take the
+parsed data and solve the puzzle. Keeping parsing out of the solvers lets the
+runner time both phases separately.
+
+Solvers return their answer instead of printing it. A solver that has more to
+report than the answer itself returns an `Answer`, whose diagnostics the
+runner shows on request.
+
+With a profile directory, each part is run under `aoc.profiling.PartProfiler`
+and its stats and sampled stacks are written to that directory. With
+`trace_memory`, each part is run under `aoc.profiling.MemoryTracer` instead
+(or as well) and its memory usage is reported with its timings.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import contextlib
+import functools
+import os
+import time
+from typing import Any, Iterable, NamedTuple
+
+from aoc import generators, profiling, registry
+from aoc.helpers.answer import Answer
+from aoc.registry import PARTS, Part
+
+DEFAULT_YEAR = 2024
+
+
+class PartResult(NamedTuple):
+    year: int
+    day: int
+    part: Part
+    answer: Any
+    parse_seconds: float
+    solve_seconds: float
+    diagnostics: dict[str, Any] | None = None
+    profile_path: str | None = None
+    memory: profiling.MemoryUsage | None = None
+    # why the part could not run, in which case it has no answer or timings
+    error: str | None = None
+
+    @property
+    def total_seconds(self) -> float:
+        return self.parse_seconds + self.solve_seconds
+
+
+def run_part(
+    day: int,
+    part: Part,
+    *,
+    year: int = DEFAULT_YEAR,
+    test_input: bool = False,
+    quiet: bool = False,
+    profile_dir: str | None = None,
+    trace_memory: bool = False,
+    memory_top: int = profiling.DEFAULT_TOP,
+) -> PartResult:
+    """Solve one part, timing the parse and solve steps separately.
+
+    With `quiet`, anything the solution prints is discarded. With
+    `profile_dir`, both steps are profiled and the stats are written there;
+    the timings then include the profiler's overhead. With `trace_memory`,
+    the peak and net bytes allocated by both steps are recorded, along with
+    the `memory_top` lines holding the most memory once the part is solved
+    (its parsed input included); tracing also slows the timings down.
+
+    A missing input file doesn't raise: the part's result reports it as its
+    `error` instead, so one absent input doesn't stop the other days.
+    """
+    solution = registry.get_solution(year, day)
+    load = solution.load.resolve()
+    solver = solution.part(part).resolve()
+
+    with contextlib.ExitStack() as stack:
+        if quiet:
+            devnull = stack.enter_context(open(os.devnull, "w"))
+            stack.enter_context(contextlib.redirect_stdout(devnull))
+        tracer = None
+        if trace_memory:
+            tracer = stack.enter_context(profiling.MemoryTracer(memory_top))
+        profiler = profiling.PartProfiler() if profile_dir is not None else None
+        with profiler or contextlib.nullcontext():
+            start = time.perf_counter()
+            try:
+                data = load(test_input=test_input)
+            except FileNotFoundError as error:
+                return PartResult(
+                    year=year,
+                    day=day,
+                    part=part,
+                    answer=None,
+                    parse_seconds=0.0,
+                    solve_seconds=0.0,
+                    error=f"missing input {error.filename}",
+                )
+            parsed = time.perf_counter()
+            answer = solver(data)
+            solved = time.perf_counter()
+
+    profile_path = None
+    if profiler is not None:
+        assert profile_dir is not None
+        profile_path, collapsed_path = profiling.profile_paths(
+            profile_dir, year, day, part
+        )
+        profiler.write(profile_path, collapsed_path)
+
+    diagnostics = None
+    if isinstance(answer, Answer):
+        answer, diagnostics = answer
+
+    return PartResult(
+        year=year,
+        day=day,
+        part=part,
+        answer=answer,
+        parse_seconds=parsed - start,
+        solve_seconds=solved - parsed,
+        diagnostics=diagnostics,
+        profile_path=profile_path,
+        memory=tracer.usage if tracer is not None else None,
+    )
+
+
+def run(
+    days: Iterable[int] | None = None,
+    parts: Iterable[Part] = PARTS,
+    *,
+    year: int = DEFAULT_YEAR,
+    test_input: bool = False,
+    quiet: bool = False,
+    jobs: int = 1,
+    scale: int = 1,
+    profile_dir: str | None = None,
+    trace_memory: bool = False,
+    memory_top: int = profiling.DEFAULT_TOP,
+) -> list[PartResult]:
+    """Run every selected part, in `(day, part)` order.
+
+    With `jobs` greater than 1 the parts are solved in that many worker
+    processes (0 means one per CPU). Each part still loads its own input and
+    is timed inside its worker, and the results come back in the same order
+    as a sequential run.
+
+    A `scale` other than 1 runs against generated inputs that many times the
+    size of the real ones (see `aoc.generators`); by default it leaves out
+    the days that have no generator.
+
+    With `profile_dir`, every part is profiled, and with `trace_memory` every
+    part's memory usage is recorded (see `run_part`).
+    """
+    if scale != 1 and test_input:
+        raise ValueError("Scaled inputs replace the real inputs, not the examples")
+    if days is None:
+        days = registry.discover_days(year)
+        if scale != 1:
+            days = [day for day in days if day in generators.GENERATORS]
+    days = list(days)
+    selected: list[tuple[int, Part]] = [(day, part) for day in days for part in parts]
+    run_one = functools.partial(
+        run_part,
+        year=year,
+        test_input=test_input,
+        quiet=quiet,
+        profile_dir=profile_dir,
+        trace_memory=trace_memory,
+        memory_top=memory_top,
+    )
+    with contextlib.ExitStack() as stack:
+        if scale != 1:
+            stack.enter_context(generators.scaled_inputs(days, scale, year=year))
+        if jobs == 1 or len(selected) <= 1:
+            return [run_one(day, part) for day, part in selected]
+
+        max_workers = min(jobs or os.cpu_count() or 1, len(selected))
+        with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+            futures = [executor.submit(run_one, day, part) for day, part in selected]
+            return [future.result() for future in futures]
+
+
+def format_seconds(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.0f} µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.1f} ms"
+    return f"{seconds:.2f} s"
+
+
+def format_results(results: Iterable[PartResult], verbose: bool = False) -> str:
+    results = list(results)
+    with_memory = any(result.memory is not None for result in results)
+    memory_header = f" {'peak mem':>10} {'net mem':>10}" if with_memory else ""
+    lines = [
+        f"{'day':>4} {'part':>4} {'parse':>10} {'solve':>10}{memory_header}  answer"
+    ]
+    for result in results:
+        answer = "" if result.answer is None else str(result.answer)
+        if result.error is not None:
+            answer = f"error: {result.error}"
+        memory = ""
+        if result.memory is not None:
+            memory = (
+                f" {profiling.format_bytes(result.memory.peak_bytes):>10}"
+                f" {profiling.format_bytes(result.memory.net_bytes):>10}"
+            )
+        lines.append(
+            f"{result.day:>4} {result.part:>4} "
+            f"{format_seconds(result.parse_seconds):>10} "
+            f"{format_seconds(result.solve_seconds):>10}{memory}  {answer}"
+        )
+        if verbose and result.diagnostics:
+            for name, value in result.diagnostics.items():
+                text = str(value)
+                if "\n" in text:
+                    lines.extend([f"{'':>32}{name}:", text])
+                else:
+                    lines.append(f"{'':>32}{name}: {text}")
+    return "\n".join(lines)
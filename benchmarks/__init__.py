@@ -0,0 +1,6 @@
+"""Micro-benchmarks of the helpers, run as `python -m benchmarks.<name>`.
+
+Unlike `python -m aoc bench`, which times whole solutions against a stored
+baseline, these compare alternative implementations of one hot loop side by
+side on generated inputs (see `aoc.generators`).
+"""
@@ -0,0 +1,115 @@
+"""BFS over a maze: `Cell`-based neighbors against flat cell ids.
+
+    python -m benchmarks.grid_neighbors [-s SCALE] [-n REPEAT]
+
+Both searches flood-fill the open cells of a generated day 16 maze. The first
+walks `Grid.get_nondiagonal_neighbors` with a set of coordinate tuples, the way
+the day 16, 18 and 20 solutions do; the second walks `Grid.neighbor_ids` with a
+`bytearray` of seen flags. The third steps by `Grid.neighbor_offsets` on a grid
+with a `#` sentinel border, so it needs no bounds checks at all (not available
+for `"lists"` storage).
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from collections import deque
+from typing import Callable, Sequence
+
+from aoc import generators
+from aoc.helpers import Grid
+from aoc.helpers.grid import StorageKind
+from aoc.runner import format_seconds
+
+
+def bfs_cells(grid: Grid[str], start: tuple[int, int]) -> int:
+    seen = {start}
+    queue = deque([start])
+    while queue:
+        coords = queue.popleft()
+        for neighbor in grid.get_nondiagonal_neighbors(coords):
+            if neighbor.value != "#" and neighbor.coords not in seen:
+                seen.add(neighbor.coords)
+                queue.append(neighbor.coords)
+    return len(seen)
+
+
+def bfs_ids(grid: Grid[str], start: tuple[int, int]) -> int:
+    seen = bytearray(grid.id_count)
+    start_id = grid.cell_id(start)
+    seen[start_id] = 1
+    queue = deque([start_id])
+    value_at_id = grid.value_at_id
+    neighbor_ids = grid.neighbor_ids
+    count = 1
+    while queue:
+        for neighbor in neighbor_ids(queue.popleft()):
+            if not seen[neighbor] and value_at_id(neighbor) != "#":
+                seen[neighbor] = 1
+                queue.append(neighbor)
+                count += 1
+    return count
+
+
+def bfs_padded(grid: Grid[str], start: tuple[int, int]) -> int:
+    seen = bytearray(grid.id_count)
+    start_id = grid.cell_id(start)
+    seen[start_id] = 1
+    queue = deque([start_id])
+    value_at_id = grid.value_at_id
+    offsets = grid.neighbor_offsets
+    count = 1
+    while queue:
+        cell_id = queue.popleft()
+        for offset in offsets:
+            neighbor = cell_id + offset
+            # the sentinel border is a wall, so this stops at the edge too
+            if not seen[neighbor] and value_at_id(neighbor) != "#":
+                seen[neighbor] = 1
+                queue.append(neighbor)
+                count += 1
+    return count
+
+
+SEARCHES: dict[str, Callable[[Grid[str], tuple[int, int]], int]] = {
+    "cells": bfs_cells,
+    "ids": bfs_ids,
+    "padded": bfs_padded,
+}
+STORAGES: tuple[StorageKind, ...] = ("lists", "bytes")
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.grid_neighbors")
+    parser.add_argument("-s", "--scale", type=int, default=1)
+    parser.add_argument("-n", "--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    text = generators.generate(16, args.scale)
+    print(f"{'storage':>8} {'search':>8} {'best':>10} {'speedup':>8}")
+    for storage in STORAGES:
+        plain = Grid.from_string(text, storage=storage)
+        start = plain.first("S", strict=True).coords
+        reference = None
+        for name, search in SEARCHES.items():
+            grid = plain
+            if search is bfs_padded:
+                if storage == "lists":
+                    continue
+                grid = Grid.from_string(text, storage=storage, sentinel="#")
+            visited = search(grid, start)
+            best = min(
+                timeit.repeat(lambda: search(grid, start), number=1, repeat=args.repeat)
+            )
+            if reference is None:
+                reference = (visited, best)
+            assert visited == reference[0], f"{name} visited {visited} cells"
+            print(
+                f"{storage:>8} {name:>8} {format_seconds(best):>10} "
+                f"{reference[1] / best:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
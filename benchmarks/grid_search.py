@@ -0,0 +1,171 @@
+"""Grid searches: the per-day implementations against `aoc.helpers.search`.
+
+    python -m benchmarks.grid_search [-s SCALE] [-n REPEAT]
+
+The `legacy_*` functions are the searches days 16, 18 and 20 used before they
+moved to the shared search module, kept here as the reference point:
+
+- day 16: a FIFO label-correcting search over a grid of per-orientation score
+  dicts, against `search.dijkstra` over `(cell, orientation)` states;
+- day 18: a BFS over `Cell` neighbors with a set of coordinate tuples, against
+  the day's `BitGrid.distance`, which advances a whole BFS layer at a time;
+- day 20: a BFS that copies the whole path at every step, against
+  `search.grid_path`.
+
+Each pair runs on the same generated input and must agree on its result.
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from collections import deque
+from typing import Any, Callable, Sequence
+
+from aoc import generators
+from aoc._2024 import day16, day18, day20
+from aoc.helpers import BitGrid, Grid
+from aoc.runner import format_seconds
+
+ORIENTATION_STEPS = {
+    "north": (-1, 0),
+    "south": (1, 0),
+    "east": (0, 1),
+    "west": (0, -1),
+}
+
+
+def legacy_day16(maze: Grid[str]) -> int:
+    def pivot_score(current: str, target: str) -> int:
+        if current == target:
+            return 0
+        if current in ("east", "west"):
+            return 1_000 if target in ("north", "south") else 2_000
+        return 1_000 if target in ("east", "west") else 2_000
+
+    start = maze.first("S", strict=True)
+    scores = Grid[dict[str, int | None]].full_of(
+        fill=lambda: dict.fromkeys(ORIENTATION_STEPS), size=maze.size
+    )
+    scores[start.i, start.j]["east"] = 0
+    queue = deque([(start.coords, "east")])
+    while queue:
+        coords, orientation = queue.popleft()
+        score = scores[coords][orientation]
+        assert score is not None
+        for target, (di, dj) in ORIENTATION_STEPS.items():
+            destination = maze.at((coords[0] + di, coords[1] + dj))
+            if destination is None or destination.value not in (".", "E"):
+                continue
+            move_score = 1 + score + pivot_score(orientation, target)
+            current = scores[destination.coords][target]
+            if current is None or move_score < current:
+                scores[destination.coords][target] = move_score
+                queue.append((destination.coords, target))
+    end = maze.first("E", strict=True)
+    return min(v for v in scores[end.coords].values() if v is not None)
+
+
+def legacy_day18(
+    grid: Grid[str], start: tuple[int, int], end: tuple[int, int]
+) -> int | None:
+    queue = deque([(start[0], start[1], 0)])
+    seen = set[tuple[int, int]]()
+    while queue:
+        x, y, distance = queue.popleft()
+        if (x, y) == end:
+            return distance
+        for neighbor in grid.get_nondiagonal_neighbors((x, y)):
+            if neighbor.value == "." and neighbor.coords not in seen:
+                seen.add(neighbor.coords)
+                queue.append((neighbor.i, neighbor.j, distance + 1))
+    return None
+
+
+def legacy_day20(
+    grid: Grid[str], start: tuple[int, int], end: tuple[int, int]
+) -> list[tuple[int, int]]:
+    queue = deque([(start[0], start[1], [start])])
+    seen = set[tuple[int, int]]()
+    while queue:
+        i, j, path = queue.popleft()
+        if (i, j) == end:
+            return path
+        for neighbor in grid.get_nondiagonal_neighbors((i, j)):
+            if neighbor.value in (".", "E") and neighbor.coords not in seen:
+                seen.add(neighbor.coords)
+                queue.append((neighbor.i, neighbor.j, path + [neighbor.coords]))
+    raise ValueError(f"Cannot get from {start} to {end}")
+
+
+def day16_case(scale: int) -> dict[str, Callable[[], Any]]:
+    maze = Grid.from_string(generators.generate(16, scale), storage="bytes")
+    return {
+        "legacy": lambda: legacy_day16(maze),
+        "search": lambda: day16.part1(maze),
+    }
+
+
+def day18_case(scale: int) -> dict[str, Callable[[], Any]]:
+    header, *lines = generators.generate(18, scale).splitlines()
+    size = int(header.removeprefix("size="))
+    coords = [tuple(map(int, line.split(","))) for line in lines]
+    grid = Grid[str].full_of(".", size, storage="bytes")
+    corrupted = BitGrid(size)
+    # the share of the memory space part 1 fills on the real input
+    for x, y in coords[: 1_024 * size * size // 71**2]:
+        grid[y, x] = "#"
+        corrupted[y, x] = True
+    end = (size - 1, size - 1)
+    return {
+        "legacy": lambda: legacy_day18(grid, (0, 0), end),
+        "search": lambda: day18.find_shortest_path(corrupted, (0, 0), end),
+    }
+
+
+def day20_case(scale: int) -> dict[str, Callable[[], Any]]:
+    grid = Grid.from_string(generators.generate(20, scale), storage="bytes")
+    start = grid.first("S", strict=True).coords
+    end = grid.first("E", strict=True).coords
+
+    def with_fresh_adjacency() -> list[tuple[int, int]] | None:
+        # don't let the cached graph from the previous run flatter the timing
+        grid._adjacency.clear()
+        return day20.find_shortest_path(grid, start, end)
+
+    return {
+        "legacy": lambda: legacy_day20(grid, start, end),
+        "search": with_fresh_adjacency,
+    }
+
+
+CASES: dict[str, Callable[[int], dict[str, Callable[[], Any]]]] = {
+    "day16": day16_case,
+    "day18": day18_case,
+    "day20": day20_case,
+}
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.grid_search")
+    parser.add_argument("-s", "--scale", type=int, default=1)
+    parser.add_argument("-n", "--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(f"{'case':>6} {'search':>8} {'best':>10} {'speedup':>8}")
+    for case_name, make_case in CASES.items():
+        reference = None
+        for name, run in make_case(args.scale).items():
+            result = run()
+            best = min(timeit.repeat(run, number=1, repeat=args.repeat))
+            if reference is None:
+                reference = (result, best)
+            assert result == reference[0], f"{case_name} {name} disagrees"
+            print(
+                f"{case_name:>6} {name:>8} {format_seconds(best):>10} "
+                f"{reference[1] / best:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
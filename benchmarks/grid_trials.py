@@ -0,0 +1,122 @@
+"""Trial mutations: copying a grid per trial against `fork` and `rollback`.
+
+    python -m benchmarks.grid_trials [-s SCALE] [-n REPEAT] [-t TRIALS]
+
+Each trial puts an obstacle on an open cell of a generated day 6 map and
+walks the guard for a while, marking every cell she steps on, then throws
+the changes away. The trials differ only in how they get a grid to scribble
+on and back: a full copy of the grid (what day 6 did before it learnt to
+undo its single write), `Grid.fork`, which copies a row or a buffer only
+once written, and `Grid.snapshot`/`Grid.rollback`, which undo just the
+written cells. All three must mark the same cells and leave the map as it
+was.
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from typing import Callable, Sequence
+
+from aoc import generators
+from aoc.helpers import Grid
+from aoc.helpers.grid import StorageKind
+from aoc.runner import format_seconds
+
+STEPS = 200
+TURN_RIGHT = {(-1, 0): (0, 1), (0, 1): (1, 0), (1, 0): (0, -1), (0, -1): (-1, 0)}
+
+
+def walk(grid: Grid[str], start: tuple[int, int], obstacle: tuple[int, int]) -> int:
+    """Mark the guard's first `STEPS` steps; returns how many cells she marked."""
+    grid[obstacle] = "#"
+    (i, j), step = start, (-1, 0)
+    marked = 0
+    for _ in range(STEPS):
+        if grid[i, j] != "X":
+            grid[i, j] = "X"
+            marked += 1
+        ahead = (i + step[0], j + step[1])
+        if grid.is_off_grid(ahead):
+            break
+        if grid[ahead] == "#":
+            step = TURN_RIGHT[step]
+        else:
+            i, j = ahead
+    return marked
+
+
+def trials_copy(
+    grid: Grid[str], start: tuple[int, int], obstacles: list[tuple[int, int]]
+) -> int:
+    return sum(
+        walk(Grid([list(row) for row in grid], storage=grid.storage), start, obstacle)
+        for obstacle in obstacles
+    )
+
+
+def trials_fork(
+    grid: Grid[str], start: tuple[int, int], obstacles: list[tuple[int, int]]
+) -> int:
+    return sum(walk(grid.fork(), start, obstacle) for obstacle in obstacles)
+
+
+def trials_rollback(
+    grid: Grid[str], start: tuple[int, int], obstacles: list[tuple[int, int]]
+) -> int:
+    marked = 0
+    unchanged = grid.snapshot()
+    for obstacle in obstacles:
+        marked += walk(grid, start, obstacle)
+        grid.rollback(unchanged)
+    grid.commit()
+    return marked
+
+
+TRIALS: dict[
+    str, Callable[[Grid[str], tuple[int, int], list[tuple[int, int]]], int]
+] = {
+    "copy": trials_copy,
+    "fork": trials_fork,
+    "rollback": trials_rollback,
+}
+STORAGES: tuple[StorageKind, ...] = ("lists", "bytes")
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.grid_trials")
+    parser.add_argument("-s", "--scale", type=int, default=1)
+    parser.add_argument("-n", "--repeat", type=int, default=5)
+    parser.add_argument("-t", "--trials", type=int, default=1_000)
+    args = parser.parse_args(argv)
+
+    text = generators.generate(6, args.scale)
+    print(f"{'storage':>8} {'trial':>8} {'best':>10} {'speedup':>8}")
+    for storage in STORAGES:
+        grid = Grid.from_string(text, storage=storage)
+        start = grid.first("^", strict=True).coords
+        open_cells = grid.positions(".")
+        obstacles = open_cells[:: max(1, len(open_cells) // args.trials)]
+        original = grid.render()
+        reference = None
+        for name, trials in TRIALS.items():
+            marked = trials(grid, start, obstacles)
+            assert grid.render() == original, f"{name} changed the map"
+            best = min(
+                timeit.repeat(
+                    lambda: trials(grid, start, obstacles),
+                    number=1,
+                    repeat=args.repeat,
+                )
+            )
+            if reference is None:
+                reference = (marked, best)
+            assert marked == reference[0], f"{name} marked {marked} cells"
+            print(
+                f"{storage:>8} {name:>8} {format_seconds(best):>10} "
+                f"{reference[1] / best:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()